@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Adaptive Game Allocation for the Election Game Simulation Framework
+
+With a fixed `num_games` per experiment, most of the simulation budget goes
+to matchups whose outcome is obvious after a few dozen games. The allocator
+in this module hands out games in small batches to the experiments whose
+result is still uncertain: those where the Wilson confidence intervals of
+the leading player's and the runner-up's win rates overlap the most.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
+
+
+def wilson_interval(wins: int, games: int, z: float = 1.96) -> Tuple[float, float]:
+    """
+    Wilson score interval for a win rate.
+
+    Args:
+        wins: Number of wins
+        games: Number of games played
+        z: Normal quantile for the desired confidence (1.96 = 95%)
+
+    Returns:
+        Tuple of (lower bound, upper bound); (0, 1) if no games were played
+    """
+    if games == 0:
+        return 0.0, 1.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def leader_overlap(wins: Dict[str, int], players: List[str], games: int, z: float = 1.96) -> float:
+    """
+    How much the leader's and the runner-up's win-rate intervals overlap.
+
+    Args:
+        wins: Wins per player name
+        players: All player names in the experiment (players without wins count as 0)
+        games: Games played in the experiment
+        z: Normal quantile for the intervals
+
+    Returns:
+        float: Upper bound of the runner-up minus lower bound of the leader.
+        Positive values mean the ranking of the top two is still uncertain.
+    """
+    ranked = sorted(players, key=lambda name: wins.get(name, 0), reverse=True)
+    if len(ranked) < 2:
+        return 0.0
+    leader_low, _ = wilson_interval(wins.get(ranked[0], 0), games, z)
+    _, runner_up_high = wilson_interval(wins.get(ranked[1], 0), games, z)
+    return runner_up_high - leader_low
+
+
+class AdaptiveAllocator:
+    """
+    Uncertainty-sampling scheduler that spreads a global games budget across experiments.
+
+    Every experiment first receives `min_games`. After that, each batch goes
+    to the unresolved experiment with the largest leader/runner-up interval
+    overlap. An experiment is resolved once the intervals separate or it
+    reaches its own game cap. Allocation stops when the budget is spent or
+    every experiment is resolved.
+    """
+
+    def __init__(self,
+                 experiment_players: Dict[str, List[str]],
+                 total_games: int,
+                 batch_size: int = 20,
+                 min_games: int = 40,
+                 z: float = 1.96,
+                 max_games: Optional[Dict[str, int]] = None):
+        """
+        Initialize the allocator.
+
+        Args:
+            experiment_players: Player names for each experiment
+            total_games: Global budget of games across all experiments
+            batch_size: Games handed out per allocation step
+            min_games: Games every experiment receives before adaptive allocation
+            z: Normal quantile for the confidence intervals
+            max_games: Optional per-experiment cap on games
+        """
+        self.experiment_players = experiment_players
+        self.total_games = total_games
+        self.batch_size = batch_size
+        self.min_games = min_games
+        self.z = z
+        self.max_games = max_games or {}
+
+        self.games: Counter = Counter()
+        self.wins: Dict[str, Counter] = {name: Counter() for name in experiment_players}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], experiments: List[Dict[str, Any]]) -> 'AdaptiveAllocator':
+        """
+        Create an allocator from the `allocation` block of a simulation config.
+
+        Each experiment's `num_games` acts as its cap. The global budget
+        defaults to the sum of those caps.
+        """
+        experiment_players = {
+            experiment['name']: [player['name'] for player in experiment['players']]
+            for experiment in experiments
+        }
+        max_games = {experiment['name']: experiment['num_games'] for experiment in experiments}
+        return cls(
+            experiment_players,
+            total_games=config.get('total_games', sum(max_games.values())),
+            batch_size=config.get('batch_size', 20),
+            min_games=config.get('min_games', 40),
+            z=config.get('z', 1.96),
+            max_games=max_games
+        )
+
+    @property
+    def games_used(self) -> int:
+        return sum(self.games.values())
+
+    def record(self, experiment_name: str, winner_name: Optional[str]) -> None:
+        """Record the outcome of one finished game."""
+        self.games[experiment_name] += 1
+        if winner_name:
+            self.wins[experiment_name][winner_name] += 1
+
+    def _cap(self, experiment_name: str) -> int:
+        return self.max_games.get(experiment_name, self.total_games)
+
+    def overlap(self, experiment_name: str) -> float:
+        """Current leader/runner-up interval overlap for an experiment."""
+        return leader_overlap(self.wins[experiment_name], self.experiment_players[experiment_name],
+                              self.games[experiment_name], self.z)
+
+    def is_resolved(self, experiment_name: str) -> bool:
+        """True once an experiment's top two are separated or it hit its cap."""
+        if self.games[experiment_name] >= self._cap(experiment_name):
+            return True
+        return self.games[experiment_name] >= self.min_games and self.overlap(experiment_name) <= 0
+
+    def next_batch(self) -> Optional[Tuple[str, int]]:
+        """
+        Choose where the next games should go.
+
+        Returns:
+            Tuple of (experiment name, number of games), or None when the
+            budget is spent or every experiment is resolved
+        """
+        budget_left = self.total_games - self.games_used
+        if budget_left <= 0:
+            return None
+
+        # Warm-up: every experiment gets its minimum first, in order
+        for name in self.experiment_players:
+            warmup_left = min(self.min_games, self._cap(name)) - self.games[name]
+            if warmup_left > 0:
+                return name, min(warmup_left, budget_left)
+
+        candidates = [name for name in self.experiment_players if not self.is_resolved(name)]
+        if not candidates:
+            return None
+
+        # Most overlapping intervals first; ties go to the experiment with fewer games
+        name = max(candidates, key=lambda n: (self.overlap(n), -self.games[n]))
+        room = self._cap(name) - self.games[name]
+        return name, min(self.batch_size, budget_left, room)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Games, overlap and resolution status for every experiment."""
+        return {
+            name: {
+                'games': self.games[name],
+                'overlap': self.overlap(name),
+                'resolved': self.is_resolved(name)
+            }
+            for name in self.experiment_players
+        }
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Decision Latency Profiling and Budgets for Game Agents
+
+A slow persona blocks the server's event loop while it thinks and dominates
+the throughput of a simulation batch. ProfiledAgent wraps any Agent, times
+every decision into a latency histogram (fixed buckets for export, plus a
+quantile sketch for percentiles) and can enforce a per-decision time
+budget: the wrapped agent runs on a shared, bounded pool of worker
+threads, and if it has not answered when the budget runs out a cheap
+fallback action is played instead. Stats are reported per agent by the simulation harness and
+aggregated per persona type for the server.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from simulation_harness import Agent
+from quantile_sketch import KLLSketch
+from models.game_state import GameState
+from engine.actions import Action, ActionFundraise, ActionPassTurn
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Budgeted decisions of every ProfiledAgent run here, so the number of decision
+# threads stays fixed however many agents (and game sessions) there are
+BUDGET_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.environ.get("AGENT_BUDGET_WORKERS", 8)),
+                                     thread_name_prefix="agent-budget")
+
+
+def cheap_default_action(valid_actions: List[Action]) -> Action:
+    """
+    Fallback decision that needs no thought: Fundraise if offered, else pass.
+
+    Args:
+        valid_actions: List of valid actions (must not be empty)
+
+    Returns:
+        Action: One of the valid actions
+    """
+    for action in valid_actions:
+        if isinstance(action, ActionFundraise):
+            return action
+    for action in valid_actions:
+        if isinstance(action, ActionPassTurn):
+            return action
+    return valid_actions[0]
+
+
+class LatencyHistogram:
+    """
+    Decision latencies: bucket counts, totals and a quantile sketch.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.timeouts = 0
+        self.errors = 0
+        self.sketch = KLLSketch(k=100)
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        """Record one decision."""
+        index = 0
+        for bound in self.buckets:
+            if seconds <= bound:
+                break
+            index += 1
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if timed_out:
+            self.timeouts += 1
+        self.sketch.update(seconds)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add another histogram with the same buckets into this one."""
+        for i, count in enumerate(other.bucket_counts):
+            self.bucket_counts[i] += count
+        self.count += other.count
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.timeouts += other.timeouts
+        self.errors += other.errors
+        self.sketch.merge(other.sketch)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics, percentiles and bucket counts as plain data."""
+        quantiles = self.sketch.quantiles([0.5, 0.95, 0.99])
+        bounds = [str(bound) for bound in self.buckets] + ['+Inf']
+        return {
+            'calls': self.count,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.count if self.count else 0.0,
+            'max_seconds': self.max_seconds,
+            'p50_seconds': quantiles[0.5],
+            'p95_seconds': quantiles[0.95],
+            'p99_seconds': quantiles[0.99],
+            'buckets': dict(zip(bounds, self.bucket_counts))
+        }
+
+
+class LatencyRegistry:
+    """
+    Thread-safe latency histograms aggregated by label (e.g. persona type).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def observe(self, label: str, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            histogram = self._histograms.get(label)
+            if histogram is None:
+                histogram = self._histograms[label] = LatencyHistogram()
+            histogram.observe(seconds, timed_out)
+
+    def record_error(self, label: str) -> None:
+        with self._lock:
+            self._histograms.setdefault(label, LatencyHistogram()).errors += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Stats of every label."""
+        with self._lock:
+            return {label: histogram.to_dict() for label, histogram in self._histograms.items()}
+
+
+class ProfiledAgent(Agent):
+    """
+    Agent wrapper that measures decision latency and enforces a time budget.
+
+    Without a budget the wrapped agent is called directly and only timed.
+    With a budget it runs on a shared worker pool; when it misses the
+    deadline (time spent waiting for a free worker included) the fallback
+    action is played and the decision counts as a timeout. A call that
+    never started is cancelled. Python threads cannot be interrupted, so a
+    call that did start keeps running in the background, and until it
+    finishes further decisions of this agent go straight to the fallback
+    rather than occupying more workers.
+
+    Attributes of the wrapped agent (name, random, ...) are available on
+    the wrapper.
+    """
+
+    def __init__(self,
+                 agent: Agent,
+                 budget_seconds: Optional[float] = None,
+                 fallback: Callable[[List[Action]], Action] = cheap_default_action,
+                 registry: Optional[LatencyRegistry] = None,
+                 label: Optional[str] = None,
+                 executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            agent: The agent to profile
+            budget_seconds: Per-decision time budget (None only measures)
+            fallback: Chooses the action played when the budget is exceeded
+            registry: Optional shared registry that also receives every sample
+            label: Registry label (defaults to the agent's class name)
+            executor: Pool that runs budgeted decisions (defaults to BUDGET_EXECUTOR)
+        """
+        self.agent = agent
+        self.budget_seconds = budget_seconds
+        self.fallback = fallback
+        self.registry = registry
+        self.label = label or type(agent).__name__
+        self.histogram = LatencyHistogram()
+        self.executor = executor or BUDGET_EXECUTOR
+        self._late_call = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper does not define itself
+        if name == 'agent':
+            raise AttributeError(name)
+        return getattr(self.agent, name)
+
+    def choose_action(self, game_state: GameState, valid_actions: List[Action]) -> Action:
+        """
+        Choose an action with the wrapped agent, within the budget.
+
+        Args:
+            game_state: Current game state
+            valid_actions: List of valid actions to choose from
+
+        Returns:
+            Action: The wrapped agent's choice, or the fallback on timeout
+        """
+        started = time.perf_counter()
+        try:
+            action, timed_out = self._call(self.agent.choose_action, (game_state, valid_actions),
+                                           self.budget_seconds)
+        except Exception:
+            self._record_error()
+            raise
+        if timed_out and valid_actions:
+            action = self.fallback(valid_actions)
+        self._record(time.perf_counter() - started, timed_out)
+        return action
+
+    def choose_actions(self, batch: Sequence[Tuple[GameState, List[Action]]]) -> List[Action]:
+        """
+        Decide a batch one position at a time.
+
+        Every decision gets its own budget, fallback and latency sample, so
+        one slow position neither times out the rest of the batch nor
+        disappears into a batch mean.
+        """
+        return [self.choose_action(game_state, valid_actions) for game_state, valid_actions in batch]
+
+    def latency_stats(self) -> Dict[str, Any]:
+        """Latency histogram and counters since creation or the last reset_stats()."""
+        stats = self.histogram.to_dict()
+        stats['label'] = self.label
+        stats['budget_seconds'] = self.budget_seconds
+        return stats
+
+    def reset_stats(self) -> None:
+        """Clear this wrapper's histogram (the shared registry keeps its totals)."""
+        self.histogram = LatencyHistogram()
+
+    def _call(self, func: Callable, args: tuple, budget: Optional[float]) -> Tuple[Any, bool]:
+        """Run func(*args), returning (result, timed_out)."""
+        if budget is None:
+            return func(*args), False
+        if self._late_call is not None:
+            if not self._late_call.done():
+                return None, True
+            self._late_call = None
+        future = self.executor.submit(func, *args)
+        try:
+            return future.result(timeout=budget), False
+        except FuturesTimeout:
+            if not future.cancel():
+                self._late_call = future
+            return None, True
+
+    def _record(self, seconds: float, timed_out: bool) -> None:
+        self.histogram.observe(seconds, timed_out)
+        if self.registry is not None:
+            self.registry.observe(self.label, seconds, timed_out)
+
+    def _record_error(self) -> None:
+        self.histogram.errors += 1
+        if self.registry is not None:
+            self.registry.record_error(self.label)
+
+    def __str__(self) -> str:
+        return f"Profiled({self.agent})"
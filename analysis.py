@@ -10,12 +10,26 @@ human-readable reports that help answer key questions about the game.
 import json
 import csv
 import os
-import statistics
+import hashlib
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import defaultdict, Counter
 
+from quantile_sketch import SketchSet
+
+
+# Bump whenever the way metrics are derived from a result row changes, so
+# that stale analysis caches are discarded instead of silently reused.
+ANALYZER_VERSION = 4
+
+# Percentiles reported for every sketched metric
+QUANTILE_POINTS = {'p10': 0.1, 'p50': 0.5, 'p90': 0.9}
+
+# Suffix for the derived-metrics cache stored next to each results file.
+# It deliberately does not end in ".json" so the results glob never picks it up.
+CACHE_SUFFIX = ".analysis-cache"
+
 
 @dataclass
 class AnalysisMetrics:
@@ -28,6 +42,187 @@ class AnalysisMetrics:
     action_frequency: Dict[str, Dict[str, int]]  # persona -> action_type -> count
     economic_analysis: Dict[str, Dict[str, float]]  # persona -> metric -> value
     game_length_distribution: Dict[int, int]  # rounds -> count
+    quantiles: Dict[str, Dict[str, Dict[str, float]]] = field(default_factory=dict)  # persona -> metric -> {p10, p50, p90}
+
+
+class MetricsAccumulator:
+    """
+    Running aggregates from which AnalysisMetrics can be derived.
+
+    Every statistic in the report is a count, sum, minimum or maximum, so
+    results can be folded in one row at a time and the aggregates can be
+    persisted and extended later without revisiting earlier rows.
+    """
+
+    def __init__(self):
+        self.total_games = 0
+        self.winner_counts = Counter()
+        self.position_wins = defaultdict(Counter)  # position -> persona -> wins
+        self.position_games = Counter()  # position -> games
+        self.sum_rounds = 0
+        self.sum_terms = 0
+        self.game_length_distribution = Counter()  # rounds -> count
+        self.action_frequency = defaultdict(Counter)  # persona -> action -> count
+        self.economic = {}  # persona -> {'count', 'sum_pc', 'sum_influence', 'min_pc', 'max_pc'}
+        self.sketches = SketchSet()  # (persona, seat, metric) -> quantile sketch
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        """Fold a single simulation result into the aggregates."""
+        self.total_games += 1
+
+        winner_name = result.get('winner_name')
+        if winner_name:
+            self.winner_counts[winner_name] += 1
+            # Seat tracking is not recorded in results yet, so the winner
+            # is attributed to position 0 (first player)
+            self.position_wins[0][winner_name] += 1
+            self.position_games[0] += 1
+
+        rounds = result['game_length_rounds']
+        self.sum_rounds += rounds
+        self.sum_terms += result['game_length_terms']
+        self.game_length_distribution[rounds] += 1
+
+        # Every row carries a compact per-player summary; rows written before
+        # log sampling only have the players inside the full final state
+        players = result.get('players')
+        if players is None:
+            players = (result.get('final_state') or {}).get('players', [])
+
+        if any('actions' in player for player in players):
+            # Action counts are in every game's summary, not only in the sampled full logs
+            for player in players:
+                self.action_frequency[persona_label(player.get('name', ''))].update(player.get('actions', {}))
+        else:
+            # Older rows: parse log entries such as "Player 1 chose: ActionFundraise"
+            for log_entry in result.get('game_log', []):
+                if "chose:" in log_entry:
+                    parts = log_entry.split("chose:")
+                    if len(parts) == 2:
+                        persona_name = persona_label(parts[0].strip())
+                        self.action_frequency[persona_name][parts[1].strip()] += 1
+        self.sketches.add_game(
+            [persona_label(player.get('name', '')) for player in players], players, rounds
+        )
+        for player in players:
+            persona_name = persona_label(player.get('name', ''))
+            pc = player.get('pc', 0)
+            influence = player.get('influence', 0)
+
+            econ = self.economic.get(persona_name)
+            if econ is None:
+                econ = {'count': 0, 'sum_pc': 0, 'sum_influence': 0, 'min_pc': pc, 'max_pc': pc}
+                self.economic[persona_name] = econ
+            econ['count'] += 1
+            econ['sum_pc'] += pc
+            econ['sum_influence'] += influence
+            econ['min_pc'] = min(econ['min_pc'], pc)
+            econ['max_pc'] = max(econ['max_pc'], pc)
+
+    def to_metrics(self) -> AnalysisMetrics:
+        """Derive the report metrics from the current aggregates."""
+        total_games = self.total_games
+
+        win_rates = {name: wins / total_games for name, wins in self.winner_counts.items()}
+
+        win_rates_by_position = {}
+        for position, games in self.position_games.items():
+            win_rates_by_position[position] = {
+                name: wins / games for name, wins in self.position_wins[position].items()
+            }
+
+        economic_analysis = {}
+        for persona_name, econ in self.economic.items():
+            economic_analysis[persona_name] = {
+                'avg_final_pc': econ['sum_pc'] / econ['count'],
+                'avg_final_influence': econ['sum_influence'] / econ['count'],
+                'max_final_pc': econ['max_pc'],
+                'min_final_pc': econ['min_pc'],
+                'median_final_pc': self.sketches.select(persona_name, metric='final_pc').quantile(0.5)
+            }
+
+        quantiles = {}
+        for persona_name in self.sketches.personas():
+            quantiles[persona_name] = {}
+            for metric in SketchSet.PLAYER_METRICS:
+                sketch = self.sketches.select(persona_name, metric=metric)
+                quantiles[persona_name][metric] = {
+                    label: sketch.quantile(q) for label, q in QUANTILE_POINTS.items()
+                }
+
+        return AnalysisMetrics(
+            total_games=total_games,
+            win_rates=win_rates,
+            win_rates_by_position=win_rates_by_position,
+            avg_game_length_rounds=self.sum_rounds / total_games,
+            avg_game_length_terms=self.sum_terms / total_games,
+            action_frequency={name: dict(actions) for name, actions in self.action_frequency.items()},
+            economic_analysis=economic_analysis,
+            game_length_distribution=dict(self.game_length_distribution),
+            quantiles=quantiles
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the aggregates to a JSON-compatible dictionary."""
+        return {
+            'total_games': self.total_games,
+            'winner_counts': dict(self.winner_counts),
+            'position_wins': {str(pos): dict(wins) for pos, wins in self.position_wins.items()},
+            'position_games': {str(pos): games for pos, games in self.position_games.items()},
+            'sum_rounds': self.sum_rounds,
+            'sum_terms': self.sum_terms,
+            'game_length_distribution': {str(r): c for r, c in self.game_length_distribution.items()},
+            'action_frequency': {name: dict(actions) for name, actions in self.action_frequency.items()},
+            'economic': self.economic,
+            'sketches': self.sketches.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MetricsAccumulator':
+        """Rebuild aggregates previously produced by to_dict()."""
+        acc = cls()
+        acc.total_games = data['total_games']
+        acc.winner_counts = Counter(data['winner_counts'])
+        for pos, wins in data['position_wins'].items():
+            acc.position_wins[int(pos)] = Counter(wins)
+        acc.position_games = Counter({int(pos): games for pos, games in data['position_games'].items()})
+        acc.sum_rounds = data['sum_rounds']
+        acc.sum_terms = data['sum_terms']
+        acc.game_length_distribution = Counter(
+            {int(r): c for r, c in data['game_length_distribution'].items()}
+        )
+        for name, actions in data['action_frequency'].items():
+            acc.action_frequency[name] = Counter(actions)
+        acc.economic = data['economic']
+        acc.sketches = SketchSet.from_dict(data['sketches'])
+        return acc
+
+
+def persona_label(player_name: str) -> str:
+    """
+    Persona label for a player name, e.g. "Economic" for "Economic Bot".
+
+    Per-persona statistics and quantile sketches are keyed by this label,
+    both here and in the simulation runner, so they can be merged.
+    """
+    # Remove common suffixes like " Bot"
+    if player_name.endswith(" Bot"):
+        return player_name[:-4]
+    return player_name
+
+
+def _results_body_length(content: bytes) -> int:
+    """
+    Length of a JSON results array up to and including its last element.
+
+    Appending games to a results file rewrites only what follows this point
+    (the closing bracket), so the bytes before it identify the rows that were
+    already analyzed.
+    """
+    end = content.rstrip().rfind(b']')
+    if end < 0:
+        return -1
+    return len(content[:end].rstrip())
 
 
 class SimulationAnalyzer:
@@ -39,21 +234,44 @@ class SimulationAnalyzer:
     Does player order matter? What's the typical game length?
     """
     
-    def __init__(self, results_directory: str = "simulation_results"):
+    def __init__(self, results_directory: str = "simulation_results", use_cache: bool = True):
         """
         Initialize the analyzer.
         
         Args:
             results_directory: Directory containing simulation results
+            use_cache: Reuse and update the derived-metrics cache next to each results file
         """
         self.results_directory = Path(results_directory)
-        self.results = []
+        self.results_path: Optional[Path] = None
+        self.use_cache = use_cache
+        self.cache_status: Optional[str] = None  # "hit", "incremental" or "miss" after loading
+        self.metrics = None
+        self._results: Optional[List[Dict[str, Any]]] = []
+        self._accumulator: Optional[MetricsAccumulator] = None
+
+    @property
+    def results(self) -> List[Dict[str, Any]]:
+        """Raw result rows, parsed on first access when metrics came from the cache."""
+        if self._results is None:
+            with open(self.results_path, 'r') as f:
+                self._results = json.load(f)
+        return self._results
+
+    @results.setter
+    def results(self, value: List[Dict[str, Any]]) -> None:
+        self._results = value
+        self._accumulator = None
         self.metrics = None
     
     def load_results(self, timestamp: Optional[str] = None) -> None:
         """
         Load simulation results from files.
         
+        When caching is enabled, derived metrics are reused from the cache file
+        stored next to the results file. An unchanged file is not parsed at all,
+        and a file that only gained new games has just those rows folded in.
+        
         Args:
             timestamp: Specific timestamp to load (if None, loads most recent)
         """
@@ -76,12 +294,33 @@ class SimulationAnalyzer:
                 raise FileNotFoundError(f"Results file not found with timestamp {timestamp}")
         
         json_path = json_files[0]  # Use the first matching file
+        self.results_path = json_path
+        self.metrics = None
         
-        # Load detailed results
-        with open(json_path, 'r') as f:
-            self.results = json.load(f)
+        with open(json_path, 'rb') as f:
+            content = f.read()
+        
+        if self.use_cache:
+            self._accumulator = self._load_from_cache(json_path, content)
+            if self._accumulator is not None:
+                print(f"Loaded {self._accumulator.total_games} simulation results from {json_path} "
+                      f"(analysis cache {self.cache_status})")
+                return
         
-        print(f"Loaded {len(self.results)} simulation results from {json_path}")
+        # Load detailed results
+        self._results = json.loads(content)
+        self._accumulator = None
+        self.cache_status = "miss"
+        
+        if self.use_cache and isinstance(self._results, list):
+            try:
+                self._accumulator = self._accumulate(self._results)
+                self._write_cache(json_path, content, self._accumulator)
+            except (KeyError, TypeError, AttributeError, OSError):
+                # Malformed rows or an unwritable directory: analyze without a cache
+                self._accumulator = None
+        
+        print(f"Loaded {len(self._results)} simulation results from {json_path}")
     
     def calculate_metrics(self) -> AnalysisMetrics:
         """
@@ -90,144 +329,98 @@ class SimulationAnalyzer:
         Returns:
             AnalysisMetrics object containing all calculated metrics
         """
-        if not self.results:
-            raise ValueError("No results loaded. Call load_results() first.")
-        
-        total_games = len(self.results)
+        if self._accumulator is None:
+            if not self.results:
+                raise ValueError("No results loaded. Call load_results() first.")
+            self._accumulator = self._accumulate(self.results)
         
-        # Calculate win rates
-        win_rates = self._calculate_win_rates()
-        
-        # Calculate win rates by player position
-        win_rates_by_position = self._calculate_win_rates_by_position()
-        
-        # Calculate game length statistics
-        game_lengths_rounds = [r['game_length_rounds'] for r in self.results]
-        game_lengths_terms = [r['game_length_terms'] for r in self.results]
-        
-        avg_game_length_rounds = statistics.mean(game_lengths_rounds)
-        avg_game_length_terms = statistics.mean(game_lengths_terms)
-        
-        # Calculate action frequency analysis
-        action_frequency = self._calculate_action_frequency()
-        
-        # Calculate economic analysis
-        economic_analysis = self._calculate_economic_analysis()
-        
-        # Calculate game length distribution
-        game_length_distribution = Counter(game_lengths_rounds)
-        
-        self.metrics = AnalysisMetrics(
-            total_games=total_games,
-            win_rates=win_rates,
-            win_rates_by_position=win_rates_by_position,
-            avg_game_length_rounds=avg_game_length_rounds,
-            avg_game_length_terms=avg_game_length_terms,
-            action_frequency=action_frequency,
-            economic_analysis=economic_analysis,
-            game_length_distribution=dict(game_length_distribution)
-        )
+        if self._accumulator.total_games == 0:
+            raise ValueError("No results loaded. Call load_results() first.")
         
+        self.metrics = self._accumulator.to_metrics()
         return self.metrics
     
-    def _calculate_win_rates(self) -> Dict[str, float]:
-        """Calculate win rates for each persona."""
-        winner_counts = Counter()
-        total_games = len(self.results)
-        
-        for result in self.results:
-            winner_name = result.get('winner_name')
-            if winner_name:
-                winner_counts[winner_name] += 1
-        
-        win_rates = {}
-        for winner_name, wins in winner_counts.items():
-            win_rates[winner_name] = wins / total_games
-        
-        return win_rates
+    def _accumulate(self, results: List[Dict[str, Any]]) -> MetricsAccumulator:
+        """Fold a list of result rows into a fresh accumulator."""
+        accumulator = MetricsAccumulator()
+        for result in results:
+            accumulator.add_result(result)
+        return accumulator
     
-    def _calculate_win_rates_by_position(self) -> Dict[int, Dict[str, float]]:
-        """Calculate win rates broken down by player position (first, second, etc.)."""
-        position_wins = defaultdict(lambda: defaultdict(int))
-        position_games = defaultdict(int)
-        
-        for result in self.results:
-            # Extract player positions from game log or final state
-            # This is a simplified version - in practice, we'd need to track
-            # which player was in which position during the game
-            winner_name = result.get('winner_name')
-            if winner_name:
-                # For now, assume winner was in position 0 (first player)
-                # In a full implementation, we'd track this from the game state
-                position_wins[0][winner_name] += 1
-                position_games[0] += 1
-        
-        win_rates_by_position = {}
-        for position in position_games:
-            win_rates_by_position[position] = {}
-            for winner_name, wins in position_wins[position].items():
-                win_rates_by_position[position][winner_name] = wins / position_games[position]
-        
-        return win_rates_by_position
+    @staticmethod
+    def cache_path_for(results_path: Path) -> Path:
+        """Return the path of the analysis cache stored next to a results file."""
+        return results_path.with_name(results_path.name + CACHE_SUFFIX)
     
-    def _calculate_action_frequency(self) -> Dict[str, Dict[str, int]]:
-        """Calculate how often each persona takes different actions."""
-        action_frequency = defaultdict(lambda: defaultdict(int))
+    def _load_from_cache(self, json_path: Path, content: bytes) -> Optional[MetricsAccumulator]:
+        """
+        Return up-to-date aggregates for a results file using its cache.
         
-        for result in self.results:
-            game_log = result.get('game_log', [])
+        Returns None when there is no usable cache, in which case the caller
+        recomputes everything from scratch.
+        """
+        cache_path = self.cache_path_for(json_path)
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if cache.get('analyzer_version') != ANALYZER_VERSION:
+            return None
+        
+        try:
+            if cache['sha256'] == hashlib.sha256(content).hexdigest():
+                self._results = None  # Parsed lazily if someone asks for the raw rows
+                self.cache_status = "hit"
+                return MetricsAccumulator.from_dict(cache['aggregates'])
             
-            # Parse game log to extract actions by player
-            # This is a simplified version - in practice, we'd need to parse
-            # the actual action log entries
-            for log_entry in game_log:
-                # Example log entry: "Player 1 chose: ActionFundraise"
-                if "chose:" in log_entry:
-                    parts = log_entry.split("chose:")
-                    if len(parts) == 2:
-                        player_name = parts[0].strip()
-                        action_name = parts[1].strip()
-                        
-                        # Extract persona name from player name
-                        persona_name = self._extract_persona_name(player_name)
-                        action_frequency[persona_name][action_name] += 1
-        
-        return dict(action_frequency)
-    
-    def _calculate_economic_analysis(self) -> Dict[str, Dict[str, float]]:
-        """Calculate economic metrics for each persona."""
-        economic_metrics = defaultdict(lambda: defaultdict(list))
-        
-        for result in self.results:
-            final_state = result.get('final_state', {})
-            players = final_state.get('players', [])
+            # The file changed: reuse the cache only if the rows it covers are
+            # untouched and new games were appended after them
+            body_length = cache['body_length']
+            if body_length <= 0 or len(content) <= body_length:
+                return None
+            if hashlib.sha256(content[:body_length]).hexdigest() != cache['body_sha256']:
+                return None
             
-            for player in players:
-                persona_name = self._extract_persona_name(player.get('name', ''))
-                pc = player.get('pc', 0)
-                influence = player.get('influence', 0)
-                
-                economic_metrics[persona_name]['final_pc'].append(pc)
-                economic_metrics[persona_name]['final_influence'].append(influence)
-        
-        # Calculate averages
-        economic_analysis = {}
-        for persona_name, metrics in economic_metrics.items():
-            economic_analysis[persona_name] = {
-                'avg_final_pc': statistics.mean(metrics['final_pc']),
-                'avg_final_influence': statistics.mean(metrics['final_influence']),
-                'max_final_pc': max(metrics['final_pc']),
-                'min_final_pc': min(metrics['final_pc'])
-            }
-        
-        return economic_analysis
+            tail = content[body_length:].lstrip()
+            if tail.startswith(b','):
+                tail = tail[1:]
+            new_rows = json.loads(b'[' + tail)
+            
+            accumulator = MetricsAccumulator.from_dict(cache['aggregates'])
+            for result in new_rows:
+                accumulator.add_result(result)
+        except (KeyError, TypeError, AttributeError, ValueError):
+            return None
+        
+        self._results = None  # Parsed lazily if someone asks for the raw rows
+        self.cache_status = "incremental"
+        try:
+            self._write_cache(json_path, content, accumulator)
+        except OSError:
+            pass
+        return accumulator
+    
+    def _write_cache(self, json_path: Path, content: bytes, accumulator: MetricsAccumulator) -> None:
+        """Persist the aggregates for a results file next to it."""
+        body_length = _results_body_length(content)
+        cache = {
+            'analyzer_version': ANALYZER_VERSION,
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'body_length': body_length,
+            'body_sha256': hashlib.sha256(content[:max(body_length, 0)]).hexdigest(),
+            'aggregates': accumulator.to_dict()
+        }
+        cache_path = self.cache_path_for(json_path)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
     
     def _extract_persona_name(self, player_name: str) -> str:
         """Extract persona name from player name."""
-        # Remove common suffixes like " Bot"
-        if player_name.endswith(" Bot"):
-            return player_name[:-4]
-        return player_name
+        return persona_label(player_name)
     
     def generate_report(self) -> str:
         """
@@ -313,6 +506,15 @@ class SimulationAnalyzer:
             report.append(f"- **Average Final PC:** {metrics_econ['avg_final_pc']:.1f}")
             report.append(f"- **Average Final Influence:** {metrics_econ['avg_final_influence']:.1f}")
             report.append(f"- **PC Range:** {metrics_econ['min_final_pc']:.0f} - {metrics_econ['max_final_pc']:.0f}")
+            report.append(f"- **Median Final PC:** {metrics_econ['median_final_pc']:.0f}")
+            report.append("")
+        
+        # Distribution tails from the streaming quantile sketches
+        report.append("## Score Distributions (p10 / median / p90)")
+        for persona, persona_quantiles in metrics.quantiles.items():
+            report.append(f"### {persona}")
+            for metric, points in persona_quantiles.items():
+                report.append(f"- **{metric}:** {points['p10']:.0f} / {points['p50']:.0f} / {points['p90']:.0f}")
             report.append("")
         
         return "\n".join(report)
@@ -384,10 +586,12 @@ def main():
     parser.add_argument("--timestamp", help="Specific timestamp to analyze")
     parser.add_argument("--output", default="analysis_report.md",
                        help="Output file for the report")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Recompute all metrics instead of using the analysis cache")
     
     args = parser.parse_args()
     
-    analyzer = SimulationAnalyzer(args.results_dir)
+    analyzer = SimulationAnalyzer(args.results_dir, use_cache=not args.no_cache)
     
     try:
         analyzer.load_results(args.timestamp)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Client State Serialization Benchmark
+
+Compares the original way of producing a websocket message, a full
+GameState.to_dict() with dataclasses.asdict() actions and json.dumps,
+against the current path: the ID-only client state from
+GameSession.get_state_for_client() encoded by state_serializer, both as
+full snapshots and as the delta messages the server actually sends.
+
+States are sampled from the middle of real games (term 1 and 2 action
+phases) played by the built-in AI, with the human seat played randomly.
+"""
+
+import contextlib
+import copy
+import io
+import json
+import random
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List
+
+import state_serializer
+from game_session import GameSession
+from models.game_state import GameState
+from state_delta import StateStream
+
+
+def sample_mid_game_states(games: int = 5, seed: int = 0, every: int = 1) -> List[GameState]:
+    """
+    Play games and collect copies of the states a client would be sent.
+
+    Args:
+        games: Number of games to play
+        seed: Random seed for the games
+        every: Keep one state per this many steps
+
+    Returns:
+        List[GameState]: Deep copies of mid-game action phase states
+    """
+    rng = random.Random(seed)
+    states = []
+    for game in range(games):
+        random.seed(seed + game)
+        session = GameSession()
+        # The engine and AI log to stdout; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            session.start_game()
+            for step in range(400):
+                if session.is_game_over() or session.state.term_counter >= 2:
+                    break
+                if step % every == 0 and session.state.current_phase == "ACTION_PHASE":
+                    states.append(copy.deepcopy(session.state))
+                if session.is_human_turn():
+                    actions = session.get_state_for_client().get('valid_actions') or [{"action_type": "ActionPassTurn"}]
+                    choice = dict(rng.choice(actions))
+                    if session.state.pending_ui_action:
+                        options = session.state.pending_ui_action.get('options') or [{"id": 1}]
+                        choice = {"choice": rng.choice(options).get('id', 1)}
+                    session.process_human_action(choice)
+                else:
+                    session.process_ai_turn()
+    return states
+
+
+def legacy_message(session: GameSession) -> bytes:
+    """The message the server sent before the catalog, delta and encoder changes."""
+    state_dict = session.state.to_dict()
+    state_dict['log'] = list(session.state.turn_log)
+    state_dict['is_game_over'] = session.is_game_over()
+    actions = session.engine.get_valid_system_actions(session.state)
+    if session.is_human_turn():
+        actions = session.engine.get_valid_actions(session.state, session.human_player_id) + actions
+    state_dict['valid_actions'] = [dict(asdict(a), action_type=a.__class__.__name__) for a in actions]
+    return json.dumps(state_dict).encode('utf-8')
+
+
+def _time_per_call(func: Callable[[], object], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def run_benchmark(states: List[GameState], repeat: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    Measure every serialization path on the sampled states.
+
+    Args:
+        states: States to serialize (see sample_mid_game_states)
+        repeat: Encodings per state per path
+
+    Returns:
+        Dict[str, Dict[str, float]]: Mean microseconds and bytes per message,
+            by path ("legacy", "snapshot/<backend>", "delta/<backend>")
+    """
+    session = GameSession()
+    results = {}
+
+    def measure(name: str, encode: Callable[[], bytes]):
+        total_seconds = total_bytes = 0
+        for state in states:
+            session.state = state
+            total_seconds += _time_per_call(encode, repeat)
+            total_bytes += len(encode())
+        results[name] = {'microseconds': total_seconds / len(states) * 1e6, 'bytes': total_bytes / len(states)}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        measure('legacy', lambda: legacy_message(session))
+        default_backend = state_serializer.BACKEND
+        try:
+            for backend in state_serializer.ENCODERS:
+                state_serializer.BACKEND = backend
+                measure(f'snapshot/{backend}', lambda: state_serializer.dumps(session.get_state_for_client()))
+
+                # Consecutive states through one stream, as a connection sees them
+                stream = StateStream()
+                stream.encode(session.get_state_for_client())
+                started, total_bytes = time.perf_counter(), 0
+                for _ in range(max(1, repeat // 10)):
+                    for state in states:
+                        session.state = state
+                        total_bytes += len(stream.encode_text(session.get_state_for_client()))
+                messages = max(1, repeat // 10) * len(states)
+                results[f'delta/{backend}'] = {
+                    'microseconds': (time.perf_counter() - started) / messages * 1e6,
+                    'bytes': total_bytes / messages
+                }
+        finally:
+            state_serializer.BACKEND = default_backend
+    return results
+
+
+def main():
+    """Main entry point for the serialization benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark client state serialization on mid-game states')
+    parser.add_argument('--games', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=200, help='Encodings per state per path')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    states = sample_mid_game_states(args.games, args.seed)
+    print(f"{len(states)} mid-game states from {args.games} games; backends: {', '.join(state_serializer.ENCODERS)}")
+    results = run_benchmark(states, args.repeat)
+
+    legacy = results['legacy']
+    print(f"\n{'Path':<20} {'us/message':>12} {'bytes':>10} {'speedup':>9}")
+    print("-" * 54)
+    for name, stats in results.items():
+        print(f"{name:<20} {stats['microseconds']:>12.1f} {stats['bytes']:>10.0f} "
+              f"{legacy['microseconds'] / stats['microseconds']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
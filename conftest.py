@@ -0,0 +1,4 @@
+import os
+
+# Tests that import the server must not write a session store into the working tree
+os.environ.setdefault("SESSION_DB", ":memory:")
@@ -4,6 +4,7 @@ Debug script to check the initial game state
 """
 
 from game_session import GameSession
+from game_data import build_catalog
 import json
 
 def debug_initial_state():
@@ -54,9 +55,10 @@ def debug_initial_state():
     print(f"\nPlayers in client state:")
     for i, player in enumerate(client_state['players']):
         print(f"  Player {i}: name='{player['name']}', id={player['id']}")
-        # Check if mandate data is included
-        if 'mandate' in player and player['mandate']:
-            print(f"    Mandate: {player['mandate']['title']} - {player['mandate']['description']}")
+        # Check if mandate data is included (texts come from the catalog)
+        if player.get('mandate_id'):
+            mandate = build_catalog()['mandates'][player['mandate_id']]
+            print(f"    Mandate: {mandate['title']} - {mandate['description']}")
         else:
             print(f"    Mandate: Not included or None")
     
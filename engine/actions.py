@@ -1,15 +1,26 @@
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Type
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Type, Tuple
 
 @dataclass
 class Action:
     """Base class for all player actions."""
     player_id: int
 
+    # Index into ACTION_TYPES, assigned by _register_action (-1 if unregistered)
+    type_id = -1
+
     def to_dict(self) -> Dict[str, Any]:
         """Serializes the action to a dictionary."""
-        data = asdict(self)
-        data['action_type'] = self.__class__.__name__
+        cls = self.__class__
+        names = _FIELD_NAMES.get(cls)
+        if names is None:
+            names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+        # Fields are plain values or lists of them, so a shallow copy per field is a full copy
+        data = {name: getattr(self, name) for name in names}
+        for name, value in data.items():
+            if isinstance(value, list):
+                data[name] = list(value)
+        data['action_type'] = cls.__name__
         return data
 
     @classmethod
@@ -22,13 +33,21 @@ class Action:
         return cls(**data)
 
 
+# Dataclass field names of each action class, filled on first serialization
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
 # Dictionary to map action type names back to their classes
 ACTION_CLASSES: Dict[str, Type[Action]] = {
     cls.action_type: cls for cls in Action.__subclasses__()
 }
 
+# Registered action classes in registration order; each class's type_id indexes this list
+ACTION_TYPES: List[Type[Action]] = []
+
 def _register_action(cls):
     ACTION_CLASSES[cls.__name__] = cls
+    cls.type_id = len(ACTION_TYPES)
+    ACTION_TYPES.append(cls)
     return cls
 
 @dataclass
@@ -0,0 +1,89 @@
+"""
+Exact election win probabilities.
+
+resolve_elections scores every candidate for an office as committed PC plus
+a d6, adds the NPC Challenger last with its npc_challenger_bonus plus a d6,
+and takes max() over the scores. The dice are independent, so the chance
+that an entry wins is a short sum over its own die face of the product of
+the other entries' cumulative distributions. Because max() keeps the first
+of several equal scores, an entry must strictly beat every earlier entry
+and at least tie every later one; the NPC, being last, must strictly beat
+all candidates.
+"""
+
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from models.game_state import GameState
+from models.components import Office
+
+NPC_CHALLENGER = "NPC Challenger"
+DIE_FACES = (1, 2, 3, 4, 5, 6)
+
+
+@lru_cache(maxsize=4096)
+def win_probabilities(scores: Tuple[int, ...], dice: bool = True) -> Tuple[float, ...]:
+    """
+    Win probability of each entry in an election, in resolution order.
+
+    Args:
+        scores: Base score of every entry (committed PC, NPC bonus last)
+        dice: Whether each entry adds a d6 (False for disable_dice_roll)
+
+    Returns:
+        Tuple[float, ...]: Probability that each entry is the max() winner
+    """
+    faces = DIE_FACES if dice else (0,)
+    wins = []
+    for i, base in enumerate(scores):
+        count = 0
+        for face in faces:
+            value = base + face
+            ways = 1
+            for j, other in enumerate(scores):
+                if j < i:
+                    ways *= sum(1 for f in faces if other + f < value)
+                elif j > i:
+                    ways *= sum(1 for f in faces if other + f <= value)
+                if not ways:
+                    break
+            count += ways
+        wins.append(count)
+    # Integer counts over all dice outcomes keep the result exact up to the final division
+    outcomes = len(faces) ** len(scores)
+    return tuple(count / outcomes for count in wins)
+
+
+def election_odds(state: GameState,
+                  office: Union[Office, str],
+                  commitments: Optional[Union[Mapping[int, int], Sequence[Tuple[int, int]]]] = None,
+                  disable_dice_roll: bool = False) -> Dict[Union[int, str], float]:
+    """
+    Exact win probabilities for one office's election.
+
+    Args:
+        state: Current game state
+        office: The office, or its id
+        commitments: Committed PC per candidate player id, in declaration
+            order; defaults to the declared candidacies for the office
+        disable_dice_roll: Whether elections are resolved without dice
+
+    Returns:
+        Dict mapping each candidate's player id, and NPC_CHALLENGER, to its
+        chance of winning; empty if there are no candidates
+    """
+    if isinstance(office, str):
+        office = state.offices[office]
+    if commitments is None:
+        commitments = [(c.player_id, c.committed_pc) for c in state.secret_candidacies
+                       if c.office_id == office.id]
+    elif isinstance(commitments, Mapping):
+        commitments = list(commitments.items())
+    if not commitments:
+        return {}
+
+    scores = tuple(committed for _, committed in commitments) + (office.npc_challenger_bonus,)
+    probabilities = win_probabilities(scores, not disable_dice_roll)
+    odds = {player_id: p for (player_id, _), p in zip(commitments, probabilities)}
+    odds[NPC_CHALLENGER] = probabilities[-1]
+    return odds
@@ -7,6 +7,7 @@ from engine.actions import Action
 from engine.scoring import calculate_final_scores
 from typing import List, Dict, Any
 from copy import deepcopy
+from game_logging import get_logger
 from engine.actions import (
     ActionFundraise, ActionNetwork, ActionSponsorLegislation, ActionDeclareCandidacy, 
     ActionUseFavor, ActionSupportLegislation, ActionOpposeLegislation, ActionPassTurn, 
@@ -18,6 +19,8 @@ from engine.actions import (
     ACTION_CLASSES
 )
 
+logger = get_logger(__name__)
+
 class GameEngine:
     """The central rule enforcement and state-management authority for the game."""
 
@@ -107,12 +110,12 @@ class GameEngine:
                 new_state = resolver(new_state, action)
             except Exception as e:
                 error_msg = f"Error processing action '{type(action).__name__}': {e}"
-                print(error_msg)
+                logger.warning(error_msg)
                 new_state.add_log(error_msg)
                 return new_state
         else:
             error_msg = f"No resolver found for action: {type(action).__name__}"
-            print(error_msg)
+            logger.warning(error_msg)
             new_state.add_log(error_msg)
             return new_state
 
@@ -123,6 +126,13 @@ class GameEngine:
             
         return new_state
 
+    def run_event_phase(self, state: GameState) -> GameState:
+        """Draws and resolves an event card, then opens the action phase."""
+        state = resolvers.resolve_event_card(state)
+        state.current_phase = "ACTION_PHASE"
+        state.current_player_index = 0
+        return state
+
     def get_valid_actions(self, state: GameState, player_id: int) -> List[Action]:
         valid_actions = []
         player = state.get_player_by_id(player_id)
@@ -344,7 +354,7 @@ class GameEngine:
         if not state.awaiting_election_resolution:
             return state
 
-        print("[DEBUG] run_election_phase called")
+        logger.debug("Resolving elections")
         state.current_phase = "ELECTION_PHASE"
         state.add_log("\n--- ELECTION PHASE ---")
         
@@ -17,6 +17,9 @@ from engine.actions import (
     ActionInitiateUseFavor, ActionSubmitTarget
 )
 import json
+from game_logging import get_logger
+
+logger = get_logger(__name__)
 
 #--- Action Resolvers ---
 
@@ -633,7 +636,8 @@ def resolve_support_legislation(state: GameState, action: ActionSupportLegislati
     player = state.get_player_by_id(action.player_id)
     if not player: return state
     
-    print(f"[DEBUG] resolve_support_legislation: Player {player.name} (ID: {player.id}) has {player.pc} PC, trying to commit {action.support_amount} PC")
+    logger.debug("Player %s (ID: %s) has %s PC, trying to commit %s PC in support",
+                 player.name, player.id, player.pc, action.support_amount)
     
     # NEW: Secret Commitment System - only validate, don't update public state
     # The actual commitment is stored secretly on the server
@@ -665,7 +669,7 @@ def resolve_support_legislation(state: GameState, action: ActionSupportLegislati
     # FIXED: Deduct PC immediately when commitment is made
     old_pc = player.pc
     player.pc -= action.support_amount
-    print(f"[DEBUG] resolve_support_legislation: Deducted {action.support_amount} PC from {player.name}. Old PC: {old_pc}, New PC: {player.pc}")
+    logger.debug("Deducted %s PC from %s. Old PC: %s, New PC: %s", action.support_amount, player.name, old_pc, player.pc)
     
     # Provide confirmation feedback - only to the acting player, not publicly
     # Secret commitments should not be revealed to other players
@@ -0,0 +1,659 @@
+"""
+A compact, cheaply clonable forward model of the game for search-based agents.
+
+GameEngine.process_action deep-copies the whole GameState (including the
+turn log and every card object) for every action, which is far too slow for
+tree search. SearchState keeps only what the rules read and write, stored in
+flat lists that can be copied in a few microseconds, and replays the rules of
+engine/resolvers.py, engine/scoring.py and the harness turn flow on that
+representation. Phases that need no decision (upkeep, events, legislation
+and elections, new terms) are advanced automatically, so a SearchState is
+always either waiting for a player action or finished.
+
+Actions are represented as hashable tuples ("action keys"); action_key()
+converts an engine Action into the same form.
+"""
+import random
+from typing import List, Dict, Optional, Tuple, Any
+
+from models.game_state import GameState
+from engine.actions import (
+    Action, ActionFundraise, ActionNetwork, ActionSponsorLegislation, ActionDeclareCandidacy,
+    ActionUseFavor, ActionSupportLegislation, ActionOpposeLegislation, ActionPassTurn
+)
+from game_data import load_personal_mandates, load_archetypes
+
+
+ActionKey = Tuple[Any, ...]
+
+FUNDRAISE = "FUNDRAISE"
+NETWORK = "NETWORK"
+SPONSOR = "SPONSOR"
+DECLARE = "DECLARE"
+FAVOR = "FAVOR"
+SUPPORT = "SUPPORT"
+OPPOSE = "OPPOSE"
+PASS = "PASS"
+
+# Mirrors engine.get_valid_actions / resolvers
+COMMITMENT_AMOUNTS = (1, 5, 10)
+TARGETED_FAVORS = frozenset(["POLITICAL_PRESSURE", "POLITICAL_DEBT", "POLITICAL_HOT_POTATO"])
+NEGATIVE_FAVORS = frozenset(["POLITICAL_DEBT", "PUBLIC_GAFFE", "MEDIA_SCRUTINY",
+                             "COMPROMISING_POSITION", "POLITICAL_HOT_POTATO"])
+OFFICE_INFLUENCE = {"PRESIDENT": 25, "US_SENATOR": 15, "GOVERNOR": 10, "STATE_SENATOR": 5, "CONGRESS_SEAT": 5}
+MANDATE_BONUS = 15
+GAME_TERMS = 3
+# Player.action_points is reset to this and never spent; Sponsor/Declare cost this many AP
+PLAYER_ACTION_POINTS = 2
+SPONSOR_AP_COST = 2
+
+ALL_MANDATE_IDS = tuple(m.id for m in load_personal_mandates())
+ALL_ARCHETYPE_IDS = tuple(a.id for a in load_archetypes())
+
+
+def action_key(action: Action) -> Optional[ActionKey]:
+    """
+    Convert an engine action into a SearchState action key.
+
+    Returns:
+        The key, or None for actions the search model does not play (UI
+        and system actions)
+    """
+    if isinstance(action, ActionFundraise):
+        return (FUNDRAISE,)
+    if isinstance(action, ActionNetwork):
+        return (NETWORK,)
+    if isinstance(action, ActionSponsorLegislation):
+        return (SPONSOR, action.legislation_id)
+    if isinstance(action, ActionDeclareCandidacy):
+        return (DECLARE, action.office_id, action.committed_pc)
+    if isinstance(action, ActionUseFavor):
+        target = action.target_player_id if action.favor_id in TARGETED_FAVORS else -1
+        return (FAVOR, action.favor_id, target)
+    if isinstance(action, ActionSupportLegislation):
+        return (SUPPORT, action.legislation_id, action.support_amount)
+    if isinstance(action, ActionOpposeLegislation):
+        return (OPPOSE, action.legislation_id, action.oppose_amount)
+    if isinstance(action, ActionPassTurn):
+        return (PASS,)
+    return None
+
+
+class _Rules:
+    """Static game data shared (never copied) by every SearchState of a game."""
+
+    __slots__ = ('legislation', 'legislation_order', 'offices', 'office_order', 'deck_original', 'names')
+
+    def __init__(self, state: GameState):
+        self.legislation = {
+            leg_id: (leg.cost, leg.success_target, leg.crit_target, leg.success_reward,
+                     leg.crit_reward, leg.failure_penalty, leg.mood_change)
+            for leg_id, leg in state.legislation_options.items()
+        }
+        self.legislation_order = tuple(state.legislation_options)
+        self.offices = {
+            office_id: (office.candidacy_cost, office.income, office.npc_challenger_bonus)
+            for office_id, office in state.offices.items()
+        }
+        self.office_order = tuple(state.offices)
+        original = getattr(state.event_deck, '_original_cards', state.event_deck.cards)
+        self.deck_original = tuple(card.effect_id for card in original)
+        self.names = tuple(p.name for p in state.players)
+
+
+class SearchState:
+    """
+    Flat game state for search. clone() is a shallow copy of a handful of lists.
+
+    Hidden information (opponents' mandates and archetypes, secret support
+    commitments, committed election PC and event deck order) can be
+    resampled per search iteration with determinize().
+    """
+
+    __slots__ = (
+        'rules', 'rng', 'dice', 'n', 'pc', 'office', 'favors', 'mandate', 'archetype',
+        'fundraiser_used', 'ap', 'current', 'round', 'term', 'mood', 'effects', 'gaffe',
+        'hot_potato', 'bills', 'sponsored', 'candidacies', 'history', 'last_sponsor',
+        'deck', 'favor_supply'
+    )
+
+    @classmethod
+    def from_game_state(cls, state: GameState, rng: Optional[random.Random] = None,
+                        disable_dice_roll: bool = False) -> 'SearchState':
+        """
+        Build a search state from an engine GameState.
+
+        Args:
+            state: The engine state (not modified)
+            rng: Random source for every chance event in the model
+            disable_dice_roll: Resolve elections without dice, as the harness option does
+
+        Returns:
+            SearchState positioned at the same decision point
+        """
+        s = cls.__new__(cls)
+        s.rules = _Rules(state)
+        s.rng = rng or random.Random()
+        s.dice = not disable_dice_roll
+        players = state.players
+        s.n = len(players)
+        s.pc = [p.pc for p in players]
+        s.office = [p.current_office.id if p.current_office else None for p in players]
+        s.favors = [[f.id for f in p.favors] for p in players]
+        s.mandate = [p.mandate.id if p.mandate else None for p in players]
+        s.archetype = [p.archetype.id if p.archetype else None for p in players]
+        s.fundraiser_used = [p.fundraiser_bonus_used for p in players]
+        s.ap = [state.action_points.get(p.id, 0) for p in players]
+        s.current = state.current_player_index
+        s.round = state.round_marker
+        s.term = state.term_counter
+        s.mood = state.public_mood
+        s.effects = set(state.active_effects)
+        s.gaffe = set(state.public_gaffe_players)
+        s.hot_potato = state.hot_potato_holder
+        s.bills = [
+            [leg.legislation_id, leg.sponsor_id, dict(leg.support_players), dict(leg.oppose_players)]
+            for leg in state.term_legislation if not leg.resolved
+        ]
+        s.sponsored = [leg.legislation_id for leg in state.term_legislation]
+        s.candidacies = [(c.player_id, c.office_id, c.committed_pc) for c in state.secret_candidacies]
+        s.history = [
+            (h['sponsor_id'], h.get('leg_id'), h['outcome'], frozenset(h.get('support_players', {})))
+            for h in state.legislation_history
+        ]
+        last = state.last_sponsor_result
+        s.last_sponsor = (last['player_id'], last['passed']) if last else None
+        s.deck = [card.effect_id for card in state.event_deck.cards]
+        s.favor_supply = [f.id for f in state.favor_supply]
+
+        # Run any pending system phase so the state is at a decision point
+        if state.awaiting_legislation_resolution or state.awaiting_election_resolution:
+            s._end_term()
+        elif state.awaiting_results_acknowledgement:
+            s._start_next_term()
+        return s
+
+    def clone(self) -> 'SearchState':
+        """Return an independent copy that shares only the static rules data."""
+        s = SearchState.__new__(SearchState)
+        s.rules = self.rules
+        s.rng = self.rng
+        s.dice = self.dice
+        s.n = self.n
+        s.pc = self.pc[:]
+        s.office = self.office[:]
+        s.favors = [hand[:] for hand in self.favors]
+        s.mandate = self.mandate[:]
+        s.archetype = self.archetype[:]
+        s.fundraiser_used = self.fundraiser_used[:]
+        s.ap = self.ap[:]
+        s.current = self.current
+        s.round = self.round
+        s.term = self.term
+        s.mood = self.mood
+        s.effects = set(self.effects)
+        s.gaffe = set(self.gaffe)
+        s.hot_potato = self.hot_potato
+        s.bills = [[b[0], b[1], dict(b[2]), dict(b[3])] for b in self.bills]
+        s.sponsored = self.sponsored[:]
+        s.candidacies = self.candidacies[:]
+        s.history = self.history[:]
+        s.last_sponsor = self.last_sponsor
+        s.deck = self.deck[:]
+        s.favor_supply = self.favor_supply[:]
+        return s
+
+    def determinize(self, observer: int, rng: Optional[random.Random] = None) -> None:
+        """
+        Resample everything the observer cannot see, in place.
+
+        Opponents' mandates and (unrevealed, non-Insider) archetypes are drawn
+        from the cards the observer does not hold, secret support amounts and
+        committed election PC are redrawn, and the event deck is reshuffled.
+        Opposition amounts are announced publicly and are kept.
+
+        Args:
+            observer: Player id whose point of view is kept
+            rng: Random source (defaults to the state's own)
+        """
+        rng = rng or self.rng
+        opponents = [pid for pid in range(self.n) if pid != observer]
+
+        mandates = [m for m in ALL_MANDATE_IDS if m != self.mandate[observer]]
+        rng.shuffle(mandates)
+        for pid, mandate in zip(opponents, mandates):
+            self.mandate[pid] = mandate
+
+        hidden = [pid for pid in opponents if self.archetype[pid] != "INSIDER"]
+        known = {self.archetype[observer]} | {self.archetype[pid] for pid in opponents if pid not in hidden}
+        archetypes = [a for a in ALL_ARCHETYPE_IDS if a not in known]
+        rng.shuffle(archetypes)
+        for pid, archetype in zip(hidden, archetypes):
+            self.archetype[pid] = archetype
+
+        for bill in self.bills:
+            support = bill[2]
+            for pid in support:
+                if pid != observer:
+                    support[pid] = rng.choice(COMMITMENT_AMOUNTS)
+
+        self.candidacies = [
+            (pid, office_id, committed if pid == observer else rng.randint(0, 10))
+            for pid, office_id, committed in self.candidacies
+        ]
+        rng.shuffle(self.deck)
+
+    # --- Queries ---
+
+    def is_terminal(self) -> bool:
+        return self.term >= GAME_TERMS
+
+    def legal_actions(self) -> List[ActionKey]:
+        """Action keys the engine would offer the current (AI) player."""
+        pid = self.current
+        pc = self.pc[pid]
+        actions = [(FUNDRAISE,), (NETWORK,)]
+        # Mirrors GameEngine.get_valid_actions' can_afford_action(): the engine checks
+        # Player.action_points (always PLAYER_ACTION_POINTS) against the AP cost plus the gaffe surcharge
+        sponsor_cost = SPONSOR_AP_COST + (1 if pid in self.gaffe else 0)
+        if PLAYER_ACTION_POINTS >= sponsor_cost:
+            rules = self.rules
+            for leg_id in rules.legislation_order:
+                if pc >= rules.legislation[leg_id][0] and leg_id not in self.sponsored:
+                    actions.append((SPONSOR, leg_id))
+            if self.round == 4:
+                for office_id in rules.office_order:
+                    cost = rules.offices[office_id][0]
+                    if cost <= pc:
+                        actions.append((DECLARE, office_id, 0))
+                        if pc > cost:
+                            actions.append((DECLARE, office_id, min(10, pc - cost)))
+        for favor_id in self.favors[pid]:
+            if favor_id in TARGETED_FAVORS:
+                actions.extend((FAVOR, favor_id, other) for other in range(self.n) if other != pid)
+            else:
+                actions.append((FAVOR, favor_id, -1))
+        if self.bills and pc > 0:
+            for bill in self.bills:
+                for amount in COMMITMENT_AMOUNTS:
+                    if pc >= amount:
+                        actions.append((SUPPORT, bill[0], amount))
+            for bill in self.bills:
+                for amount in COMMITMENT_AMOUNTS:
+                    if pc >= amount:
+                        actions.append((OPPOSE, bill[0], amount))
+        actions.append((PASS,))
+        return actions
+
+    def random_action(self, rng: random.Random) -> ActionKey:
+        """
+        Rollout policy: pick an action type uniformly, then one of its variants.
+
+        Choosing the type first keeps the many support/oppose variants from
+        drowning out everything else.
+        """
+        actions = self.legal_actions()
+        by_kind: Dict[str, List[ActionKey]] = {}
+        for action in actions:
+            by_kind.setdefault(action[0], []).append(action)
+        kinds = list(by_kind)
+        return rng.choice(by_kind[rng.choice(kinds)])
+
+    def scores(self) -> List[int]:
+        """Final-score rules of engine/scoring.py applied to the current state."""
+        totals = []
+        for pid in range(self.n):
+            office = self.office[pid]
+            total = OFFICE_INFLUENCE.get(office, 0)
+            from_pc = self.pc[pid] // 10
+            if from_pc > 0:
+                total += from_pc
+            # Only the mandates that engine/scoring.py can currently complete
+            mandate = self.mandate[pid]
+            if mandate == "PEOPLES_CHAMPION":
+                completed = self.mood >= 2
+            elif mandate in ("MINIMALIST", "OPPORTUNIST", "PRINCIPLED_LEADER"):
+                completed = office == "PRESIDENT"
+            elif mandate == "STATESMAN":
+                completed = office in ("GOVERNOR", "US_SENATOR")
+            else:
+                completed = False
+            if completed:
+                total += MANDATE_BONUS
+            totals.append(total)
+        return totals
+
+    def winner(self) -> int:
+        """Winner by engine rules: highest score, earliest seat on ties."""
+        scores = self.scores()
+        return scores.index(max(scores))
+
+    def key(self, observer: int) -> tuple:
+        """
+        Hashable key of the position as the observer sees it.
+
+        Everything determinize() resamples (opponents' mandates, hidden
+        archetypes, secret support and election commitments, deck order)
+        is left out, so the key names an information set and stays the same
+        across determinizations. Action orders that commute within a round
+        (e.g. fundraise then network vs network then fundraise) give equal keys.
+
+        Args:
+            observer: Player id whose point of view is used
+        """
+        hands = tuple(
+            tuple(sorted(hand)) if pid == observer else len(hand)
+            for pid, hand in enumerate(self.favors)
+        )
+        bills = tuple(
+            (bill[0], bill[1], bill[2].get(observer, 0), frozenset(bill[2]), tuple(sorted(bill[3].items())))
+            for bill in self.bills
+        )
+        candidacies = tuple(sorted(
+            (pid, office_id, committed if pid == observer else -1)
+            for pid, office_id, committed in self.candidacies
+        ))
+        return (
+            self.current, self.round, self.term, self.mood, tuple(self.pc), tuple(self.office),
+            tuple(self.ap), tuple(self.fundraiser_used), frozenset(self.effects), frozenset(self.gaffe),
+            self.hot_potato, hands, bills, candidacies, self.last_sponsor, len(self.deck),
+            len(self.favor_supply)
+        )
+
+    # --- Transitions ---
+
+    def apply(self, key: ActionKey) -> None:
+        """Apply a player action for the current player, then advance to the next decision."""
+        pid = self.current
+        kind = key[0]
+        ap = self.ap
+        pc = self.pc
+
+        if kind == FUNDRAISE:
+            ap[pid] -= 1
+            gain = 5
+            if self.archetype[pid] == "FUNDRAISER" and not self.fundraiser_used[pid]:
+                gain += 2
+                self.fundraiser_used[pid] = True
+            pc[pid] += gain
+        elif kind == NETWORK:
+            ap[pid] -= 1
+            pc[pid] += 2
+            self._draw_favor(pid)
+        elif kind == SPONSOR:
+            cost = self.rules.legislation[key[1]][0]
+            if pc[pid] >= cost:
+                pc[pid] -= cost
+                ap[pid] -= 2
+                self.bills.append([key[1], pid, {}, {}])
+                self.sponsored.append(key[1])
+        elif kind == DECLARE:
+            remaining = self.rules.offices[key[1]][0] - key[2]
+            if pc[pid] >= remaining:
+                ap[pid] -= 2
+                pc[pid] -= remaining
+                self.candidacies.append((pid, key[1], key[2]))
+        elif kind == FAVOR:
+            self._use_favor(pid, key[1], key[2])
+        elif kind == SUPPORT or kind == OPPOSE:
+            bill = self._bill(key[1])
+            amount = key[2]
+            if bill is not None and pc[pid] >= amount:
+                pc[pid] -= amount
+                commitments = bill[2] if kind == SUPPORT else bill[3]
+                commitments[pid] = commitments.get(pid, 0) + amount
+                ap[pid] -= 1
+        elif kind == PASS:
+            ap[pid] = 0
+
+        self._advance()
+
+    def _bill(self, leg_id: str) -> Optional[list]:
+        for bill in self.bills:
+            if bill[0] == leg_id:
+                return bill
+        return None
+
+    def _draw_favor(self, pid: int) -> None:
+        if not self.favor_supply:
+            return
+        favor_id = self.favor_supply.pop(self.rng.randrange(len(self.favor_supply)))
+        if favor_id not in NEGATIVE_FAVORS:
+            self.favors[pid].append(favor_id)
+            return
+        others = [p for p in range(self.n) if p != pid]
+        if favor_id == "POLITICAL_DEBT":
+            if others:
+                self.rng.choice(others)
+        elif favor_id == "PUBLIC_GAFFE":
+            self.gaffe.add(pid)
+        elif favor_id == "POLITICAL_HOT_POTATO":
+            if others:
+                self.hot_potato = self.rng.choice(others)
+
+    def _use_favor(self, pid: int, favor_id: str, target: int) -> None:
+        hand = self.favors[pid]
+        if favor_id not in hand:
+            return
+        if favor_id in TARGETED_FAVORS and (target < 0 or target >= self.n or target == pid):
+            return
+        self.ap[pid] -= 1
+        hand.remove(favor_id)
+
+        if favor_id == "EXTRA_FUNDRAISING":
+            self.pc[pid] += 8
+        elif favor_id == "LEGISLATIVE_INFLUENCE":
+            if self.bills:
+                support = self.bills[0][2]
+                support[pid] = support.get(pid, 0) + 5
+        elif favor_id == "MEDIA_SPIN":
+            self._mood_effect(1, 3)
+        elif favor_id == "POLITICAL_PRESSURE":
+            self.pc[target] -= 3
+        elif favor_id == "PEEK_EVENT":
+            self.pc[pid] += 5
+        elif favor_id == "PUBLIC_GAFFE":
+            self.gaffe.add(pid)
+        elif favor_id == "POLITICAL_HOT_POTATO":
+            self.hot_potato = target
+        elif favor_id not in NEGATIVE_FAVORS:
+            self.pc[pid] += 5
+
+    def _advance(self) -> None:
+        """Turn, round and term flow of SimulationHarness._advance_game_flow."""
+        if self.ap[self.current] <= 0:
+            self.current = (self.current + 1) % self.n
+        if any(ap > 0 for ap in self.ap):
+            return
+
+        self._upkeep()
+        self.round += 1
+        if self.round >= 5:
+            self.round = 4
+            self._end_term()
+        else:
+            self._draw_event()
+            self.current = 0
+
+    def _upkeep(self) -> None:
+        n = self.n
+        self.ap = [2] * n
+        mood = self.mood
+        multiplier = 2 if "UNEXPECTED_SURPLUS" in self.effects else 1
+        offices = self.rules.offices
+        for pid in range(n):
+            office = self.office[pid]
+            if office is not None:
+                self.pc[pid] += mood + offices[office][1] * multiplier
+            else:
+                self.pc[pid] -= mood
+        self.effects.discard("UNEXPECTED_SURPLUS")
+        self.effects.discard("STOCK_CRASH")
+        if self.hot_potato is not None:
+            self.pc[self.hot_potato] -= 5
+            self.hot_potato = None
+
+    def _end_term(self) -> None:
+        """Legislation session, elections and the start of the next term."""
+        # GameEngine.resolve_legislation_session runs the elections itself
+        # and always rolls dice, whatever the harness option says
+        dice = self.dice or bool(self.bills)
+        for bill in self.bills:
+            self._resolve_bill(bill)
+        self.bills = []
+        self._resolve_elections(dice)
+        self._start_next_term()
+
+    def _start_next_term(self) -> None:
+        self.term += 1
+        self.bills = []
+        self.sponsored = []
+        self.candidacies = []
+        self.current = 0
+        self._draw_event()
+        self.round = 1
+
+    def _mood_effect(self, change: int, bonus: int) -> None:
+        """engine.resolvers.apply_public_mood_effect"""
+        if "WAR_BREAKS_OUT" in self.effects:
+            change = 0
+        if change > 0:
+            self.mood = min(3, self.mood + change)
+        else:
+            self.mood = max(-3, self.mood + change)
+        for pid in range(self.n):
+            incumbent = self.office[pid] is not None
+            if (change > 0) == incumbent:
+                self.pc[pid] += bonus
+            else:
+                self.pc[pid] -= bonus
+
+    def _resolve_bill(self, bill: list) -> None:
+        leg_id, sponsor, support, oppose = bill
+        cost, success_target, crit_target, success_reward, crit_reward, penalty, mood_change = \
+            self.rules.legislation[leg_id]
+        net = sum(support.values()) - sum(oppose.values())
+        if "WAR_BREAKS_OUT" in self.effects:
+            net -= 2
+
+        if net >= crit_target:
+            outcome = "Critical Success"
+            self.pc[sponsor] += int(crit_reward * 1.5)
+        elif net >= success_target:
+            outcome = "Success"
+            self.pc[sponsor] += int(success_reward * 1.5)
+        else:
+            outcome = "Failure"
+            self.pc[sponsor] -= int(penalty * 1.5)
+        passed = outcome != "Failure"
+        if passed and mood_change > 0:
+            self._mood_effect(mood_change, 2)
+
+        winners = support if passed else oppose
+        for pid, amount in winners.items():
+            if amount >= 10:
+                self.pc[pid] += int(amount * 2.0)
+            elif amount >= 5:
+                self.pc[pid] += int(amount * 1.5)
+            else:
+                self.pc[pid] += amount
+
+        self.last_sponsor = (sponsor, passed)
+        self.history.append((sponsor, leg_id, outcome, frozenset(support)))
+
+    def _resolve_elections(self, dice: bool) -> None:
+        rng = self.rng
+        for office_id in self.rules.office_order:
+            scores: Dict[Any, int] = {}
+            for pid, cand_office, committed in self.candidacies:
+                if cand_office == office_id:
+                    scores[pid] = committed + (rng.randint(1, 6) if dice else 0)
+            if not scores:
+                continue
+            scores[None] = self.rules.offices[office_id][2] + (rng.randint(1, 6) if dice else 0)
+            winner = max(scores, key=scores.get)
+            if winner is not None:
+                self.office[winner] = office_id
+                if office_id == "PRESIDENT" and "SUPREME_COURT_VACANCY" in self.effects:
+                    self.pc[winner] += 20
+                    self.effects.discard("SUPREME_COURT_VACANCY")
+        self.candidacies = []
+
+    def _draw_event(self) -> None:
+        if not self.deck:
+            self.deck = list(self.rules.deck_original)
+            self.rng.shuffle(self.deck)
+        if not self.deck:
+            return
+        self._apply_event(self.deck.pop(0))
+
+    def _apply_event(self, effect_id: str) -> None:
+        """The event resolvers of engine/resolvers.py."""
+        pc = self.pc
+        rng = self.rng
+        n = self.n
+        if effect_id == "ECONOMIC_BOOM":
+            self._mood_effect(2, 5)
+            for pid in range(n):
+                pc[pid] += 5
+        elif effect_id == "RECESSION_HITS":
+            self._mood_effect(-2, 5)
+            for pid in range(n):
+                pc[pid] -= 5
+        elif effect_id == "SCANDAL":
+            pc[pc.index(max(pc))] -= 15
+        elif effect_id == "UNEXPECTED_SURPLUS":
+            self._mood_effect(1, 5)
+            self.effects.add("UNEXPECTED_SURPLUS")
+        elif effect_id == "LAST_BILL_DUD":
+            if self.last_sponsor and self.last_sponsor[1]:
+                pc[self.last_sponsor[0]] -= 10
+            self._mood_effect(-1, 5)
+        elif effect_id == "FOREIGN_POLICY_CRISIS":
+            pid = rng.randrange(n)
+            pc[pid] += -10 if rng.randint(1, 6) <= 3 else 10
+        elif effect_id == "SUPREME_COURT_VACANCY":
+            self.effects.add("SUPREME_COURT_VACANCY")
+        elif effect_id == "LAST_BILL_HIT":
+            if self.last_sponsor and self.last_sponsor[1]:
+                pc[self.last_sponsor[0]] += 10
+            self._mood_effect(1, 5)
+        elif effect_id == "WAR_BREAKS_OUT":
+            self.effects.add("WAR_BREAKS_OUT")
+        elif effect_id == "TECH_LEAP":
+            self._mood_effect(1, 5)
+            pc[pc.index(min(pc))] += 10
+        elif effect_id == "NATURAL_DISASTER":
+            self._mood_effect(-1, 5)
+            governors = [pid for pid in range(n) if self.office[pid] == "GOVERNOR"]
+            victim = rng.choice(governors) if governors else rng.randrange(n)
+            pc[victim] -= 10
+        elif effect_id == "MEDIA_DARLING":
+            darling = rng.randrange(n)
+            pc[darling] += 5
+            self.effects.add(f"MEDIA_DARLING_{darling}")
+        elif effect_id == "GAFFE":
+            opponents = [pid for pid in range(n) if pid != self.current]
+            if opponents:
+                pc[rng.choice(opponents)] -= 8
+        elif effect_id == "ENDORSEMENT":
+            pc[self.current] += 10
+        elif effect_id == "GRASSROOTS":
+            # Players holding the fewest offices (0 or 1) gain 10 PC
+            fewest = min(0 if office is None else 1 for office in self.office)
+            for pid in range(n):
+                if (0 if self.office[pid] is None else 1) == fewest:
+                    pc[pid] += 10
+        elif effect_id == "VOTER_APATHY":
+            if self.mood > 0:
+                self._mood_effect(-1, 5)
+            elif self.mood < 0:
+                self._mood_effect(1, 5)
+        elif effect_id == "MIDTERM_FURY":
+            if self.round in (2, 3):
+                self._mood_effect(-2, 5)
+        elif effect_id == "STOCK_CRASH":
+            self._mood_effect(-3, 5)
+            self.effects.add("STOCK_CRASH")
+        elif effect_id == "CELEB_POLITICIAN":
+            pc[pc.index(min(pc))] += 15
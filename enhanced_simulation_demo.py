@@ -126,7 +126,7 @@ def run_demo():
                 analyzer.load_results()
                 
                 metrics = analyzer.calculate_metrics()
-                print(f"  ✓ Loaded {metrics.total_games} games")
+                print(f"  ✓ Loaded {metrics.total_games} games (analysis cache: {analyzer.cache_status})")
                 print(f"  ✓ Average game length: {metrics.avg_game_length_rounds:.1f} rounds")
                 
                 # Print win rates
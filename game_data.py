@@ -7,6 +7,9 @@ from models.cards import (
     ScrutinyCard, AllianceCard
 )
 from models.components import Office, Legislation, PoliticalFavor
+from functools import lru_cache
+import hashlib
+import json
 
 def load_game_data():
     """
@@ -24,6 +27,35 @@ def load_game_data():
         "legislation": load_legislation(),
     }
 
+def build_catalog(game_data=None):
+    """
+    Returns the static game data as plain dictionaries for clients.
+
+    Every section maps card or component IDs to their to_dict() form, so that
+    per-turn state can refer to offices, bills, cards and favors by ID only.
+    """
+    game_data = game_data or load_game_data()
+    sections = {
+        "offices": game_data["offices"].values(),
+        "legislation": game_data["legislation"].values(),
+        "archetypes": game_data["archetypes"],
+        "mandates": game_data["mandates"],
+        "events": game_data["events"],
+        "scrutiny": game_data["scrutiny"],
+        "alliances": game_data["alliances"],
+        "favors": game_data["favors"],
+    }
+    return {name: {item.id: item.to_dict() for item in items} for name, items in sections.items()}
+
+@lru_cache(maxsize=1)
+def serialize_catalog():
+    """
+    Returns the catalog as JSON bytes, serialized once per process, and its
+    version: a hash of the bytes that changes only when the game data does.
+    """
+    body = json.dumps(build_catalog(), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return body, hashlib.sha256(body).hexdigest()[:16]
+
 # Appendix A: The Offices of Power
 def load_offices():
     return {
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Structured, Sampled Logging for the Game Server
+
+The engine, game session and server used to print debug lines on every
+request: the pending UI action twice per state, every choice processed,
+every deck reshuffle. Under load those stdout writes cost real time and
+serialize threads on the stream lock. This module routes them through the
+standard logging package instead:
+
+- Loggers live under the "election" namespace (get_logger(__name__)), so
+  configuring them never touches uvicorn's or other libraries' loggers.
+- Until configure_logging() is called only warnings and errors are emitted,
+  and disabled levels cost one cached level check: call sites pass %-style
+  arguments, so nothing is formatted for records that are dropped.
+- bind_context() and log_context() add fields such as the session token
+  to every record logged in the current task, including engine work it
+  hands to SessionRunner's worker threads.
+- Repeated messages are rate limited per call site, reporting how many
+  were suppressed, and debug records can be sampled.
+- Records are written as text or as one JSON object per line.
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+NAMESPACE = "election"
+
+_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default={})
+
+# Attributes every LogRecord has; anything else on a record came from extra= or the context
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger for a module, inside the game's namespace.
+
+    Args:
+        name: Usually __name__
+
+    Returns:
+        logging.Logger: The logger named "election.<name>"
+    """
+    return logging.getLogger(f"{NAMESPACE}.{name}")
+
+
+def bind_context(**fields: Any) -> contextvars.Token:
+    """
+    Add fields to every record logged from now on in this task or thread.
+
+    Returns:
+        contextvars.Token: Pass to unbind_context() to restore the previous fields
+    """
+    return _context.set({**_context.get(), **fields})
+
+
+def unbind_context(token: contextvars.Token) -> None:
+    """Restore the fields bound before the matching bind_context()."""
+    _context.reset(token)
+
+
+@contextlib.contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Add fields to every record logged inside the block (in this task or thread)."""
+    token = bind_context(**fields)
+    try:
+        yield
+    finally:
+        unbind_context(token)
+
+
+def current_context() -> Dict[str, Any]:
+    """Fields bound by the enclosing log_context() blocks."""
+    return dict(_context.get())
+
+
+class ContextFilter(logging.Filter):
+    """Copies the bound context fields onto each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per call site (logger and message template).
+
+    A call site may log a burst of records, then rate records per second.
+    The next record let through after a dry spell carries the number of
+    records dropped in between as its "suppressed" field.
+    """
+
+    def __init__(self, rate: float = 20.0, burst: int = 50, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the filter.
+
+        Args:
+            rate: Records per second allowed per call site once the burst is used
+            burst: Records a quiet call site may log at once
+            clock: Time source (monotonic seconds)
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._lock = threading.Lock()
+        # call site -> [tokens, last refill, suppressed]
+        self._buckets: Dict[Tuple[str, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, str(record.msg))
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1.0
+            suppressed, bucket[2] = bucket[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in every N records per call site at or below a level.
+
+    Sampling is by count, not at random, so a given sequence of records is
+    always sampled the same way.
+    """
+
+    def __init__(self, rate: float = 1.0, max_level: int = logging.DEBUG):
+        """
+        Initialize the filter.
+
+        Args:
+            rate: Fraction of records to keep (1.0 keeps all)
+            max_level: Records above this level are never sampled out
+        """
+        super().__init__()
+        self.every = max(1, round(1.0 / rate)) if rate > 0 else 0
+        self.max_level = max_level
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, str], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        if self.every == 0:
+            return False
+        key = (record.name, str(record.msg))
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % self.every == 0
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, then context and extra fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(_extra_fields(record))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Readable lines with context and extra fields appended as key=value."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+_handler: Optional[logging.Handler] = None
+
+
+def configure_logging(level: Optional[str] = None,
+                      fmt: Optional[str] = None,
+                      debug_sample_rate: Optional[float] = None,
+                      rate_limit: Optional[float] = None,
+                      burst: Optional[int] = None,
+                      stream=None) -> logging.Handler:
+    """
+    Send the game's log records to a stream; calling it again replaces the previous setup.
+
+    Arguments left as None come from the environment: LOG_LEVEL (INFO),
+    LOG_FORMAT ("text" or "json"), LOG_DEBUG_SAMPLE (1.0), LOG_RATE_LIMIT
+    (20 records per second per call site, 0 disables) and LOG_RATE_BURST (50).
+
+    Args:
+        level: Minimum level name, e.g. "DEBUG"
+        fmt: "text" or "json"
+        debug_sample_rate: Fraction of debug records to keep
+        rate_limit: Records per second per call site
+        burst: Records a quiet call site may log at once
+        stream: Output stream (stderr by default)
+
+    Returns:
+        logging.Handler: The installed handler
+    """
+    global _handler
+    level = (level or os.environ.get("LOG_LEVEL", "INFO")).upper()
+    fmt = fmt or os.environ.get("LOG_FORMAT", "text")
+    debug_sample_rate = debug_sample_rate if debug_sample_rate is not None else float(os.environ.get("LOG_DEBUG_SAMPLE", 1.0))
+    rate_limit = rate_limit if rate_limit is not None else float(os.environ.get("LOG_RATE_LIMIT", 20))
+    burst = burst if burst is not None else int(os.environ.get("LOG_RATE_BURST", 50))
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+    handler.addFilter(ContextFilter())
+    if debug_sample_rate < 1.0:
+        handler.addFilter(SamplingFilter(debug_sample_rate))
+    if rate_limit > 0:
+        handler.addFilter(RateLimitFilter(rate_limit, burst))
+
+    logger = logging.getLogger(NAMESPACE)
+    if _handler is not None:
+        logger.removeHandler(_handler)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    _handler = handler
+    return handler
@@ -7,7 +7,7 @@ acting as a self-contained, headless engine. It is designed to be controlled by
 external interface, such as a web server, without containing any I/O itself.
 """
 
-from typing import List, Optional, Dict, Any, Type
+from typing import List, Optional, Dict, Any, Type, Tuple
 from engine.engine import GameEngine
 from models.game_state import GameState
 from engine.actions import (
@@ -16,16 +16,30 @@ from engine.actions import (
     ActionResolveElections, ActionAcknowledgeResults
 )
 from engine import resolvers
-from game_data import load_game_data
+from game_data import load_game_data, serialize_catalog
 from personas.base_persona import BasePersona
 from personas.random_persona import RandomPersona
 from personas.economic_persona import EconomicPersona
 from personas.legislative_persona import LegislativePersona
 from personas.balanced_persona import BalancedPersona
 from personas.heuristic_persona import HeuristicPersona
+from agent_profiler import ProfiledAgent, LatencyRegistry
+from metrics import ACTION_SECONDS
 from engine.actions import ActionPassTurn, ACTION_CLASSES
 import json
+import pickle
+import time
 from fastapi.responses import FileResponse
+from game_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Decision latency of every session's AI players, by persona type
+AI_LATENCY = LatencyRegistry()
+
+# Bumped whenever GameState changes in a way old snapshots cannot be loaded into
+SNAPSHOT_VERSION = 1
 
 
 class GameSession:
@@ -33,12 +47,18 @@ class GameSession:
     Manages a single game session, including the game state, players, 
     and the interaction between the core game engine and a client.
     """
+    # Wall-clock seconds the heuristic AI may spend on rollouts per decision
+    AI_ROLLOUT_TIME_LIMIT = 0.05
+    # Hard per-decision budget for any AI; slower decisions fall back to a cheap default
+    AI_DECISION_BUDGET = 0.5
+
     def __init__(self):
         self.engine = GameEngine(load_game_data())
         self.state: Optional[GameState] = None
         self.human_player_id: int = 0
         self.ai_opponents: List[BasePersona] = []
         self.pending_ui_action: Optional[Dict[str, Any]] = None
+        self.last_ai_action: Optional[Action] = None
 
     def start_game(self, human_name: str = "Human", num_ai: int = 3):
         """
@@ -47,19 +67,58 @@ class GameSession:
         player_names = [human_name] + [f"AI-{i+1}" for i in range(num_ai)]
         self.state = self.engine.start_new_game(player_names)
         self.human_player_id = self.state.players[0].id
-
-        # Create AI opponents
-        self.ai_opponents = [
-            RandomPersona(),
-            EconomicPersona(),
-            LegislativePersona(),
-            BalancedPersona(),
-            HeuristicPersona()
-        ]
+        self.ai_opponents = self._create_ai_opponents()
 
         # Immediately run the first event phase to properly set up the game
         self.state = self._run_event_phase(self.state)
 
+    def _create_ai_opponents(self) -> List[BasePersona]:
+        """
+        Create this session's AI opponents, profiled into the server-wide latency stats.
+
+        They take seats AI-1, AI-2, ... in order; start_game() seats three by default.
+        """
+        return [
+            ProfiledAgent(persona, self.AI_DECISION_BUDGET, registry=AI_LATENCY)
+            for persona in [
+                HeuristicPersona(rollout_time_limit=self.AI_ROLLOUT_TIME_LIMIT),
+                EconomicPersona(),
+                LegislativePersona(),
+                BalancedPersona(),
+                RandomPersona()
+            ]
+        ]
+
+    def to_snapshot(self) -> bytes:
+        """
+        Serialize the game so that from_snapshot() can resume it, e.g. after a
+        server restart. AI opponents are recreated on resume rather than saved.
+        """
+        return pickle.dumps({
+            "version": SNAPSHOT_VERSION,
+            "state": self.state,
+            "human_player_id": self.human_player_id,
+            "pending_ui_action": self.pending_ui_action
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> 'GameSession':
+        """
+        Resume a game saved by to_snapshot().
+
+        Raises:
+            ValueError: If the snapshot was written by an incompatible version
+        """
+        snapshot = pickle.loads(data)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported session snapshot version: {snapshot.get('version')}")
+        session = cls()
+        session.state = snapshot["state"]
+        session.human_player_id = snapshot["human_player_id"]
+        session.pending_ui_action = snapshot["pending_ui_action"]
+        session.ai_opponents = session._create_ai_opponents()
+        return session
+
     def _run_event_phase(self, state: GameState) -> GameState:
         """Draws an event card and resolves it using the resolver module."""
         state.clear_turn_log()
@@ -141,7 +200,9 @@ class GameSession:
         if not self.state:
             return {"error": "Game not started."}
 
-        state_dict = self.state.to_dict()
+        # Offices, bills and card texts never change; clients look them up in GET /catalog
+        state_dict = self.state.to_dict(include_static=False)
+        state_dict['catalog_version'] = serialize_catalog()[1]
         state_dict['log'] = list(self.state.turn_log)
         state_dict['is_game_over'] = self.is_game_over()
 
@@ -163,8 +224,7 @@ class GameSession:
              state_dict['prompt'] = self.state.pending_ui_action.get('prompt')
              state_dict['options'] = self.state.pending_ui_action.get('options')
              state_dict['expects_input'] = self.state.pending_ui_action.get('expects_input')
-             print(f"DEBUG: pending_ui_action = {self.state.pending_ui_action}")
-             print(f"DEBUG: expects_input = {self.state.pending_ui_action.get('expects_input')}")
+             logger.debug("Pending UI action: %s", self.state.pending_ui_action)
 
         return state_dict
 
@@ -179,21 +239,20 @@ class GameSession:
             if self.state and self.state.pending_ui_action and 'choice' in action_data:
                 pending_action_info = self.state.pending_ui_action
                 next_action_type = pending_action_info.get('next_action')
-                print(f"Processing choice: {action_data['choice']} for action type: {next_action_type}")
+                logger.debug("Processing choice %s for action type %s", action_data['choice'], next_action_type)
                 
                 if next_action_type:
                     action_class = ACTION_CLASSES.get(next_action_type)
                     if action_class:
                         if pending_action_info.get('expects_input') == 'amount':
-                            print(f"Creating amount action: {next_action_type} with amount {action_data['choice']}")
+                            logger.debug("Creating amount action %s with amount %s", next_action_type, action_data['choice'])
                             action_to_execute = action_class(player_id=self.human_player_id, amount=action_data['choice'])
                         else:
                             # For choice-based actions (like legislation selection), use the choice parameter
-                            print(f"Creating choice action: {next_action_type} with choice {action_data['choice']}")
+                            logger.debug("Creating choice action %s with choice %s", next_action_type, action_data['choice'])
                             
                             # Special handling for ActionSubmitOfficeChoice - no longer needs committed_pc
                             if next_action_type == 'ActionSubmitOfficeChoice':
-                                print(f"Creating ActionSubmitOfficeChoice with choice {action_data['choice']}")
                                 action_to_execute = action_class(
                                     player_id=self.human_player_id, 
                                     choice=action_data['choice']
@@ -201,7 +260,7 @@ class GameSession:
                             else:
                                 action_to_execute = action_class(player_id=self.human_player_id, choice=action_data['choice'])
                     else:
-                        print(f"Action class not found for: {next_action_type}")
+                        logger.warning("Action class not found for: %s", next_action_type)
             else:
                 # Ensure player_id is included for actions that need it
                 if 'player_id' not in action_data:
@@ -209,9 +268,7 @@ class GameSession:
                 action_to_execute = self.engine.action_from_dict(action_data)
 
         except Exception as e:
-            print(f"Error creating action from dict: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Error creating action from dict: %s", e, exc_info=True)
 
         if action_to_execute:
             self._execute_action(action_to_execute)
@@ -226,40 +283,82 @@ class GameSession:
         Selects and executes a single action for the current AI player,
         advances the game flow, and returns the log. Does not loop.
         """
-        if self.is_game_over() or self.is_human_turn():
+        decision = self.pending_ai_decision()
+        if decision is None:
             return []
 
+        persona, valid_actions = decision
+        action = persona.choose_action(self.state, valid_actions) if valid_actions else None
+        return self.apply_ai_action(action)
+
+    def run_ai_turns(self, max_moves: int = 200) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Play AI turns until it is the human's turn or the game ends.
+
+        Args:
+            max_moves: Safety limit on the number of AI moves
+
+        Returns:
+            One (move, client_state) pair per AI move: who moved and with
+            which action, and get_state_for_client() right after the move.
+        """
+        frames = []
+        while len(frames) < max_moves and not self.is_human_turn() and not self.is_game_over():
+            mover = self.state.get_current_player()
+            move = {"player_id": mover.id, "player_name": mover.name}
+            self.last_ai_action = None
+            self.process_ai_turn()
+            move["action"] = self.last_ai_action.to_dict() if self.last_ai_action else None
+            frames.append((move, self.get_state_for_client()))
+        return frames
+
+    def pending_ai_decision(self) -> Optional[Tuple[BasePersona, List[Action]]]:
+        """
+        Return the persona and valid actions for the AI player to move, if any.
+
+        Together with apply_ai_action() this splits process_ai_turn() into
+        deciding and applying.
+
+        Returns:
+            (persona, valid_actions), or None if the game is over or it is
+            the human's turn. An empty action list means the AI must pass.
+        """
+        if self.is_game_over() or self.is_human_turn():
+            return None
+
         current_player = self.state.get_current_player()
         persona = self.ai_opponents[current_player.id - 1]
-        
         if current_player.action_points <= 0:
-            action = ActionPassTurn(player_id=current_player.id)
-        else:
-            valid_actions = self.engine.get_valid_actions(self.state, current_player.id)
-            if not valid_actions:
-                action = ActionPassTurn(player_id=current_player.id)
-            else:
-                action = persona.choose_action(self.state, valid_actions)
-                if not action:
-                    action = ActionPassTurn(player_id=current_player.id)
+            return persona, []
+        return persona, self.engine.get_valid_actions(self.state, current_player.id)
+
+    def apply_ai_action(self, action: Optional[Action]) -> List[str]:
+        """Execute an AI decision (None passes the turn), advance the game flow and return the log."""
+        if self.is_game_over() or self.is_human_turn():
+            return []
 
+        if not action:
+            action = ActionPassTurn(player_id=self.state.get_current_player().id)
+        self.last_ai_action = action
         self._execute_action(action)
-        
+
         if self.state:
             self.state = self._advance_game_flow(self.state)
-            
+
         return list(self.state.turn_log) if self.state else []
 
     def _execute_action(self, action: Action):
         """Processes a single, concrete action through the engine."""
         if not self.state or self.is_game_over():
             return
+        started = time.perf_counter()
         try:
             self.state = self.engine.process_action(self.state, action)
         except Exception as e:
-            print(f"Error executing action '{action.to_dict().get('action_type')}': {e}")
+            logger.error("Error executing action '%s': %s", action.__class__.__name__, e)
             # The engine should handle logging this error to the game state
             # self.state.add_log(f"Error: {e}")
+        ACTION_SECONDS.observe(time.perf_counter() - started, action.__class__.__name__)
 
     def is_human_turn(self) -> bool:
         if not self.state: return False
@@ -267,4 +366,4 @@ class GameSession:
 
     def is_game_over(self) -> bool:
         if not self.state: return True
-        return self.engine.is_game_over(self.state) 
\ No newline at end of file
+        return self.engine.is_game_over(self.state)
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Websocket Load Test for the Game Server
+
+Starts server.py locally (or targets a running server with --url) and runs
+N simulated clients against /ws. Each client plays full games the way the
+browser does: it applies snapshot, patch and batch messages to its copy of
+the state, acknowledges AI turns, answers prompts and otherwise picks a
+random entry from valid_actions.
+
+The report covers throughput (games, messages and actions per second),
+round-trip latency percentiles by the type of message that answered the
+client, error rates, and the server's resident memory and connected
+sessions over time as scraped from GET /metrics. Everything runs on
+localhost, so it works in CI without network access.
+
+Usage:
+    python load_test.py --clients 50 --games 2 --pacing batch
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+import websockets
+
+from quantile_sketch import KLLSketch
+from state_delta import RESYNC_ACTION, apply_patch
+
+PERCENTILES = (0.5, 0.95, 0.99)
+AMOUNT_RANGE = re.compile(r"\((\d+)-(\d+)\)")
+
+
+class LoadStats:
+    """
+    Counters, latency sketches and memory samples shared by all clients.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.games_completed = 0
+        self.games_failed = 0
+        self.messages_received = 0
+        self.actions_sent = 0
+        self.server_errors = 0
+        self.resyncs = 0
+        self.failures: Dict[str, int] = {}
+        self.latency: Dict[str, KLLSketch] = {}
+        self.memory: List[Dict[str, float]] = []
+
+    def record_latency(self, message_type: str, seconds: float) -> None:
+        """Record the time from a client's message to the server's answer."""
+        sketch = self.latency.get(message_type)
+        if sketch is None:
+            sketch = self.latency[message_type] = KLLSketch()
+        sketch.update(seconds)
+
+    def record_failure(self, reason: str) -> None:
+        """Record a game that ended without reaching game over."""
+        self.games_failed += 1
+        self.failures[reason] = self.failures.get(reason, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summary of the run.
+
+        Returns:
+            Dict[str, Any]: Totals, per-second rates, latency percentiles in
+                milliseconds by message type, error rates and memory samples
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        games = self.games_completed + self.games_failed
+        latency = {}
+        for message_type, sketch in sorted(self.latency.items()):
+            quantiles = sketch.quantiles(list(PERCENTILES))
+            latency[message_type] = {'count': sketch.count}
+            latency[message_type].update(
+                {f"p{int(q * 100)}_ms": quantiles[q] * 1000 for q in PERCENTILES})
+        memory = [sample['resident_bytes'] for sample in self.memory if 'resident_bytes' in sample]
+        return {
+            'elapsed_seconds': elapsed,
+            'games_completed': self.games_completed,
+            'games_failed': self.games_failed,
+            'messages_received': self.messages_received,
+            'actions_sent': self.actions_sent,
+            'games_per_second': self.games_completed / elapsed if elapsed else 0.0,
+            'messages_per_second': self.messages_received / elapsed if elapsed else 0.0,
+            'actions_per_second': self.actions_sent / elapsed if elapsed else 0.0,
+            'game_error_rate': self.games_failed / games if games else 0.0,
+            'server_error_messages': self.server_errors,
+            'resyncs': self.resyncs,
+            'failures': dict(self.failures),
+            'latency': latency,
+            'peak_resident_bytes': max(memory) if memory else None,
+            'memory_samples': list(self.memory)
+        }
+
+
+def choose_reply(state: Dict[str, Any], rng: random.Random) -> Optional[Dict[str, Any]]:
+    """
+    The message a player would send in answer to a state, if any.
+
+    Args:
+        state: The client's current state
+        rng: Source of the random choices
+
+    Returns:
+        Optional[Dict[str, Any]]: An acknowledgement, a prompt answer or a
+            random valid action; None while the server is playing AI turns
+    """
+    if state.get('awaiting_acknowledgement'):
+        return {"action_type": "AcknowledgeAITurn"}
+    human = next((p for p in state.get('players', []) if p.get('name') == "Human"), None)
+    if human is None or state.get('current_player_index') != human.get('id'):
+        return None
+    if state.get('prompt'):
+        if state.get('expects_input') == 'amount':
+            # Prompts state the allowed range, e.g. "How much PC? (1-13)"
+            bounds = AMOUNT_RANGE.search(state['prompt'])
+            low, high = (int(bounds.group(1)), int(bounds.group(2))) if bounds else (0, human.get('pc', 0))
+            return {"choice": rng.randint(low, max(low, high))}
+        options = state.get('options') or []
+        if options:
+            return {"choice": rng.choice(options).get('id')}
+    actions = state.get('valid_actions') or []
+    if actions:
+        return dict(rng.choice(actions))
+    return {"action_type": "ActionPassTurn", "player_id": human.get('id')}
+
+
+async def play_game(ws_url: str, stats: LoadStats, rng: random.Random,
+                    max_steps: int = 2000, timeout: float = 30.0) -> None:
+    """
+    Play one game over a new websocket connection.
+
+    Args:
+        ws_url: Websocket URL including the pacing query parameter
+        stats: Shared statistics to record into
+        rng: Source of the client's random choices
+        max_steps: Messages to send before the game counts as stalled
+        timeout: Seconds to wait for any one server message
+    """
+    state: Optional[Dict[str, Any]] = None
+    seq = 0
+    steps = 0
+    sent_at = time.perf_counter()
+    try:
+        async with websockets.connect(ws_url, max_size=None) as websocket:
+            while True:
+                try:
+                    raw = await asyncio.wait_for(websocket.recv(), timeout)
+                except websockets.ConnectionClosed:
+                    stats.record_failure("closed before game over")
+                    return
+                message = json.loads(raw)
+                stats.messages_received += 1
+                message_type = message.get('type', 'error' if 'error' in message else 'unknown')
+                stats.record_latency(message_type, time.perf_counter() - sent_at)
+
+                if 'error' in message:
+                    stats.server_errors += 1
+                    stats.record_failure("server error")
+                    return
+                if message_type == "session":
+                    continue
+                if message_type == "snapshot":
+                    state = message['state']
+                elif state is None or message.get('base') != seq:
+                    # Missed a message: ask for a snapshot instead of applying a patch to the wrong base
+                    stats.resyncs += 1
+                    sent_at = time.perf_counter()
+                    await websocket.send(json.dumps({"action_type": RESYNC_ACTION}))
+                    continue
+                elif message_type == "patch":
+                    state = apply_patch(state, message['ops'])
+                else:
+                    for frame in message['frames']:
+                        state = apply_patch(state, frame['ops'])
+                seq = message['seq']
+
+                if state.get('game_over'):
+                    stats.games_completed += 1
+                    return
+                reply = choose_reply(state, rng)
+                if reply is None:
+                    continue
+                steps += 1
+                if steps > max_steps:
+                    stats.record_failure("stalled")
+                    return
+                sent_at = time.perf_counter()
+                await websocket.send(json.dumps(reply))
+                stats.actions_sent += 1
+    except asyncio.TimeoutError:
+        stats.record_failure("timeout")
+    except (OSError, websockets.WebSocketException, ValueError, KeyError) as e:
+        stats.record_failure(type(e).__name__)
+
+
+async def run_client(ws_url: str, stats: LoadStats, seed: int, games: int,
+                     max_steps: int, timeout: float) -> None:
+    """Play games one after another as a single simulated player."""
+    rng = random.Random(seed)
+    for _ in range(games):
+        await play_game(ws_url, stats, rng, max_steps, timeout)
+
+
+def parse_metrics(text: str) -> Dict[str, float]:
+    """
+    Unlabelled samples from a Prometheus text exposition.
+
+    Args:
+        text: GET /metrics response body
+
+    Returns:
+        Dict[str, float]: Metric name -> value, for lines without labels
+    """
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#") or "{" in line:
+            continue
+        parts = line.split()
+        if len(parts) == 2:
+            try:
+                samples[parts[0]] = float(parts[1])
+            except ValueError:
+                continue
+    return samples
+
+
+async def sample_server(base_url: str, stats: LoadStats, interval: float, stop: asyncio.Event) -> None:
+    """Scrape the server's memory and connected sessions every interval until stopped."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=5.0) as client:
+        while True:
+            try:
+                response = await client.get("/metrics")
+                samples = parse_metrics(response.text)
+                sample = {'seconds': time.perf_counter() - stats.started}
+                if 'election_process_resident_memory_bytes' in samples:
+                    sample['resident_bytes'] = samples['election_process_resident_memory_bytes']
+                if 'election_connected_sessions' in samples:
+                    sample['connected_sessions'] = samples['election_connected_sessions']
+                stats.memory.append(sample)
+            except httpx.HTTPError as e:
+                print(f"Could not scrape server metrics: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+
+async def run_load_test(base_url: str,
+                        clients: int = 10,
+                        games: int = 1,
+                        pacing: str = "batch",
+                        seed: int = 0,
+                        max_steps: int = 2000,
+                        timeout: float = 30.0,
+                        sample_interval: float = 1.0) -> Dict[str, Any]:
+    """
+    Run simulated clients against a server and summarize the run.
+
+    Args:
+        base_url: Server URL, e.g. http://127.0.0.1:5001
+        clients: Number of concurrent clients
+        games: Games each client plays in sequence
+        pacing: AI pacing mode the clients request ("batch" or "acknowledge")
+        seed: Seed for the clients' random choices
+        max_steps: Messages per game before it counts as stalled
+        timeout: Seconds to wait for any one server message
+        sample_interval: Seconds between memory samples
+
+    Returns:
+        Dict[str, Any]: See LoadStats.to_dict
+    """
+    ws_url = base_url.replace("http", "ws", 1).rstrip("/") + f"/ws?pacing={pacing}"
+    stats = LoadStats()
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_server(base_url, stats, sample_interval, stop))
+    await asyncio.gather(*(run_client(ws_url, stats, seed + i, games, max_steps, timeout)
+                           for i in range(clients)))
+    stats.finished = time.perf_counter()
+    stop.set()
+    await sampler
+    return stats.to_dict()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def local_server(max_sessions: int = 200, env: Optional[Dict[str, str]] = None,
+                 startup_timeout: float = 30.0) -> Iterator[str]:
+    """
+    Run server.py in a subprocess on a free localhost port.
+
+    The server gets a throwaway session database and no AI move delay; its
+    output goes to a temporary log file that is echoed if it fails to start.
+
+    Args:
+        max_sessions: Connected-session cap for the server
+        env: Extra environment variables for the server
+        startup_timeout: Seconds to wait for the server to answer
+
+    Yields:
+        str: The server's base URL
+    """
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as workdir:
+        server_env = dict(os.environ, SESSION_DB=os.path.join(workdir, "sessions.db"),
+                          MAX_SESSIONS=str(max_sessions), AI_MOVE_DELAY_MS="0", **(env or {}))
+        log_path = os.path.join(workdir, "server.log")
+        with open(log_path, "w") as log:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1",
+                 "--port", str(port), "--log-level", "warning"],
+                cwd=os.path.dirname(os.path.abspath(__file__)), env=server_env,
+                stdout=log, stderr=subprocess.STDOUT)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            deadline = time.monotonic() + startup_timeout
+            while True:
+                try:
+                    httpx.get(base_url + "/metrics", timeout=1.0)
+                    break
+                except httpx.HTTPError:
+                    if process.poll() is not None or time.monotonic() > deadline:
+                        with open(log_path) as log:
+                            print(log.read())
+                        raise RuntimeError("Game server did not start")
+                    time.sleep(0.1)
+            yield base_url
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a run_load_test() report."""
+    lines = [
+        f"Games: {report['games_completed']} completed, {report['games_failed']} failed "
+        f"({report['game_error_rate']:.1%} error rate) in {report['elapsed_seconds']:.1f}s",
+        f"Throughput: {report['games_per_second']:.2f} games/s, "
+        f"{report['messages_per_second']:.1f} messages/s, {report['actions_per_second']:.1f} actions/s",
+    ]
+    if report['failures']:
+        lines.append("Failures: " + ", ".join(f"{reason} x{count}" for reason, count in report['failures'].items()))
+    lines.append(f"Server error messages: {report['server_error_messages']}, resyncs: {report['resyncs']}")
+    lines.append("")
+    lines.append(f"{'Message':<12} {'count':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    lines.append("-" * 51)
+    for message_type, stats in report['latency'].items():
+        lines.append(f"{message_type:<12} {stats['count']:>8} {stats['p50_ms']:>9.2f} "
+                     f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}")
+    if report['memory_samples']:
+        lines.append("")
+        lines.append(f"{'t (s)':>7} {'RSS MB':>9} {'connected':>10}")
+        for sample in report['memory_samples']:
+            rss = sample.get('resident_bytes')
+            lines.append(f"{sample['seconds']:>7.1f} {rss / 2 ** 20 if rss else float('nan'):>9.1f} "
+                         f"{sample.get('connected_sessions', 0):>10.0f}")
+    return "\n".join(lines)
+
+
+def main():
+    """Main entry point for the load test."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Load test the game server with simulated websocket clients')
+    parser.add_argument('--clients', type=int, default=10, help='Concurrent simulated clients')
+    parser.add_argument('--games', type=int, default=1, help='Games per client')
+    parser.add_argument('--pacing', choices=['batch', 'acknowledge'], default='batch')
+    parser.add_argument('--url', help='Target a running server instead of starting one')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-steps', type=int, default=2000, help='Messages per game before it counts as stalled')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Seconds to wait for a server message')
+    parser.add_argument('--sample-interval', type=float, default=1.0, help='Seconds between memory samples')
+    parser.add_argument('--output', help='Also write the report as JSON to this file')
+    parser.add_argument('--max-error-rate', type=float, default=None,
+                        help='Exit with status 1 if the game error rate exceeds this (for CI)')
+    args = parser.parse_args()
+
+    def run(base_url):
+        return asyncio.run(run_load_test(base_url, args.clients, args.games, args.pacing, args.seed,
+                                         args.max_steps, args.timeout, args.sample_interval))
+
+    if args.url:
+        report = run(args.url)
+    else:
+        with local_server(max_sessions=max(200, args.clients)) as base_url:
+            print(f"Started server at {base_url}")
+            report = run(base_url)
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+    if args.max_error_rate is not None and report['game_error_rate'] > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Server Metrics in Prometheus Text Format
+
+Minimal, dependency-free histograms and gauges for the server's hot paths:
+engine action processing, AI decisions, state serialization, payload sizes
+and websocket sends. An observation is a bisect into fixed buckets under a
+per-metric lock, cheap enough to leave on permanently. METRICS.render()
+produces the Prometheus text exposition format served at GET /metrics.
+"""
+
+import bisect
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from game_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bucket upper bounds (seconds) for engine and server latencies
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Bucket upper bounds (bytes) for message sizes
+SIZE_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class Histogram:
+    """
+    A histogram with fixed buckets, optionally split by label values.
+    """
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS,
+                 label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        # label values -> [bucket counts..., +Inf count], sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one observation for the given label values (in label_names order)."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def collect(self) -> List[str]:
+        """Exposition lines for this histogram."""
+        with self._lock:
+            series = {labels: (list(counts), total[0]) for labels, (counts, total) in self._series.items()}
+        return histogram_lines(self.name, self.help_text, self.buckets, self.label_names, series)
+
+
+def histogram_lines(name: str, help_text: str, buckets: Sequence[float], label_names: Sequence[str],
+                    series: Dict[Tuple[str, ...], Tuple[List[int], float]]) -> List[str]:
+    """
+    Exposition lines of a histogram family.
+
+    Args:
+        name: Metric name
+        help_text: HELP text
+        buckets: Bucket upper bounds
+        label_names: Label names
+        series: Label values -> (per-bucket counts including +Inf last, sum)
+
+    Returns:
+        List[str]: HELP, TYPE, and _bucket/_sum/_count lines for every series
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for label_values, (counts, total) in sorted(series.items()):
+        cumulative = 0
+        for bound, count in zip(list(buckets) + [float("inf")], counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else _format_bound(bound)
+            bucket_labels = _format_labels(label_names, label_values, 'le="' + le + '"')
+            lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+        labels = _format_labels(label_names, label_values)
+        lines.append(f"{name}_sum{labels} {total}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+    return lines
+
+
+class Gauge:
+    """
+    A single value, either set directly (inc/dec/set) or sampled from a function at scrape time.
+    """
+
+    def __init__(self, name: str, help_text: str, func: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.help_text = help_text
+        self.func = func
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def value(self) -> float:
+        if self.func is not None:
+            return self.func()
+        with self._lock:
+            return self._value
+
+    def collect(self) -> List[str]:
+        try:
+            value = self.value()
+        except Exception as e:
+            logger.warning("Could not sample gauge %s: %s", self.name, e)
+            return []
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge", f"{self.name} {value}"]
+
+
+class MetricsRegistry:
+    """
+    Named metrics plus collector functions, rendered together for a scrape.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], List[str]]] = []
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS,
+                  label_names: Sequence[str] = ()) -> Histogram:
+        """Create (or return the existing) histogram with this name."""
+        return self._register(name, lambda: Histogram(name, help_text, buckets, label_names))
+
+    def gauge(self, name: str, help_text: str, func: Optional[Callable[[], float]] = None) -> Gauge:
+        """Create (or return the existing) gauge with this name; func replaces a previous sampler."""
+        gauge = self._register(name, lambda: Gauge(name, help_text, func))
+        if func is not None:
+            gauge.func = func
+        return gauge
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        """Add a function that returns extra exposition lines at every scrape."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, name: str, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+
+def process_resident_bytes() -> float:
+    """Current resident memory of this process (peak resident memory where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# Process-wide registry and the hot-path metrics
+METRICS = MetricsRegistry()
+
+ACTION_SECONDS = METRICS.histogram(
+    "election_action_processing_seconds", "Time the engine takes to process an action.",
+    label_names=("action_type",))
+SERIALIZATION_SECONDS = METRICS.histogram(
+    "election_state_serialization_seconds", "Time to build and encode a state message.",
+    label_names=("message_type",))
+PAYLOAD_BYTES = METRICS.histogram(
+    "election_message_payload_bytes", "Size of messages sent to clients.", SIZE_BUCKETS,
+    label_names=("message_type",))
+WEBSOCKET_SEND_SECONDS = METRICS.histogram(
+    "election_websocket_send_seconds", "Time to hand a message to the websocket.")
+ENGINE_QUEUED = METRICS.gauge(
+    "election_engine_queued_tasks", "Engine calls waiting for a worker thread.")
+METRICS.gauge("election_process_resident_memory_bytes", "Resident memory of the server process.",
+              process_resident_bytes)
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Callable
 import random
+from game_logging import get_logger
+
+logger = get_logger(__name__)
 
 # --- Base Classes ---
 
@@ -76,7 +79,7 @@ class Deck:
     def draw(self) -> Optional[Card]:
         """Draws a card from the top of the deck."""
         if self.is_empty():
-            print("Deck is empty. Reshuffling from discard...")
+            logger.debug("Deck is empty. Reshuffling from discard...")
             self.reshuffle_from_discard()
         
         return self.cards.pop(0) if self.cards else None
@@ -85,7 +88,7 @@ class Deck:
         """Resets the deck with its original cards and shuffles it."""
         self.cards = list(self._original_cards)
         self.shuffle()
-        print("Deck has been reshuffled.")
+        logger.debug("Deck has been reshuffled.")
 
     def is_empty(self) -> bool:
         """Checks if the deck is empty."""
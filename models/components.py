@@ -96,7 +96,27 @@ class Player:
     favors: List[PoliticalFavor] = field(default_factory=list)
     fundraiser_bonus_used: bool = False
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_static: bool = True) -> Dict[str, Any]:
+        """
+        Converts the Player to a JSON-serializable dictionary.
+
+        With include_static=False cards, offices and favors are referenced by
+        ID (archetype_id, mandate_id, current_office_id, ally_ids, favor_ids)
+        instead of being serialized in full.
+        """
+        if not include_static:
+            return {
+                "id": self.id, "name": self.name,
+                "archetype_id": self.archetype.id if self.archetype else None,
+                "mandate_id": self.mandate.id if self.mandate else None,
+                "pc": self.pc,
+                "action_points": self.action_points,
+                "current_office_id": self.current_office.id if self.current_office else None,
+                "ally_ids": [ally.id for ally in self.allies],
+                "favor_ids": [favor.id for favor in self.favors],
+                "is_incumbent": self.is_incumbent,
+                "fundraiser_bonus_used": self.fundraiser_bonus_used
+            }
         return {
             "id": self.id, "name": self.name,
             "archetype": self.archetype.to_dict() if self.archetype else None,
@@ -102,12 +102,15 @@ class GameState:
     pending_ui_action: Optional[Dict[str, Any]] = field(default_factory=dict)
     next_action_to_process: Optional[Action] = None
     
-    def to_dict(self):
-        """Converts the entire game state to a JSON-serializable dictionary."""
-        return {
-            "players": [p.to_dict() for p in self.players],
-            "offices": {oid: o.to_dict() for oid, o in self.offices.items()},
-            "legislation_options": {lid: l.to_dict() for lid, l in self.legislation_options.items()},
+    def to_dict(self, include_static: bool = True):
+        """
+        Converts the entire game state to a JSON-serializable dictionary.
+
+        With include_static=False the offices and legislation options are left
+        out and players reference their cards by ID (see game_data.build_catalog).
+        """
+        data = {
+            "players": [p.to_dict(include_static) for p in self.players],
             "term_legislation": [leg.to_dict() for leg in self.term_legislation],
             "round_marker": self.round_marker,
             "term_counter": self.term_counter,
@@ -124,6 +127,10 @@ class GameState:
             "last_election_results": self.last_election_results,
             "pending_ui_action": self.pending_ui_action
         }
+        if include_static:
+            data["offices"] = {oid: o.to_dict() for oid, o in self.offices.items()}
+            data["legislation_options"] = {lid: l.to_dict() for lid, l in self.legislation_options.items()}
+        return data
 
     def get_current_player(self) -> Player:
         """Returns the player whose turn it is."""
@@ -11,6 +11,9 @@ from .legislative_persona import LegislativePersona
 from .balanced_persona import BalancedPersona
 from .random_persona import RandomPersona
 from .heuristic_persona import HeuristicPersona
+from .mcts_persona import MCTSPersona
+from .weighted_persona import WeightedPersona
+from .belief_persona import BeliefPersona
 
 __all__ = [
     'BasePersona',
@@ -18,5 +21,8 @@ __all__ = [
     'LegislativePersona',
     'BalancedPersona',
     'RandomPersona',
-    'HeuristicPersona'
+    'HeuristicPersona',
+    'MCTSPersona',
+    'WeightedPersona',
+    'BeliefPersona'
 ] 
\ No newline at end of file
@@ -28,6 +28,19 @@ class BalancedPersona(BasePersona):
     based on game state.
     """
     
+    # Priority levels (higher = more preferred)
+    ACTION_PRIORITIES = {
+        ActionFundraise: 80,             # High priority - economic foundation
+        ActionNetwork: 75,               # High priority - economic + favor
+        ActionSponsorLegislation: 70,    # High priority - core gameplay
+        ActionSupportLegislation: 60,    # Medium priority - engagement
+        ActionOpposeLegislation: 60,
+        ActionDeclareCandidacy: 50,      # Medium priority - strategic
+        ActionUseFavor: 40,              # Low priority - situational
+        ActionPassTurn: 10,              # Lowest priority - only when no other options
+    }
+    DEFAULT_ACTION_PRIORITY = 30         # Unknown actions
+    
     def __init__(self, name: str = "Balanced Bot", random_seed: Optional[int] = None):
         """
         Initialize the balanced persona.
@@ -81,41 +94,3 @@ class BalancedPersona(BasePersona):
         # Only pass turn if no profitable actions are available
         current_player = game_state.get_current_player()
         return ActionPassTurn(player_id=current_player.id)
-    
-    def get_action_priority(self, action: Action) -> int:
-        """
-        Get the priority score for an action.
-        
-        Higher scores indicate higher priority. The balanced persona
-        gives roughly equal weight to different action types.
-        
-        Args:
-            action: The action to score
-            
-        Returns:
-            int: Priority score (higher = more preferred)
-        """
-        # Priority levels (higher = more preferred)
-        if isinstance(action, ActionFundraise):
-            return 80   # High priority - economic foundation
-        
-        elif isinstance(action, ActionNetwork):
-            return 75   # High priority - economic + favor
-        
-        elif isinstance(action, ActionSponsorLegislation):
-            return 70   # High priority - core gameplay
-        
-        elif isinstance(action, (ActionSupportLegislation, ActionOpposeLegislation)):
-            return 60   # Medium priority - engagement
-        
-        elif isinstance(action, ActionDeclareCandidacy):
-            return 50   # Medium priority - strategic
-        
-        elif isinstance(action, ActionUseFavor):
-            return 40   # Low priority - situational
-        
-        elif isinstance(action, ActionPassTurn):
-            return 10   # Lowest priority - only when no other options
-        
-        else:
-            return 30   # Default priority for unknown actions 
\ No newline at end of file
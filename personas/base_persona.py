@@ -6,12 +6,40 @@ Personas are pure decision-makers that choose actions based on game state.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Type
 import random
 
 from simulation_harness import Agent
 from models.game_state import GameState
-from engine.actions import Action, ActionPassTurn
+from engine.actions import Action, ActionPassTurn, ACTION_TYPES
+
+
+def lookup_priority(action_type: Type[Action], priorities: Dict[Type[Action], int], default: int) -> int:
+    """
+    Priority of an action class in a priority table.
+
+    A class listed in the table uses its own entry; otherwise the nearest
+    listed base class applies (as an isinstance() chain would), and
+    unlisted classes get the default.
+    """
+    for klass in action_type.__mro__:
+        if klass in priorities:
+            return priorities[klass]
+    return default
+
+
+def compile_priority_table(priorities: Dict[Type[Action], int], default: int) -> List[int]:
+    """
+    Compile a priority table into a list indexed by Action.type_id.
+
+    Args:
+        priorities: Priority of each action class
+        default: Priority of action classes not in the table
+
+    Returns:
+        List[int]: Priority of every registered action type, by type_id
+    """
+    return [lookup_priority(action_type, priorities, default) for action_type in ACTION_TYPES]
 
 
 class BasePersona(Agent, ABC):
@@ -21,8 +49,21 @@ class BasePersona(Agent, ABC):
     Personas are pure decision-makers that choose actions from a pre-validated list.
     They should not be responsible for figuring out what actions are possible.
     Each persona implements a specific strategy or play style.
+    
+    Personas with fixed preferences declare them in ACTION_PRIORITIES; the
+    table is compiled once per class into a list indexed by Action.type_id,
+    so scoring an action is a single list lookup.
     """
     
+    # Priority of each action class (higher = more preferred)
+    ACTION_PRIORITIES: Dict[Type[Action], int] = {}
+    # Priority of action classes not listed in ACTION_PRIORITIES
+    DEFAULT_ACTION_PRIORITY: int = 0
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._priority_table = compile_priority_table(cls.ACTION_PRIORITIES, cls.DEFAULT_ACTION_PRIORITY)
+    
     def __init__(self, name: str = "Base Persona", random_seed: Optional[int] = None):
         """
         Initialize the persona.
@@ -58,13 +99,33 @@ class BasePersona(Agent, ABC):
             Action: The chosen action (must be one from valid_actions)
         """
         pass
-    
+
+    def choose_actions(self, batch: Sequence[Tuple[GameState, List[Action]]]) -> List[Action]:
+        """
+        Choose actions for several independent decisions at once.
+
+        Lockstep harnesses and multi-session servers call this with every
+        pending decision for this persona, so personas with expensive
+        scoring can override it to share setup work (feature extraction,
+        lookup tables, random draws) across the whole batch. The default
+        simply calls choose_action() for each entry.
+
+        Args:
+            batch: Sequence of (game_state, valid_actions) pairs
+
+        Returns:
+            List[Action]: One chosen action per entry, in the same order
+        """
+        return [self.choose_action(game_state, valid_actions) for game_state, valid_actions in batch]
+
     def get_action_priority(self, action: Action) -> int:
         """
         Get the priority score for an action.
         
         This helper method can be used by personas to rank actions by preference.
-        Higher scores indicate higher priority.
+        Higher scores indicate higher priority. The default implementation
+        reads the compiled ACTION_PRIORITIES table; personas whose
+        priorities depend on the game state can override it.
         
         Args:
             action: The action to score
@@ -72,8 +133,11 @@ class BasePersona(Agent, ABC):
         Returns:
             int: Priority score (higher = more preferred)
         """
-        # Default implementation: all actions have equal priority
-        return 0
+        type_id = action.type_id
+        table = self._priority_table
+        if 0 <= type_id < len(table):
+            return table[type_id]
+        return lookup_priority(type(action), self.ACTION_PRIORITIES, self.DEFAULT_ACTION_PRIORITY)
     
     def choose_highest_priority_action(self, valid_actions: List[Action]) -> Optional[Action]:
         """
@@ -91,14 +155,25 @@ class BasePersona(Agent, ABC):
         if not valid_actions:
             return None
         
-        # Score all actions
-        scored_actions = [(action, self.get_action_priority(action)) for action in valid_actions]
-        
-        # Find the highest priority
-        max_priority = max(score for _, score in scored_actions)
+        # Use the compiled table unless a subclass scores actions itself
+        if type(self).get_action_priority is BasePersona.get_action_priority:
+            table = self._priority_table
+            size = len(table)
+            score = self.get_action_priority
+        else:
+            table, size, score = None, 0, self.get_action_priority
         
-        # Get all actions with the highest priority
-        best_actions = [action for action, score in scored_actions if score == max_priority]
+        # Single pass keeping every action tied for the highest priority
+        best_actions = []
+        max_priority = None
+        for action in valid_actions:
+            type_id = action.type_id
+            priority = table[type_id] if 0 <= type_id < size else score(action)
+            if max_priority is None or priority > max_priority:
+                max_priority = priority
+                best_actions = [action]
+            elif priority == max_priority:
+                best_actions.append(action)
         
         # Choose randomly among the best actions
         return self.random.choice(best_actions)
@@ -109,4 +184,7 @@ class BasePersona(Agent, ABC):
     
     def __repr__(self) -> str:
         """Return a detailed string representation of the persona."""
-        return f"{self.__class__.__name__}(name='{self.name}')" 
\ No newline at end of file
+        return f"{self.__class__.__name__}(name='{self.name}')"
+
+
+BasePersona._priority_table = compile_priority_table(BasePersona.ACTION_PRIORITIES, BasePersona.DEFAULT_ACTION_PRIORITY)
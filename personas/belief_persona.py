@@ -0,0 +1,175 @@
+"""
+Belief Persona for the Election Game simulation framework.
+
+This persona models its opponents. It tracks a belief over every opponent's
+hidden funder mandate (see opponent_model.MandateBeliefs), turns the beliefs
+into a forecast of who will back or fight each bill, and uses the forecast
+to choose which bills to sponsor and how much to commit to them.
+"""
+
+from typing import Dict, List, Optional
+
+from .base_persona import BasePersona
+from .opponent_model import MandateBeliefs, MANDATE_BILLS, MOOD_MANDATE
+from .legislation_optimizer import (
+    Belief, UNIFORM_AMOUNTS, combine_beliefs, commitment_belief, rank_commitments
+)
+from models.game_state import GameState
+from engine.actions import (
+    Action, ActionPassTurn, ActionFundraise, ActionNetwork,
+    ActionSponsorLegislation, ActionSupportLegislation, ActionOpposeLegislation,
+    ActionDeclareCandidacy, ActionUseFavor
+)
+
+# Influence for completing a hidden funder mandate, in PC (10 PC = 1 Influence)
+MANDATE_BONUS_PC = 150
+
+
+class BeliefPersona(BasePersona):
+    """
+    A persona that plays legislation against a model of its opponents.
+
+    Before every decision it folds the actions taken since its last turn
+    into its mandate beliefs. For each bill it then predicts the other
+    players' net commitment: players who have already committed keep their
+    side with a secret 1/5/10 PC amount, and the rest support or oppose with
+    the probabilities their believed mandates imply. The forecast feeds
+    the exact expected-value commitment optimizer and a pass-probability
+    estimate for sponsoring.
+    """
+
+    ACTION_PRIORITIES = {
+        ActionFundraise: 80,
+        ActionNetwork: 75,
+        ActionDeclareCandidacy: 60,
+        ActionUseFavor: 40,
+        ActionPassTurn: 10,
+    }
+    DEFAULT_ACTION_PRIORITY = 30
+
+    def __init__(self, name: str = "Belief Bot", random_seed: Optional[int] = None):
+        """
+        Initialize the belief persona.
+
+        Args:
+            name: Human-readable name for this persona
+            random_seed: Optional seed for reproducible behavior
+        """
+        super().__init__(name, random_seed)
+        self.models: Dict[int, MandateBeliefs] = {}
+
+    def choose_action(self, game_state: GameState, valid_actions: List[Action]) -> Action:
+        """
+        Choose an action using the opponent model.
+
+        Priorities:
+        1. The support/oppose commitment with the best positive expected return
+        2. Sponsoring the bill with the best expected value, if positive
+        3. Fundraise, Network, Declare Candidacy, Use Favor by priority
+        4. Pass Turn
+
+        Args:
+            game_state: Current game state
+            valid_actions: List of valid actions to choose from
+
+        Returns:
+            Action: The chosen action
+        """
+        current_player = game_state.get_current_player()
+        if not valid_actions:
+            return ActionPassTurn(player_id=current_player.id)
+
+        model = self.observe(game_state)
+
+        commitments = [a for a in valid_actions if isinstance(a, (ActionSupportLegislation, ActionOpposeLegislation))]
+        best_gain, best_commitment = 0.0, None
+        for leg_id in {a.legislation_id for a in commitments}:
+            belief = self.bill_belief(game_state, model, leg_id)
+            ranked = rank_commitments(game_state, current_player.id,
+                                      [a for a in commitments if a.legislation_id == leg_id], belief)
+            if ranked and ranked[0][0] > best_gain:
+                best_gain, best_commitment = ranked[0]
+        if best_commitment is not None:
+            return best_commitment
+
+        best_value, best_sponsor = 0.0, None
+        for action in valid_actions:
+            if isinstance(action, ActionSponsorLegislation):
+                value = self.sponsor_value(game_state, model, current_player, action.legislation_id)
+                if value > best_value:
+                    best_value, best_sponsor = value, action
+        if best_sponsor is not None:
+            return best_sponsor
+
+        stock_crash_active = "STOCK_CRASH" in game_state.active_effects
+        others = [a for a in valid_actions
+                  if not isinstance(a, (ActionPassTurn, ActionSponsorLegislation, ActionSupportLegislation,
+                                        ActionOpposeLegislation))
+                  and not (isinstance(a, ActionFundraise) and stock_crash_active)]
+        chosen = self.choose_highest_priority_action(others)
+        if chosen is not None:
+            return chosen
+        return ActionPassTurn(player_id=current_player.id)
+
+    def observe(self, game_state: GameState) -> MandateBeliefs:
+        """Bring the beliefs of the current player up to date with the game state."""
+        player_id = game_state.get_current_player().id
+        model = self.models.get(player_id)
+        if model is None:
+            model = self.models[player_id] = MandateBeliefs(player_id)
+        model.sync(game_state)
+        return model
+
+    def bill_belief(self, game_state: GameState, model: MandateBeliefs, leg_id: str) -> Belief:
+        """
+        Forecast of the other players' net commitment to a bill.
+
+        Args:
+            game_state: Current game state
+            model: Beliefs of the deciding player
+            leg_id: The bill
+
+        Returns:
+            Belief: Distribution of the other players' net commitment
+        """
+        mood = game_state.legislation_options[leg_id].mood_change
+        pending = next((leg for leg in game_state.term_legislation
+                        if leg.legislation_id == leg_id and not leg.resolved), None)
+        supporters = opposers = 0
+        forecasts = []
+        for player_id in model.beliefs:
+            if pending is not None and player_id in pending.support_players:
+                supporters += 1
+            elif pending is not None and player_id in pending.oppose_players:
+                opposers += 1
+            else:
+                p_support, p_oppose = model.commitment_probabilities(player_id, leg_id, mood)
+                forecast = {0: 1.0 - p_support - p_oppose}
+                for amount, q in UNIFORM_AMOUNTS:
+                    forecast[amount] = forecast.get(amount, 0.0) + p_support * q
+                    forecast[-amount] = forecast.get(-amount, 0.0) + p_oppose * q
+                forecasts.append(tuple(sorted(forecast.items())))
+        return combine_beliefs(commitment_belief(supporters, opposers), *forecasts)
+
+    def sponsor_value(self, game_state: GameState, model: MandateBeliefs, player, leg_id: str) -> float:
+        """
+        Expected PC value of sponsoring a bill and backing it with up to 10 PC.
+
+        Counts the sponsor reward or penalty, the cost, and the mandate bonus
+        when the bill completes (or advances) the player's own mandate.
+        """
+        legislation = game_state.legislation_options[leg_id]
+        own_support = max(0, min(10, player.pc - legislation.cost))
+        penalty = 2 if "WAR_BREAKS_OUT" in game_state.active_effects else 0
+        belief = self.bill_belief(game_state, model, leg_id)
+        p_pass = sum(p for net, p in belief if net + own_support - penalty >= legislation.success_target)
+
+        reward = int(legislation.success_reward * 1.5)
+        loss = int(legislation.failure_penalty * 1.5)
+        value = p_pass * reward - (1.0 - p_pass) * loss - legislation.cost
+        own_mandate = player.mandate.id if player.mandate else None
+        if MANDATE_BILLS.get(own_mandate) == leg_id:
+            value += p_pass * MANDATE_BONUS_PC / 2
+        elif own_mandate == MOOD_MANDATE and legislation.mood_change > 0:
+            value += p_pass * MANDATE_BONUS_PC / 4
+        return value
@@ -27,6 +27,19 @@ class EconomicPersona(BasePersona):
     engage in other activities when it has sufficient PC reserves.
     """
     
+    # Priority levels (higher = more preferred)
+    ACTION_PRIORITIES = {
+        ActionFundraise: 100,            # Highest priority - direct PC generation (unless stock crash)
+        ActionNetwork: 90,               # High priority - PC + favor generation
+        ActionSponsorLegislation: 70,    # Medium-high priority
+        ActionSupportLegislation: 60,    # Medium priority - requires PC commitment
+        ActionOpposeLegislation: 60,
+        ActionDeclareCandidacy: 50,      # Medium-low priority - strategic timing
+        ActionUseFavor: 40,              # Low priority - situational
+        ActionPassTurn: 10,              # Lowest priority - only when no other options
+    }
+    DEFAULT_ACTION_PRIORITY = 30         # Unknown actions
+    
     def __init__(self, name: str = "Economic Bot", random_seed: Optional[int] = None):
         """
         Initialize the economic persona.
@@ -82,42 +95,3 @@ class EconomicPersona(BasePersona):
         # Only pass turn if no profitable actions are available
         current_player = game_state.get_current_player()
         return ActionPassTurn(player_id=current_player.id)
-    
-    def get_action_priority(self, action: Action) -> int:
-        """
-        Get the priority score for an action.
-        
-        Higher scores indicate higher priority. The economic persona
-        prioritizes actions that generate PC.
-        
-        Args:
-            action: The action to score
-            
-        Returns:
-            int: Priority score (higher = more preferred)
-        """
-        # Priority levels (higher = more preferred)
-        if isinstance(action, ActionFundraise):
-            return 100  # Highest priority - direct PC generation (unless stock crash)
-        
-        elif isinstance(action, ActionNetwork):
-            return 90   # High priority - PC + favor generation
-        
-        elif isinstance(action, ActionSponsorLegislation):
-            # Only sponsor if we have sufficient PC
-            return 70   # Medium-high priority
-        
-        elif isinstance(action, (ActionSupportLegislation, ActionOpposeLegislation)):
-            return 60   # Medium priority - requires PC commitment
-        
-        elif isinstance(action, ActionDeclareCandidacy):
-            return 50   # Medium-low priority - strategic timing
-        
-        elif isinstance(action, ActionUseFavor):
-            return 40   # Low priority - situational
-        
-        elif isinstance(action, ActionPassTurn):
-            return 10   # Lowest priority - only when no other options
-        
-        else:
-            return 30   # Default priority for unknown actions 
\ No newline at end of file
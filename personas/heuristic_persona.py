@@ -6,12 +6,16 @@ It serves as a proxy for a player who has played the game once and developed
 basic strategic thinking.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import random
+import time
+import zlib
 
 from .base_persona import BasePersona
 from models.game_state import GameState
 from engine.actions import Action, ActionPassTurn, ActionFundraise, ActionDeclareCandidacy, ActionSupportLegislation, ActionOpposeLegislation
+from engine.election_odds import election_odds
+from engine.search_state import SearchState, ActionKey, action_key, FUNDRAISE, DECLARE, SUPPORT, OPPOSE, PASS
 
 
 class HeuristicPersona(BasePersona):
@@ -24,20 +28,64 @@ class HeuristicPersona(BasePersona):
     quantifiable measure of how much basic, logical play is rewarded.
     """
     
-    def __init__(self, name: str = "Heuristic Bot", random_seed: Optional[int] = None):
+    # Basic strategic value of each action type (higher = more preferred)
+    ACTION_PRIORITIES = {
+        ActionFundraise: 8,              # High priority when PC is low
+        ActionDeclareCandidacy: 7,       # High priority in round 4
+        ActionSupportLegislation: 5,     # Medium priority
+        ActionOpposeLegislation: 5,
+    }
+    DEFAULT_ACTION_PRIORITY = 2          # Other actions
+    
+    def __init__(self,
+                 name: str = "Heuristic Bot",
+                 random_seed: Optional[int] = None,
+                 rollout_time_limit: Optional[float] = None,
+                 rollout_top_k: int = 3,
+                 max_rollouts: Optional[int] = None):
         """
         Initialize the heuristic persona.
         
         Args:
             name: Human-readable name for this persona
             random_seed: Optional seed for reproducible behavior
+            rollout_time_limit: Seconds per decision for the anytime rollout
+                mode (None plays the plain heuristics)
+            rollout_top_k: Candidate actions compared by rollouts, starting
+                with the heuristic choice
+            max_rollouts: Optional cap on rollouts per decision; when it is
+                reached within the time limit, a fixed seed gives the same
+                decision for the same position on any machine
         """
         super().__init__(name, random_seed)
+        self.rollout_time_limit = rollout_time_limit
+        self.rollout_top_k = rollout_top_k
+        self.max_rollouts = max_rollouts
+        self.rollout_seed = random_seed
     
     def choose_action(self, game_state: GameState, valid_actions: List[Action]) -> Action:
         """
         Choose an action based on basic strategic heuristics.
         
+        In anytime mode the heuristic choice is then checked against the
+        next best candidates by rollouts (see improve_by_rollouts).
+        
+        Args:
+            game_state: Current game state
+            valid_actions: List of valid actions to choose from
+            
+        Returns:
+            Action: The chosen action
+        """
+        action = self.heuristic_action(game_state, valid_actions)
+        if self.rollout_time_limit is None or len(valid_actions) < 2:
+            return action
+        return self.improve_by_rollouts(game_state, valid_actions, action)[0]
+    
+    def heuristic_action(self, game_state: GameState, valid_actions: List[Action]) -> Action:
+        """
+        Choose an action with the hard-coded decision rules.
+        
         This persona follows simple, hard-coded decision rules:
         1. If PC is low (< 10), prioritize fundraising
         2. If it's Round 4 and can afford it, declare candidacy for highest value office
@@ -76,11 +124,16 @@ class HeuristicPersona(BasePersona):
                 best_candidacy = None
                 best_value = 0
                 
+                best_odds = 0.0
+                
                 for action in candidacy_actions:
                     office = game_state.offices.get(action.office_id)
                     if office and office.candidacy_cost <= current_player.pc:
-                        if office.candidacy_cost > best_value:
+                        # Between equally valuable candidacies, prefer the better chance against the NPC
+                        odds = election_odds(game_state, office, {current_player.id: action.committed_pc})
+                        if (office.candidacy_cost, odds[current_player.id]) > (best_value, best_odds):
                             best_value = office.candidacy_cost
+                            best_odds = odds[current_player.id]
                             best_candidacy = action
                 
                 if best_candidacy:
@@ -121,30 +174,108 @@ class HeuristicPersona(BasePersona):
             current_player = game_state.get_current_player()
             return ActionPassTurn(player_id=current_player.id)
     
-    def get_action_priority(self, action: Action) -> int:
+    def improve_by_rollouts(self, game_state: GameState, valid_actions: List[Action],
+                            heuristic_choice: Action) -> Tuple[Action, Dict[str, float]]:
         """
-        Get the priority score for an action.
+        Compare the heuristic choice with the next best actions by rollouts.
+        
+        The top-k candidates (the heuristic choice, then valid actions by
+        get_action_priority) take turns: each rollout clones a SearchState,
+        samples the hidden information, plays the candidate and then the
+        heuristic rules for every player until the end of the term. The
+        candidate with the best mean score margin over the strongest
+        opponent wins; ties and an exhausted budget keep the heuristic choice.
         
-        For the heuristic persona, actions are prioritized based on
-        basic strategic value.
+        Rollouts draw from an RNG seeded for this decision (see
+        rollout_rng_for), so a decision never depends on what earlier
+        decisions, or other games played by this persona, consumed.
         
         Args:
-            action: The action to score
+            game_state: Current game state
+            valid_actions: List of valid actions to choose from
+            heuristic_choice: The action the plain heuristics picked
             
         Returns:
-            int: Priority score (higher = more preferred)
+            Tuple[Action, Dict[str, float]]: The chosen action, and the number
+                of rollouts played and the seconds they took
         """
-        # Fundraise gets high priority when PC is low
-        if isinstance(action, ActionFundraise):
-            return 8
+        started = time.perf_counter()
+        deadline = started + self.rollout_time_limit
         
-        # Declare candidacy gets high priority in round 4
-        if isinstance(action, ActionDeclareCandidacy):
-            return 7
+        candidates: Dict[ActionKey, Action] = {}
+        ranked = sorted(valid_actions, key=self.get_action_priority, reverse=True)
+        for action in [heuristic_choice] + ranked:
+            key = action_key(action)
+            if key is not None and key not in candidates:
+                candidates[key] = action
+                if len(candidates) >= self.rollout_top_k:
+                    break
+        if len(candidates) < 2:
+            return heuristic_choice, {'rollouts': 0, 'seconds': time.perf_counter() - started}
         
-        # Support/oppose legislation gets medium priority
-        if isinstance(action, (ActionSupportLegislation, ActionOpposeLegislation)):
-            return 5
+        rng = self.rollout_rng_for(game_state)
+        observer = game_state.get_current_player().id
+        root = SearchState.from_game_state(game_state, rng)
+        keys = list(candidates)
+        totals = [0.0] * len(keys)
+        counts = [0] * len(keys)
+        rollouts = 0
+        while self.max_rollouts is None or rollouts < self.max_rollouts:
+            if time.perf_counter() >= deadline:
+                break
+            index = rollouts % len(keys)
+            state = root.clone()
+            state.determinize(observer, rng)
+            state.apply(keys[index])
+            end_term = root.term + 1
+            while not state.is_terminal() and state.term < end_term:
+                state.apply(self._rollout_policy(state, rng))
+            scores = state.scores()
+            totals[index] += scores[observer] - max(scores[:observer] + scores[observer + 1:])
+            counts[index] += 1
+            rollouts += 1
         
-        # Other actions get lower priority
-        return 2 
\ No newline at end of file
+        stats = {'rollouts': rollouts, 'seconds': time.perf_counter() - started}
+        best_index = None
+        for index, count in enumerate(counts):
+            if count and (best_index is None or totals[index] / count > totals[best_index] / counts[best_index]):
+                best_index = index
+        if best_index is None:
+            return heuristic_choice, stats
+        return candidates[keys[best_index]], stats
+    
+    def rollout_rng_for(self, game_state: GameState) -> random.Random:
+        """
+        RNG for the rollouts of one decision.
+        
+        With a random_seed it is derived from the seed and the position
+        (term, round, player to move, their action points and the length of
+        the turn log), so the same position always gets the same rollouts.
+        Without one it is freshly seeded.
+        """
+        if self.rollout_seed is None:
+            return random.Random()
+        player = game_state.get_current_player()
+        position = (f"{self.rollout_seed}:{game_state.term_counter}:{game_state.round_marker}:{player.id}:"
+                    f"{game_state.action_points.get(player.id, 0)}:{len(game_state.turn_log)}")
+        return random.Random(zlib.crc32(position.encode()))
+    
+    @staticmethod
+    def _rollout_policy(state: SearchState, rng: random.Random) -> ActionKey:
+        """The decision rules of heuristic_action() on a SearchState."""
+        pid = state.current
+        pc = state.pc[pid]
+        legal = state.legal_actions()
+        if pc < 10 and "STOCK_CRASH" not in state.effects:
+            return (FUNDRAISE,)
+        if state.round == 4:
+            offices = state.rules.offices
+            candidacies = [key for key in legal if key[0] == DECLARE]
+            if candidacies:
+                # Most expensive office, committing PC when possible (better odds)
+                return max(candidacies, key=lambda key: (offices[key[1]][0], key[2]))
+        if state.bills and pc > 0:
+            side = rng.choice((SUPPORT, OPPOSE))
+            return (side, state.bills[0][0], max(1, int(pc * 0.3)))
+        profitable = [key for key in legal if key[0] != PASS]
+        return rng.choice(profitable) if profitable else (PASS,)
@@ -0,0 +1,242 @@
+"""
+Exact expected-value optimizer for legislation commitments.
+
+The outcome of a bill (engine.resolvers._resolve_single_legislation) is a
+deterministic function of the net committed PC (support minus opposition,
+minus 2 during war) compared with the bill's success and critical-success
+targets. A player's PC return from a commitment is therefore fixed once the
+other players' net commitment is known:
+
+- every committed PC is paid up front;
+- if the bill passes, each supporter gets back their total support times a
+  tier multiplier (x1 below 5 PC, x1.5 from 5 PC, x2 from 10 PC); if it
+  fails, opponents are paid the same way;
+- the sponsor additionally gains 1.5x the (critical) success reward or loses
+  1.5x the failure penalty, and a passing bill with a positive mood change
+  moves every player's PC by 2 (incumbents up, outsiders down; reversed
+  while war locks the mood).
+
+Given a belief over the other players' net commitment, this module computes
+the exact expected return of every support/oppose amount. Results are
+memoized on the bill terms, the player's situation and the belief, so
+repeated queries from personas cost a dictionary lookup.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from models.game_state import GameState
+from engine.actions import Action, ActionSupportLegislation, ActionOpposeLegislation
+
+
+# A probability distribution over the other players' net commitment,
+# as sorted (net PC, probability) pairs
+Belief = Tuple[Tuple[int, float], ...]
+
+SUPPORT = "support"
+OPPOSE = "oppose"
+COMMITMENT_AMOUNTS = (1, 5, 10)
+# Secret commitments of other players, as determinized by engine.search_state
+UNIFORM_AMOUNTS = ((1, 1 / 3), (5, 1 / 3), (10, 1 / 3))
+WAR_PENALTY = 2
+MOOD_PC_BONUS = 2
+
+
+@dataclass(frozen=True)
+class BillTerms:
+    """The numbers of a Legislation card that decide its payouts."""
+    success_target: int
+    crit_target: int
+    success_reward: int
+    crit_reward: int
+    failure_penalty: int
+    mood_change: int
+
+    @classmethod
+    def from_legislation(cls, legislation) -> 'BillTerms':
+        return cls(legislation.success_target, legislation.crit_target, legislation.success_reward,
+                   legislation.crit_reward, legislation.failure_penalty, legislation.mood_change)
+
+
+def commitment_payout(amount: int) -> int:
+    """PC paid back to a winning supporter or opponent for their total commitment."""
+    if amount >= 10:
+        return int(amount * 2.0)
+    if amount >= 5:
+        return int(amount * 1.5)
+    return amount
+
+
+def point_belief(net: int = 0) -> Belief:
+    """Belief that the other players' net commitment is exactly `net`."""
+    return ((net, 1.0),)
+
+
+@lru_cache(maxsize=4096)
+def commitment_belief(supporters: int = 0, opposers: int = 0, known_net: int = 0,
+                      amount_probs: Belief = UNIFORM_AMOUNTS) -> Belief:
+    """
+    Belief over other players' net commitment from independent secret amounts.
+
+    Args:
+        supporters: Other players known to have committed support
+        opposers: Other players known to have committed opposition
+        known_net: Net PC that is already known exactly
+        amount_probs: Distribution of a single secret commitment
+
+    Returns:
+        Belief: The convolved distribution
+    """
+    distribution = {known_net: 1.0}
+    for sign in [1] * supporters + [-1] * opposers:
+        step: Dict[int, float] = {}
+        for net, p in distribution.items():
+            for amount, q in amount_probs:
+                key = net + sign * amount
+                step[key] = step.get(key, 0.0) + p * q
+        distribution = step
+    return tuple(sorted(distribution.items()))
+
+
+def combine_beliefs(*beliefs: Belief) -> Belief:
+    """Distribution of the sum of independent net commitments."""
+    distribution = {0: 1.0}
+    for belief in beliefs:
+        step: Dict[int, float] = {}
+        for net, p in distribution.items():
+            for other, q in belief:
+                step[net + other] = step.get(net + other, 0.0) + p * q
+        distribution = step
+    return tuple(sorted(distribution.items()))
+
+
+def _expected_payoff(terms: BillTerms, belief: Belief, my_support: int, my_oppose: int,
+                     is_sponsor: bool, war: bool, incumbent: bool) -> float:
+    """Expected PC the player receives when the bill resolves (commitments already paid)."""
+    penalty = WAR_PENALTY if war else 0
+    support_payout = commitment_payout(my_support)
+    oppose_payout = commitment_payout(my_oppose)
+    sponsor_crit = int(terms.crit_reward * 1.5)
+    sponsor_success = int(terms.success_reward * 1.5)
+    sponsor_failure = -int(terms.failure_penalty * 1.5)
+    mood = 0
+    if terms.mood_change > 0:
+        # apply_public_mood_effect treats the war-locked change of 0 as negative
+        mood = MOOD_PC_BONUS if incumbent != war else -MOOD_PC_BONUS
+
+    expected = 0.0
+    for others_net, p in belief:
+        net = others_net + my_support - my_oppose - penalty
+        if net >= terms.success_target:
+            payoff = support_payout + mood
+            if is_sponsor:
+                payoff += sponsor_crit if net >= terms.crit_target else sponsor_success
+        else:
+            payoff = oppose_payout
+            if is_sponsor:
+                payoff += sponsor_failure
+        expected += p * payoff
+    return expected
+
+
+@lru_cache(maxsize=65536)
+def expected_returns(terms: BillTerms,
+                     belief: Belief,
+                     my_support: int = 0,
+                     my_oppose: int = 0,
+                     is_sponsor: bool = False,
+                     war: bool = False,
+                     incumbent: bool = False,
+                     amounts: Tuple[int, ...] = COMMITMENT_AMOUNTS) -> Mapping[Tuple[str, int], float]:
+    """
+    Exact expected PC gain of each additional commitment to one bill.
+
+    Args:
+        terms: The bill's targets and rewards
+        belief: Distribution of the other players' net commitment
+        my_support: PC the player has already committed in support
+        my_oppose: PC the player has already committed in opposition
+        is_sponsor: Whether the player sponsored the bill
+        war: Whether War Breaks Out is active
+        incumbent: Whether the player holds an office (mood effect sign)
+        amounts: Commitment sizes to evaluate
+
+    Returns:
+        Read-only mapping (side, amount) -> expected PC gain relative to not
+        committing, net of the amount paid
+    """
+    base = _expected_payoff(terms, belief, my_support, my_oppose, is_sponsor, war, incumbent)
+    returns = {}
+    for amount in amounts:
+        returns[(SUPPORT, amount)] = _expected_payoff(
+            terms, belief, my_support + amount, my_oppose, is_sponsor, war, incumbent) - amount - base
+        returns[(OPPOSE, amount)] = _expected_payoff(
+            terms, belief, my_support, my_oppose + amount, is_sponsor, war, incumbent) - amount - base
+    return MappingProxyType(returns)
+
+
+def bill_situation(game_state: GameState, player_id: int, legislation_id: str) -> Optional[dict]:
+    """
+    Collect the optimizer inputs for one player and one active bill.
+
+    The default belief treats every other player's existing commitment as a
+    secret amount drawn uniformly from 1/5/10 PC.
+
+    Returns:
+        Keyword arguments for expected_returns(), or None if the bill is not active
+    """
+    pending = next((leg for leg in game_state.term_legislation
+                    if leg.legislation_id == legislation_id and not leg.resolved), None)
+    if pending is None:
+        return None
+    player = game_state.get_player_by_id(player_id)
+    supporters = sum(1 for pid in pending.support_players if pid != player_id)
+    opposers = sum(1 for pid in pending.oppose_players if pid != player_id)
+    return {
+        'terms': BillTerms.from_legislation(game_state.legislation_options[legislation_id]),
+        'belief': commitment_belief(supporters, opposers),
+        'my_support': pending.support_players.get(player_id, 0),
+        'my_oppose': pending.oppose_players.get(player_id, 0),
+        'is_sponsor': pending.sponsor_id == player_id,
+        'war': "WAR_BREAKS_OUT" in game_state.active_effects,
+        'incumbent': player is not None and player.is_incumbent
+    }
+
+
+def rank_commitments(game_state: GameState, player_id: int, actions: Sequence[Action],
+                     belief: Optional[Belief] = None) -> List[Tuple[float, Action]]:
+    """
+    Expected PC gain of every support/oppose action in a list, best first.
+
+    Args:
+        game_state: Current game state
+        player_id: The deciding player
+        actions: Candidate actions; anything other than support/oppose is ignored
+        belief: Optional belief to use instead of the default for every bill
+
+    Returns:
+        List of (expected gain, action) pairs sorted by decreasing gain
+    """
+    ranked = []
+    situations: Dict[str, Optional[dict]] = {}
+    for action in actions:
+        if isinstance(action, ActionSupportLegislation):
+            side, amount = SUPPORT, action.support_amount
+        elif isinstance(action, ActionOpposeLegislation):
+            side, amount = OPPOSE, action.oppose_amount
+        else:
+            continue
+        if action.legislation_id not in situations:
+            situations[action.legislation_id] = bill_situation(game_state, player_id, action.legislation_id)
+        situation = situations[action.legislation_id]
+        if situation is None:
+            continue
+        if belief is not None:
+            situation = dict(situation, belief=belief)
+        amounts = tuple(sorted(set(COMMITMENT_AMOUNTS) | {amount}))
+        returns = expected_returns(amounts=amounts, **situation)
+        ranked.append((returns[(side, amount)], action))
+    ranked.sort(key=lambda pair: pair[0], reverse=True)
+    return ranked
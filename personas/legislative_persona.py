@@ -10,6 +10,7 @@ from typing import List, Optional
 import random
 
 from .base_persona import BasePersona
+from .legislation_optimizer import rank_commitments
 from models.game_state import GameState
 from engine.actions import (
     Action, ActionPassTurn, ActionFundraise, ActionNetwork,
@@ -27,6 +28,19 @@ class LegislativePersona(BasePersona):
     legislative agenda.
     """
     
+    # Priority levels (higher = more preferred)
+    ACTION_PRIORITIES = {
+        ActionSponsorLegislation: 100,   # Highest priority - core legislative strategy
+        ActionSupportLegislation: 90,    # High priority - influence existing legislation
+        ActionOpposeLegislation: 90,
+        ActionFundraise: 70,             # Medium priority - needed for legislation costs
+        ActionNetwork: 60,               # Medium priority - PC + favor for legislation
+        ActionDeclareCandidacy: 50,      # Medium-low priority - strategic timing
+        ActionUseFavor: 40,              # Low priority - situational
+        ActionPassTurn: 10,              # Lowest priority - only when no other options
+    }
+    DEFAULT_ACTION_PRIORITY = 30         # Unknown actions
+    
     def __init__(self, name: str = "Legislative Bot", random_seed: Optional[int] = None):
         """
         Initialize the legislative persona.
@@ -43,7 +57,8 @@ class LegislativePersona(BasePersona):
         
         This persona prioritizes actions in the following order:
         1. Sponsor Legislation (highest priority - core strategy)
-        2. Support/Oppose Legislation (high priority - influence bills)
+        2. Support/Oppose Legislation (high priority - influence bills), picking
+           the commitment with the best expected PC return
         3. Fundraise (medium priority - needed for legislation)
         4. Network (medium priority - PC + favor for legislation)
         5. Declare Candidacy (if in final round)
@@ -75,47 +90,14 @@ class LegislativePersona(BasePersona):
         if profitable_actions:
             # Use priority-based selection from profitable actions only
             chosen_action = self.choose_highest_priority_action(profitable_actions)
+            if isinstance(chosen_action, (ActionSupportLegislation, ActionOpposeLegislation)):
+                # Commit the side and amount with the best expected PC return
+                ranked = rank_commitments(game_state, game_state.get_current_player().id, profitable_actions)
+                if ranked:
+                    chosen_action = ranked[0][1]
             if chosen_action is not None:
                 return chosen_action
         
         # Only pass turn if no profitable actions are available
         current_player = game_state.get_current_player()
         return ActionPassTurn(player_id=current_player.id)
-    
-    def get_action_priority(self, action: Action) -> int:
-        """
-        Get the priority score for an action.
-        
-        Higher scores indicate higher priority. The legislative persona
-        prioritizes actions that influence legislation.
-        
-        Args:
-            action: The action to score
-            
-        Returns:
-            int: Priority score (higher = more preferred)
-        """
-        # Priority levels (higher = more preferred)
-        if isinstance(action, ActionSponsorLegislation):
-            return 100  # Highest priority - core legislative strategy
-        
-        elif isinstance(action, (ActionSupportLegislation, ActionOpposeLegislation)):
-            return 90   # High priority - influence existing legislation
-        
-        elif isinstance(action, ActionFundraise):
-            return 70   # Medium priority - needed for legislation costs
-        
-        elif isinstance(action, ActionNetwork):
-            return 60   # Medium priority - PC + favor for legislation
-        
-        elif isinstance(action, ActionDeclareCandidacy):
-            return 50   # Medium-low priority - strategic timing
-        
-        elif isinstance(action, ActionUseFavor):
-            return 40   # Low priority - situational
-        
-        elif isinstance(action, ActionPassTurn):
-            return 10   # Lowest priority - only when no other options
-        
-        else:
-            return 30   # Default priority for unknown actions 
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+MCTS Persona for the Election Game simulation framework.
+
+This persona searches instead of following rules: it runs Information Set
+Monte Carlo Tree Search over engine.search_state.SearchState, a compact
+copy of the game that clones cheaply. Every iteration samples a version of
+the hidden information (opponents' mandates and archetypes, secret
+commitments and the event deck order) consistent with what this player can
+see, then walks the search statistics with UCT.
+"""
+
+import math
+import time
+import random
+from contextlib import nullcontext
+from typing import List, Dict, Optional
+
+from .base_persona import BasePersona
+from .transposition_table import TranspositionTable, TableEntry
+from models.game_state import GameState
+from engine.actions import Action, ActionPassTurn
+from engine.search_state import SearchState, ActionKey, action_key
+
+
+class MCTSPersona(BasePersona):
+    """
+    A persona that chooses actions with single-observer ISMCTS.
+
+    Statistics live in TableEntry objects, one per search node. Without a
+    transposition table the nodes form an ordinary tree, rebuilt for every
+    decision. With a (possibly shared)
+    TranspositionTable the nodes are keyed by SearchState.key(), so action
+    orders that reach the same position share statistics, and the table
+    carries knowledge over between decisions.
+
+    Because determinizations differ in which actions are legal, an action's
+    exploration term uses the number of times it was available rather than
+    the node's visit count. Rollouts play random actions until the end of
+    the current term (or a configurable number of further terms) and score
+    the position with the final-scoring rules, so the search values PC,
+    offices and completed mandates the same way the game does.
+    """
+
+    def __init__(self,
+                 name: str = "MCTS Bot",
+                 random_seed: Optional[int] = None,
+                 iterations: Optional[int] = 300,
+                 time_limit: Optional[float] = None,
+                 exploration: float = 0.7,
+                 rollout_terms: int = 1,
+                 score_scale: float = 5.0,
+                 transposition_table: Optional[TranspositionTable] = None,
+                 cached_rollout_visits: int = 0):
+        """
+        Initialize the MCTS persona.
+
+        Args:
+            name: Human-readable name for this persona
+            random_seed: Optional seed for reproducible behavior
+            iterations: Search iterations per decision (None for no limit)
+            time_limit: Seconds of search per decision (None for no limit);
+                when both are given, whichever runs out first stops the search
+            exploration: UCT exploration constant
+            rollout_terms: Term ends a rollout plays through before scoring
+            score_scale: Score margin that maps to a reward of about 0.73
+            transposition_table: Optional table keyed by position; may be
+                shared between personas (use thread_safe=True across threads)
+            cached_rollout_visits: With a transposition table, skip the
+                rollout when the newly reached position already has at least
+                this many visits and use its mean value instead (0 disables)
+        """
+        super().__init__(name, random_seed)
+        if iterations is None and time_limit is None:
+            raise ValueError("MCTSPersona needs an iteration or time budget")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_terms = rollout_terms
+        self.score_scale = score_scale
+        self.transposition_table = transposition_table
+        self.cached_rollout_visits = cached_rollout_visits
+        self.search_rng = random.Random(random_seed)
+        self.last_search_stats: Dict[str, float] = {}
+
+    def choose_action(self, game_state: GameState, valid_actions: List[Action]) -> Action:
+        """
+        Search from the current position and return the most visited action.
+
+        Args:
+            game_state: Current game state
+            valid_actions: List of valid actions to choose from
+
+        Returns:
+            Action: The chosen action
+        """
+        if not valid_actions:
+            current_player = game_state.get_current_player()
+            return ActionPassTurn(player_id=current_player.id)
+
+        candidates: Dict[ActionKey, Action] = {}
+        for action in valid_actions:
+            key = action_key(action)
+            if key is not None:
+                candidates.setdefault(key, action)
+        if not candidates:
+            # Only interactive (human-style) actions are available
+            return self.random.choice(valid_actions)
+        if len(candidates) == 1:
+            return next(iter(candidates.values()))
+
+        root_state = SearchState.from_game_state(game_state, self.search_rng)
+        root = self.search(root_state, game_state.get_current_player().id, list(candidates))
+        observer = game_state.get_current_player().id
+        best = max(candidates, key=lambda key: (root.edges[key][0], root.edges[key][2][observer])
+                   if key in root.edges else (-1, 0.0))
+        return candidates[best]
+
+    def search(self, root_state: SearchState, observer: int, root_actions: List[ActionKey]) -> TableEntry:
+        """
+        Run ISMCTS from a search state.
+
+        Args:
+            root_state: Position to search from (not modified)
+            observer: Player id whose hidden information is kept
+            root_actions: Actions allowed at the root
+
+        Returns:
+            The root entry; its edges hold the statistics of each root action
+        """
+        rng = self.search_rng
+        n = root_state.n
+        table = self.transposition_table
+        if table is not None:
+            lock = table.lock
+            with lock:
+                table.new_search()
+                lookups, hits = table.lookups, table.hits
+                root = table.get_or_store(root_state.key(observer), n, 0)
+        else:
+            # Without a table, entries are linked through their edges into an ordinary tree
+            lock = nullcontext()
+            root = TableEntry(n, 0)
+
+        deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+        started = time.perf_counter()
+        iterations = 0
+        cached_rollouts = 0
+
+        while self.iterations is None or iterations < self.iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            iterations += 1
+
+            state = root_state.clone()
+            state.determinize(observer, rng)
+            entry = root
+            path = []
+            end_term = state.term + self.rollout_terms
+            rewards = None
+
+            # Selection and expansion
+            with lock:
+                while not state.is_terminal() and state.term < end_term:
+                    legal = root_actions if entry is root else state.legal_actions()
+                    edges = entry.edges
+                    untried = []
+                    for key in legal:
+                        edge = edges.get(key)
+                        if edge is None:
+                            untried.append(key)
+                        else:
+                            edge[1] += 1
+                    mover = state.current
+                    if untried:
+                        key = rng.choice(untried)
+                        # [visits, availability, reward sums, child entry (tree mode only)]
+                        edge = edges[key] = [0, 1, [0.0] * n, None]
+                    else:
+                        key = self._select(edges, legal, mover)
+                        edge = edges[key]
+                    path.append((entry, edge))
+                    state.apply(key)
+
+                    if untried:
+                        if table is not None and self.cached_rollout_visits:
+                            cached = table.lookup(state.key(observer))
+                            if cached is not None and cached.visits >= self.cached_rollout_visits:
+                                rewards = cached.value()
+                                cached_rollouts += 1
+                        break
+                    if table is not None:
+                        entry = table.get_or_store(state.key(observer), n, len(path))
+                    else:
+                        if edge[3] is None:
+                            edge[3] = TableEntry(n, len(path))
+                        entry = edge[3]
+
+            # Rollout
+            if rewards is None:
+                while not state.is_terminal() and state.term < end_term:
+                    state.apply(state.random_action(rng))
+                rewards = self._rewards(state)
+
+            with lock:
+                for visited, edge in path:
+                    visited.visits += 1
+                    totals = visited.reward_sums
+                    edge[0] += 1
+                    edge_totals = edge[2]
+                    for pid in range(n):
+                        totals[pid] += rewards[pid]
+                        edge_totals[pid] += rewards[pid]
+
+        elapsed = time.perf_counter() - started
+        self.last_search_stats = {
+            'iterations': iterations,
+            'rollouts': iterations - cached_rollouts,
+            'seconds': elapsed,
+            'iterations_per_second': iterations / elapsed if elapsed > 0 else 0.0
+        }
+        if table is not None:
+            with lock:
+                searched_lookups = table.lookups - lookups
+                self.last_search_stats['table_hit_rate'] = \
+                    (table.hits - hits) / searched_lookups if searched_lookups else 0.0
+        return root
+
+    def _select(self, edges: Dict[ActionKey, list], legal: List[ActionKey], mover: int) -> ActionKey:
+        """UCT over the actions that are legal in this determinization."""
+        c = self.exploration
+        best = None
+        best_value = -math.inf
+        for key in legal:
+            visits, availability, totals, _ = edges[key]
+            if visits == 0:
+                # Expanded by an iteration that has not backed up yet (other thread)
+                return key
+            value = totals[mover] / visits + c * math.sqrt(math.log(availability) / visits)
+            if value > best_value:
+                best = key
+                best_value = value
+        return best
+
+    def _rewards(self, state: SearchState) -> List[float]:
+        """Map each player's score margin over their best opponent to (0, 1)."""
+        scores = state.scores()
+        rewards = []
+        for pid, score in enumerate(scores):
+            best_other = max(scores[:pid] + scores[pid + 1:])
+            margin = (score - best_other) / self.score_scale
+            rewards.append(1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, margin)))))
+        return rewards
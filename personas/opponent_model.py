@@ -0,0 +1,237 @@
+"""
+Incremental beliefs about opponents' hidden funder mandates.
+
+Each opponent's mandate is unknown, but it shapes what they do: a War Hawk
+sponsors and backs Military Funding, a Statesman runs for Governor or US
+Senator, and so on. MandateBeliefs keeps one distribution over the
+PersonalMandate ids per opponent and applies Bayes' rule for every public
+action it observes, using a small behaviour model (how likely a player with
+each mandate is to take that action).
+
+Observations are read from the game state with cursors, so each sponsored
+bill, support/oppose commitment, candidacy and legislation result is
+processed exactly once. An update multiplies a cached likelihood row into
+the opponent's distribution, so its cost depends only on the (fixed)
+number of mandates, not on the length of the game.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from models.game_state import GameState
+from game_data import load_personal_mandates
+
+
+ALL_MANDATE_IDS = tuple(m.id for m in load_personal_mandates())
+
+# Mandates completed by passing a particular bill
+MANDATE_BILLS = {
+    "WAR_HAWK": "MILITARY",
+    "ENVIRONMENTALIST": "INFRASTRUCTURE",
+    "UNPOPULAR_HERO": "HEALTHCARE",
+}
+# Mandates completed through the public mood or by holding an office
+MOOD_MANDATE = "PEOPLES_CHAMPION"
+PRESIDENCY_MANDATES = frozenset(["MINIMALIST", "OPPORTUNIST", "PRINCIPLED_LEADER"])
+STATESMAN_OFFICES = frozenset(["GOVERNOR", "US_SENATOR"])
+
+SUPPORT = "support"
+OPPOSE = "oppose"
+
+
+def commitment_odds(mandate_id: str, leg_id: str, mood_change: int) -> Tuple[float, float]:
+    """
+    Behaviour model: chance that a player with a mandate supports or opposes a bill.
+
+    Returns:
+        Tuple of (support probability, oppose probability)
+    """
+    if MANDATE_BILLS.get(mandate_id) == leg_id:
+        return 0.8, 0.02
+    if mandate_id == MOOD_MANDATE and mood_change > 0:
+        return 0.6, 0.05
+    if mandate_id == "KINGMAKER":
+        # Needs to back other players' bills
+        return 0.4, 0.1
+    return 0.25, 0.15
+
+
+def sponsor_odds(mandate_id: str, leg_id: str, mood_change: int) -> float:
+    """Behaviour model: chance that a player with a mandate sponsors a bill."""
+    if MANDATE_BILLS.get(mandate_id) == leg_id:
+        return 0.6
+    if mandate_id == MOOD_MANDATE and mood_change > 0:
+        return 0.4
+    if mandate_id == "MASTER_LEGISLATOR":
+        return 0.4
+    return 0.2
+
+
+def candidacy_odds(mandate_id: str, office_id: str) -> float:
+    """Behaviour model: chance that a player with a mandate runs for an office."""
+    if office_id == "PRESIDENT":
+        return 0.6 if mandate_id in PRESIDENCY_MANDATES else 0.25
+    if office_id in STATESMAN_OFFICES:
+        return 0.6 if mandate_id == "STATESMAN" else 0.25
+    return 0.1 if mandate_id == "STATESMAN" else 0.2
+
+
+class MandateBeliefs:
+    """
+    Per-opponent probability distributions over PersonalMandate ids.
+    """
+
+    def __init__(self, observer_id: int, mandate_ids: Tuple[str, ...] = ALL_MANDATE_IDS):
+        """
+        Initialize the beliefs.
+
+        Args:
+            observer_id: Player id whose point of view is tracked
+            mandate_ids: All mandate ids that can be dealt
+        """
+        self.observer_id = observer_id
+        self.mandate_ids = tuple(mandate_ids)
+        self.beliefs: Dict[int, List[float]] = {}
+        self.observations = 0
+        self._rows: Dict[tuple, Tuple[float, ...]] = {}
+        self._signature: Optional[tuple] = None
+        self._term = -1
+        self._live: Dict[str, Tuple[set, set]] = {}  # leg_id -> (seen supporters, seen opposers)
+        self._history_cursor = 0
+        self._candidacy_cursor = 0
+
+    # --- Queries ---
+
+    def distribution(self, player_id: int) -> Dict[str, float]:
+        """Belief over one opponent's mandate, as mandate id -> probability."""
+        return dict(zip(self.mandate_ids, self.beliefs[player_id]))
+
+    def probability(self, player_id: int, mandate_id: str) -> float:
+        """Believed probability that a player holds a mandate."""
+        return self.beliefs[player_id][self.mandate_ids.index(mandate_id)]
+
+    def expected(self, player_id: int, values: Dict[str, float]) -> float:
+        """Expectation of a per-mandate value under the belief about a player."""
+        return sum(p * values.get(m, 0.0) for m, p in zip(self.mandate_ids, self.beliefs[player_id]))
+
+    def commitment_probabilities(self, player_id: int, leg_id: str, mood_change: int) -> Tuple[float, float]:
+        """Predicted chance that an opponent supports and opposes a bill."""
+        support = self._row(SUPPORT, leg_id, mood_change)
+        oppose = self._row(OPPOSE, leg_id, mood_change)
+        belief = self.beliefs[player_id]
+        return (sum(p * s for p, s in zip(belief, support)),
+                sum(p * o for p, o in zip(belief, oppose)))
+
+    # --- Updates ---
+
+    def reset(self, game_state: GameState) -> None:
+        """Start a new game: uniform beliefs over every mandate but the observer's own."""
+        observer = game_state.get_player_by_id(self.observer_id)
+        own = observer.mandate.id if observer and observer.mandate else None
+        candidates = [m for m in self.mandate_ids if m != own]
+        prior = [1.0 / len(candidates) if m != own else 0.0 for m in self.mandate_ids]
+        self.beliefs = {p.id: list(prior) for p in game_state.players if p.id != self.observer_id}
+        self.observations = 0
+        self._signature = self._game_signature(game_state)
+        self._term = game_state.term_counter
+        self._live = {}
+        self._history_cursor = 0
+        self._candidacy_cursor = 0
+
+    def update(self, player_id: int, likelihood: Tuple[float, ...]) -> None:
+        """Bayes' rule with one likelihood per mandate."""
+        belief = self.beliefs.get(player_id)
+        if belief is None:
+            return
+        total = 0.0
+        for i, weight in enumerate(likelihood):
+            belief[i] *= weight
+            total += belief[i]
+        if total > 0:
+            for i in range(len(belief)):
+                belief[i] /= total
+        self.observations += 1
+
+    def sync(self, game_state: GameState) -> int:
+        """
+        Process every public action since the last call.
+
+        Args:
+            game_state: Current game state
+
+        Returns:
+            int: Number of observations applied
+        """
+        if self._game_signature(game_state) != self._signature or game_state.term_counter < self._term:
+            self.reset(game_state)
+        before = self.observations
+        options = game_state.legislation_options
+
+        # Results first: bills resolved since the last call may have gathered unseen commitments
+        history = game_state.legislation_history
+        for entry in history[self._history_cursor:]:
+            leg_id = entry.get('leg_id')
+            mood = options[leg_id].mood_change if leg_id in options else 0
+            seen_support, seen_oppose = self._live.pop(leg_id, (None, None))
+            if seen_support is None:
+                self.update(entry['sponsor_id'], self._row('sponsor', leg_id, mood))
+                seen_support, seen_oppose = set(), set()
+            for pid in entry.get('support_players', {}):
+                if pid not in seen_support:
+                    self.update(pid, self._row(SUPPORT, leg_id, mood))
+            for pid in entry.get('oppose_players', {}):
+                if pid not in seen_oppose:
+                    self.update(pid, self._row(OPPOSE, leg_id, mood))
+        self._history_cursor = len(history)
+
+        if game_state.term_counter != self._term:
+            self._term = game_state.term_counter
+            self._live = {}
+        for bill in game_state.term_legislation:
+            if bill.resolved:
+                continue
+            mood = options[bill.legislation_id].mood_change
+            seen = self._live.get(bill.legislation_id)
+            if seen is None:
+                seen = self._live[bill.legislation_id] = (set(), set())
+                self.update(bill.sponsor_id, self._row('sponsor', bill.legislation_id, mood))
+            seen_support, seen_oppose = seen
+            if len(bill.support_players) > len(seen_support):
+                for pid in bill.support_players:
+                    if pid not in seen_support:
+                        seen_support.add(pid)
+                        self.update(pid, self._row(SUPPORT, bill.legislation_id, mood))
+            if len(bill.oppose_players) > len(seen_oppose):
+                for pid in bill.oppose_players:
+                    if pid not in seen_oppose:
+                        seen_oppose.add(pid)
+                        self.update(pid, self._row(OPPOSE, bill.legislation_id, mood))
+
+        candidacies = game_state.secret_candidacies
+        if len(candidacies) < self._candidacy_cursor:
+            self._candidacy_cursor = 0
+        for candidacy in candidacies[self._candidacy_cursor:]:
+            # Who runs for which office is public; the committed PC is not
+            self.update(candidacy.player_id, self._row('candidacy', candidacy.office_id, 0))
+        self._candidacy_cursor = len(candidacies)
+
+        return self.observations - before
+
+    def _row(self, kind: str, subject: str, mood_change: int) -> Tuple[float, ...]:
+        """Cached likelihood of an observation under each mandate."""
+        key = (kind, subject, mood_change > 0)
+        row = self._rows.get(key)
+        if row is None:
+            if kind == SUPPORT:
+                row = tuple(commitment_odds(m, subject, mood_change)[0] for m in self.mandate_ids)
+            elif kind == OPPOSE:
+                row = tuple(commitment_odds(m, subject, mood_change)[1] for m in self.mandate_ids)
+            elif kind == 'sponsor':
+                row = tuple(sponsor_odds(m, subject, mood_change) for m in self.mandate_ids)
+            else:
+                row = tuple(candidacy_odds(m, subject) for m in self.mandate_ids)
+            self._rows[key] = row
+        return row
+
+    @staticmethod
+    def _game_signature(game_state: GameState) -> tuple:
+        return tuple((p.id, p.name) for p in game_state.players)
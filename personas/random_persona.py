@@ -53,17 +53,3 @@ class RandomPersona(BasePersona):
         
         # Choose randomly from all valid actions
         return self.random.choice(valid_actions)
-    
-    def get_action_priority(self, action: Action) -> int:
-        """
-        Get the priority score for an action.
-        
-        For the random persona, all actions have equal priority (0).
-        
-        Args:
-            action: The action to score
-            
-        Returns:
-            int: Priority score (always 0 for random persona)
-        """
-        return 0 
\ No newline at end of file
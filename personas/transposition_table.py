@@ -0,0 +1,188 @@
+"""
+Transposition table for search-based personas.
+
+Within a round, fundraising, networking and most commitments commute, so a
+search reaches the same position through many different action orders.
+A TranspositionTable stores one entry per position (keyed by
+SearchState.key()) so those paths share their statistics, and can be kept
+across decisions, personas and threads. Memory is bounded by a fixed
+capacity with either LRU or depth-preferred replacement.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Hashable
+
+
+class TableEntry:
+    """
+    Search statistics for one position.
+
+    Attributes:
+        visits: Times a search iteration passed through the position
+        reward_sums: Summed rollout rewards per player
+        edges: Per-action statistics, action -> [visits, availability, reward sums per
+            player, child entry (only used by searches that run without a table)]
+        depth: Search depth at which the position was first stored
+        generation: Search generation that last touched the entry
+    """
+
+    __slots__ = ('visits', 'reward_sums', 'edges', 'depth', 'generation')
+
+    def __init__(self, num_players: int, depth: int, generation: int = 0):
+        self.visits = 0
+        self.reward_sums = [0.0] * num_players
+        self.edges: Dict[Any, list] = {}
+        self.depth = depth
+        self.generation = generation
+
+    def value(self) -> List[float]:
+        """Mean reward per player, or an empty list before the first visit."""
+        if self.visits == 0:
+            return []
+        return [total / self.visits for total in self.reward_sums]
+
+    def best_action(self) -> Optional[Any]:
+        """The most visited action from this position."""
+        if not self.edges:
+            return None
+        return max(self.edges, key=lambda action: self.edges[action][0])
+
+
+class TranspositionTable:
+    """
+    Bounded position -> TableEntry map with hit-rate statistics.
+
+    Replacement policies:
+    - "lru": evict the least recently used entry when full
+    - "depth": each key hashes to one slot; a new entry only displaces the
+      occupant if it is at most as deep (shallow entries aggregate more
+      visits) or the occupant is left over from an earlier search
+      generation. Rejected positions get a detached entry that is used for
+      the current iteration only.
+    """
+
+    POLICIES = ('lru', 'depth')
+
+    def __init__(self, capacity: int = 200000, policy: str = 'lru', thread_safe: bool = False):
+        """
+        Initialize an empty table.
+
+        Args:
+            capacity: Maximum number of stored positions
+            policy: Replacement policy, "lru" or "depth"
+            thread_safe: Guard the table with a lock so several threads in
+                one process can share it
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        if capacity < 1:
+            raise ValueError("Transposition table capacity must be positive")
+        self.capacity = capacity
+        self.policy = policy
+        self.lock = threading.Lock() if thread_safe else nullcontext()
+        self.generation = 0
+
+        self._lru: "OrderedDict[Hashable, TableEntry]" = OrderedDict()
+        self._slots: Dict[int, tuple] = {}
+
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+        self.rejections = 0
+
+    def __len__(self) -> int:
+        return len(self._lru) if self.policy == 'lru' else len(self._slots)
+
+    def new_search(self) -> None:
+        """Start a new search generation; older depth-preferred entries become replaceable."""
+        self.generation += 1
+
+    def lookup(self, key: Hashable) -> Optional[TableEntry]:
+        """
+        Find the entry for a position.
+
+        Args:
+            key: Position key
+
+        Returns:
+            The stored entry, or None on a miss
+        """
+        self.lookups += 1
+        if self.policy == 'lru':
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+        else:
+            slot = self._slots.get(hash(key) % self.capacity)
+            entry = slot[1] if slot is not None and slot[0] == key else None
+        if entry is not None:
+            self.hits += 1
+            entry.generation = self.generation
+        return entry
+
+    def store(self, key: Hashable, num_players: int, depth: int) -> TableEntry:
+        """
+        Create an entry for a position that missed.
+
+        Args:
+            key: Position key
+            num_players: Length of the reward vectors
+            depth: Search depth of the position (0 = root)
+
+        Returns:
+            The new entry (detached if the replacement policy rejected it)
+        """
+        entry = TableEntry(num_players, depth, self.generation)
+        if self.policy == 'lru':
+            self._lru[key] = entry
+            if len(self._lru) > self.capacity:
+                self._lru.popitem(last=False)
+                self.evictions += 1
+            self.stores += 1
+            return entry
+
+        index = hash(key) % self.capacity
+        occupant = self._slots.get(index)
+        if occupant is not None and occupant[0] != key:
+            occupant_entry = occupant[1]
+            if occupant_entry.generation == self.generation and depth > occupant_entry.depth:
+                self.rejections += 1
+                return entry
+            self.evictions += 1
+        self._slots[index] = (key, entry)
+        self.stores += 1
+        return entry
+
+    def get_or_store(self, key: Hashable, num_players: int, depth: int) -> TableEntry:
+        """Lookup, creating the entry on a miss."""
+        entry = self.lookup(key)
+        if entry is None:
+            entry = self.store(key, num_players, depth)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        self._lru.clear()
+        self._slots.clear()
+        self.lookups = self.hits = self.stores = self.evictions = self.rejections = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit-rate statistics."""
+        return {
+            'policy': self.policy,
+            'capacity': self.capacity,
+            'size': len(self),
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'rejections': self.rejections
+        }
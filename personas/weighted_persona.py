@@ -0,0 +1,140 @@
+"""
+Weighted Persona for the Election Game simulation framework.
+
+This persona is driven by the numeric parameters of the `ai` block in
+game_config.yaml, so its play style can be tuned (by hand or with
+weight_tuner.py) without code changes.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .base_persona import BasePersona
+from config_loader import get_config
+from models.game_state import GameState
+from engine.election_odds import election_odds
+from engine.actions import (
+    Action, ActionPassTurn, ActionFundraise, ActionNetwork,
+    ActionSponsorLegislation, ActionSupportLegislation, ActionOpposeLegislation,
+    ActionDeclareCandidacy, ActionUseFavor
+)
+
+
+# Defaults of the `ai` block in game_config.yaml
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    'fundraise_weight': 1.0,
+    'network_weight': 1.0,
+    'sponsor_legislation_weight': 1.0,
+    'declare_candidacy_weight': 1.0,
+    'use_favor_weight': 1.0,
+    'support_legislation_weight': 1.0,
+    'oppose_legislation_weight': 1.0,
+    'conservative_threshold': 0.3,
+    'aggressive_threshold': 0.7,
+    'min_pc_reserve': 5,
+    'max_pc_commitment_ratio': 0.8,
+}
+
+ACTION_WEIGHT_KEYS = {
+    ActionFundraise: 'fundraise_weight',
+    ActionNetwork: 'network_weight',
+    ActionSponsorLegislation: 'sponsor_legislation_weight',
+    ActionDeclareCandidacy: 'declare_candidacy_weight',
+    ActionUseFavor: 'use_favor_weight',
+    ActionSupportLegislation: 'support_legislation_weight',
+    ActionOpposeLegislation: 'oppose_legislation_weight',
+}
+
+
+class WeightedPersona(BasePersona):
+    """
+    A persona that picks action types in proportion to configured weights.
+
+    Each decision filters the valid actions with the PC-management and risk
+    parameters, then draws an action type with probability proportional to
+    its `*_weight` and plays one variant of that type:
+
+    - min_pc_reserve: PC spent on bills, sponsorship and candidacies must
+      leave at least this much in reserve
+    - max_pc_commitment_ratio: largest share of current PC committed to a bill
+    - conservative_threshold: lowest chance of beating the NPC Challenger
+      (see engine.election_odds) worth declaring a candidacy for
+    - aggressive_threshold: probability of committing the largest allowed
+      amount to a bill instead of the smallest
+    """
+
+    def __init__(self, name: str = "Weighted Bot", random_seed: Optional[int] = None,
+                 weights: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the weighted persona.
+
+        Args:
+            name: Human-readable name for this persona
+            random_seed: Optional seed for reproducible behavior
+            weights: Parameters overriding the `ai` block of game_config.yaml
+        """
+        super().__init__(name, random_seed)
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights is None:
+            weights = get_config().get_ai_config()
+        self.weights.update({key: value for key, value in weights.items() if key in DEFAULT_WEIGHTS})
+
+    def choose_action(self, game_state: GameState, valid_actions: List[Action]) -> Action:
+        """
+        Choose an action by weighted draw over the allowed action types.
+
+        Args:
+            game_state: Current game state
+            valid_actions: List of valid actions to choose from
+
+        Returns:
+            Action: The chosen action
+        """
+        current_player = game_state.get_current_player()
+        if not valid_actions:
+            return ActionPassTurn(player_id=current_player.id)
+
+        by_type: Dict[type, List[Action]] = {}
+        for action in valid_actions:
+            if type(action) in ACTION_WEIGHT_KEYS and self._allowed(game_state, current_player, action):
+                by_type.setdefault(type(action), []).append(action)
+
+        types = [action_type for action_type in by_type
+                 if self.weights[ACTION_WEIGHT_KEYS[action_type]] > 0]
+        if not types:
+            passes = [a for a in valid_actions if isinstance(a, ActionPassTurn)]
+            return passes[0] if passes else self.random.choice(valid_actions)
+
+        chosen_type = self.random.choices(
+            types, weights=[self.weights[ACTION_WEIGHT_KEYS[t]] for t in types])[0]
+        variants = by_type[chosen_type]
+        if chosen_type in (ActionSupportLegislation, ActionOpposeLegislation):
+            return self._choose_commitment(variants)
+        if chosen_type is ActionDeclareCandidacy:
+            # Most valuable office, committing PC where offered
+            return max(variants, key=lambda a: (game_state.offices[a.office_id].candidacy_cost, a.committed_pc))
+        return self.random.choice(variants)
+
+    def _allowed(self, game_state: GameState, player, action: Action) -> bool:
+        """Apply the PC reserve, commitment ratio and candidacy risk limits."""
+        reserve = self.weights['min_pc_reserve']
+        if isinstance(action, (ActionSupportLegislation, ActionOpposeLegislation)):
+            amount = action.support_amount if isinstance(action, ActionSupportLegislation) else action.oppose_amount
+            return amount <= player.pc * self.weights['max_pc_commitment_ratio'] and player.pc - amount >= reserve
+        if isinstance(action, ActionSponsorLegislation):
+            return player.pc - game_state.legislation_options[action.legislation_id].cost >= reserve
+        if isinstance(action, ActionDeclareCandidacy):
+            office = game_state.offices[action.office_id]
+            if player.pc - (office.candidacy_cost - action.committed_pc) < reserve:
+                return False
+            odds = election_odds(game_state, office, {player.id: action.committed_pc})
+            return odds[player.id] >= self.weights['conservative_threshold']
+        return True
+
+    def _choose_commitment(self, variants: List[Action]) -> Action:
+        """Pick a bill and side, then the largest or smallest allowed amount."""
+        first = self.random.choice(variants)
+        same_bill = [a for a in variants if type(a) is type(first) and a.legislation_id == first.legislation_id]
+        amount = (lambda a: a.support_amount) if isinstance(first, ActionSupportLegislation) else (lambda a: a.oppose_amount)
+        if self.random.random() < self.weights['aggressive_threshold']:
+            return max(same_bill, key=amount)
+        return min(same_bill, key=amount)
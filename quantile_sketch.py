@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Streaming Quantile Sketches for the Election Game Simulation Framework
+
+Exact medians and tail percentiles of final PC, influence, score margins and
+game lengths would require keeping every value ever observed. This module
+provides a KLL-style quantile sketch that answers rank queries with a small,
+bounded error in fixed memory, can be merged across experiments or parallel
+workers, and round-trips through JSON alongside the simulation results.
+"""
+
+import math
+from typing import Dict, List, Optional, Any, Tuple
+
+
+class KLLSketch:
+    """
+    Mergeable streaming quantile sketch (Karnin, Lang and Liberty).
+
+    Values are kept in a stack of compactors. When the sketch is full, the
+    lowest overflowing compactor is sorted and every other item is promoted
+    to the next level with double the weight. Higher levels get larger
+    capacities, so the retained item count is roughly 3k regardless of how
+    many values are added.
+
+    The compaction offset alternates per level instead of using a random coin,
+    so a sketch is fully determined by its inputs and serialized state. That
+    keeps cached and freshly computed sketches identical.
+    """
+
+    CAPACITY_DECAY = 2.0 / 3.0
+    MIN_CAPACITY = 2
+
+    def __init__(self, k: int = 200):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Accuracy parameter; rank error is roughly 1.7 / k
+        """
+        self.k = k
+        self.count = 0
+        self.min_value: Optional[float] = None
+        self.max_value: Optional[float] = None
+        self._compactors: List[List[float]] = [[]]
+        self._offsets: List[int] = [0]
+        # Retained item count and the size budget, cached so update() stays O(1)
+        self._retained = 0
+        self._limit = self._max_size()
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a compactor; the top level gets k and lower levels shrink geometrically."""
+        depth = len(self._compactors) - level - 1
+        return max(self.MIN_CAPACITY, int(math.ceil(self.k * self.CAPACITY_DECAY ** depth)))
+
+    def _size(self) -> int:
+        return sum(len(c) for c in self._compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def update(self, value: float) -> None:
+        """Add a single value to the sketch."""
+        self.count += 1
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+        self._compactors[0].append(value)
+        self._retained += 1
+        if self._retained >= self._limit:
+            self._compress()
+
+    def _compress(self) -> None:
+        """Compact levels until the sketch is back within its size budget."""
+        while self._size() >= self._max_size():
+            for level, compactor in enumerate(self._compactors):
+                if len(compactor) >= self._capacity(level):
+                    if level + 1 == len(self._compactors):
+                        self._compactors.append([])
+                        self._offsets.append(0)
+
+                    compactor.sort()
+                    # With an odd length the largest item stays behind, so the
+                    # promoted half represents an even number of values
+                    leftover = [compactor.pop()] if len(compactor) % 2 else []
+                    offset = self._offsets[level]
+                    self._offsets[level] ^= 1
+                    self._compactors[level + 1].extend(compactor[offset::2])
+                    self._compactors[level] = leftover
+                    break
+            else:
+                break
+        self._retained = self._size()
+        self._limit = self._max_size()
+
+    def merge(self, other: 'KLLSketch') -> None:
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other: Sketch to merge; it is left unchanged
+        """
+        if other.count == 0:
+            return
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append([])
+            self._offsets.append(0)
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level].extend(compactor)
+
+        self.count += other.count
+        if self.min_value is None or other.min_value < self.min_value:
+            self.min_value = other.min_value
+        if self.max_value is None or other.max_value > self.max_value:
+            self.max_value = other.max_value
+        self._compress()
+
+    def _weighted_items(self) -> List[Tuple[float, int]]:
+        items = []
+        for level, compactor in enumerate(self._compactors):
+            weight = 1 << level
+            items.extend((value, weight) for value in compactor)
+        items.sort()
+        return items
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at a given quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (0.5 is the median)
+
+        Returns:
+            The estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min_value
+        if q >= 1:
+            return self.max_value
+
+        items = self._weighted_items()
+        total_weight = sum(weight for _, weight in items)
+        target = q * total_weight
+        cumulative = 0
+        for value, weight in items:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return self.max_value
+
+    def quantiles(self, qs: List[float]) -> Dict[float, Optional[float]]:
+        """Estimate several quantiles at once."""
+        return {q: self.quantile(q) for q in qs}
+
+    def copy(self) -> 'KLLSketch':
+        """Return an independent copy of the sketch."""
+        return KLLSketch.from_dict(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch to a JSON-compatible dictionary."""
+        return {
+            'k': self.k,
+            'count': self.count,
+            'min': self.min_value,
+            'max': self.max_value,
+            'compactors': [list(c) for c in self._compactors],
+            'offsets': list(self._offsets)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'KLLSketch':
+        """Rebuild a sketch previously produced by to_dict()."""
+        sketch = cls(k=data['k'])
+        sketch.count = data['count']
+        sketch.min_value = data['min']
+        sketch.max_value = data['max']
+        sketch._compactors = [list(c) for c in data['compactors']]
+        sketch._offsets = list(data['offsets'])
+        sketch._retained = sketch._size()
+        sketch._limit = sketch._max_size()
+        return sketch
+
+
+class SketchSet:
+    """
+    A family of quantile sketches keyed by (persona, seat, metric).
+
+    Per-player metrics recorded by add_game():
+    - final_pc: the player's PC at the end of the game
+    - total_influence: the player's final score
+    - score_margin: the player's score minus the best opponent's score
+    - game_length: rounds played in the games the player took part in
+    """
+
+    PLAYER_METRICS = ('final_pc', 'total_influence', 'score_margin', 'game_length')
+
+    def __init__(self, k: int = 200):
+        """
+        Initialize an empty set of sketches.
+
+        Args:
+            k: Accuracy parameter passed to every KLLSketch
+        """
+        self.k = k
+        self.sketches: Dict[Tuple[str, int, str], KLLSketch] = {}
+
+    def update(self, persona: str, seat: int, metric: str, value: float) -> None:
+        """Add a value to the sketch for one persona, seat and metric."""
+        key = (persona, seat, metric)
+        sketch = self.sketches.get(key)
+        if sketch is None:
+            sketch = KLLSketch(self.k)
+            self.sketches[key] = sketch
+        sketch.update(value)
+
+    def add_game(self, personas: List[str], players: List[Dict[str, Any]], game_length: int) -> None:
+        """
+        Record one finished game.
+
+        Args:
+            personas: Persona label for each entry of `players`
+            players: Per-player summaries with 'pc' and 'influence' (seat is
+                taken from 'id', falling back to list position)
+            game_length: Length of the game in rounds
+        """
+        influences = [player.get('influence', 0) for player in players]
+        for index, (persona, player) in enumerate(zip(personas, players)):
+            seat = player.get('id', index)
+            others = influences[:index] + influences[index + 1:]
+            influence = influences[index]
+            self.update(persona, seat, 'final_pc', player.get('pc', 0))
+            self.update(persona, seat, 'total_influence', influence)
+            self.update(persona, seat, 'score_margin', influence - max(others) if others else 0)
+            self.update(persona, seat, 'game_length', game_length)
+
+    def merge(self, other: 'SketchSet') -> None:
+        """Fold another sketch set (e.g. from another worker) into this one."""
+        for key, sketch in other.sketches.items():
+            if key in self.sketches:
+                self.sketches[key].merge(sketch)
+            else:
+                self.sketches[key] = sketch.copy()
+
+    def select(self, persona: Optional[str] = None, seat: Optional[int] = None,
+               metric: Optional[str] = None) -> KLLSketch:
+        """
+        Merge every sketch matching the given filters.
+
+        Args:
+            persona: Restrict to one persona (all personas if None)
+            seat: Restrict to one seat (all seats if None)
+            metric: Restrict to one metric (all metrics if None)
+
+        Returns:
+            KLLSketch: A new sketch covering the selected values
+        """
+        merged = KLLSketch(self.k)
+        for (key_persona, key_seat, key_metric), sketch in sorted(self.sketches.items()):
+            if persona is not None and key_persona != persona:
+                continue
+            if seat is not None and key_seat != seat:
+                continue
+            if metric is not None and key_metric != metric:
+                continue
+            merged.merge(sketch)
+        return merged
+
+    def personas(self) -> List[str]:
+        """Return the personas that have at least one sketch."""
+        return sorted({persona for persona, _, _ in self.sketches})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch set to a JSON-compatible dictionary."""
+        return {
+            'k': self.k,
+            'sketches': [
+                {'persona': persona, 'seat': seat, 'metric': metric, 'sketch': sketch.to_dict()}
+                for (persona, seat, metric), sketch in sorted(self.sketches.items())
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SketchSet':
+        """Rebuild a sketch set previously produced by to_dict()."""
+        sketch_set = cls(k=data['k'])
+        for entry in data['sketches']:
+            key = (entry['persona'], entry['seat'], entry['metric'])
+            sketch_set.sketches[key] = KLLSketch.from_dict(entry['sketch'])
+        return sketch_set
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Result Sampling for the Election Game Simulation Framework
+
+Full game logs and serialized final states are by far the largest part of
+a simulation's output, and almost nobody reads more than a handful of them.
+This module decides which games keep their full detail: a uniform reservoir
+sample, plus the outliers that are worth inspecting by hand (the longest
+games, the largest score margins and games that hit errors). Every other
+game is reduced to a compact summary by the simulation runner.
+"""
+
+import heapq
+import random
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+
+def score_margin(final_scores: Dict[Any, Any]) -> int:
+    """
+    Influence difference between the winner and the runner-up.
+
+    Args:
+        final_scores: Mapping of player id to either a score dict with a
+            'total_influence' key (as produced by the engine) or a plain number
+
+    Returns:
+        int: The margin of victory (0 for games with fewer than two players)
+    """
+    totals = sorted(
+        (s['total_influence'] if isinstance(s, dict) else s for s in final_scores.values()),
+        reverse=True
+    )
+    if len(totals) < 2:
+        return 0
+    return totals[0] - totals[1]
+
+
+class GameLogSampler:
+    """
+    Chooses which games of an experiment keep their full log and final state.
+
+    Games are offered one at a time as they finish. The sampler keeps:
+    - a uniform random sample of `reservoir_size` games (Algorithm R),
+    - the `keep_longest` games with the most rounds,
+    - the `keep_largest_margins` games with the largest score margins,
+    - every game that reported an error (if `keep_errors` is set).
+
+    Memory use is bounded by the sizes above, independent of how many games
+    are played. A game can be retained for several reasons at once.
+    """
+
+    def __init__(self,
+                 reservoir_size: int = 50,
+                 keep_longest: int = 5,
+                 keep_largest_margins: int = 5,
+                 keep_errors: bool = True,
+                 seed: Optional[int] = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            reservoir_size: Number of uniformly sampled games to keep in full
+            keep_longest: Number of longest games to keep in full
+            keep_largest_margins: Number of games with the largest score margins to keep
+            keep_errors: Keep every game that reported an error
+            seed: Optional seed for a reproducible reservoir
+        """
+        self.reservoir_size = reservoir_size
+        self.keep_longest = keep_longest
+        self.keep_largest_margins = keep_largest_margins
+        self.keep_errors = keep_errors
+        self.random = random.Random(seed)
+
+        self.games_seen = 0
+        self._reservoir: List[int] = []
+        self._longest: List[Tuple[int, int]] = []  # min-heap of (rounds, -game_id)
+        self._largest_margins: List[Tuple[int, int]] = []  # min-heap of (margin, -game_id)
+        self._errors: Set[int] = set()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'GameLogSampler':
+        """Create a sampler from the `log_sampling` block of a simulation config."""
+        return cls(
+            reservoir_size=config.get('reservoir_size', 50),
+            keep_longest=config.get('keep_longest', 5),
+            keep_largest_margins=config.get('keep_largest_margins', 5),
+            keep_errors=config.get('keep_errors', True),
+            seed=config.get('seed')
+        )
+
+    def offer(self, game_id: int, game_length: int, margin: int, error: Optional[str] = None) -> List[int]:
+        """
+        Offer a finished game to the sampler.
+
+        Args:
+            game_id: Identifier of the game within its experiment
+            game_length: Length of the game in rounds
+            margin: Score margin between winner and runner-up
+            error: Error message if the game failed, None otherwise
+
+        Returns:
+            List[int]: Ids of games that are no longer retained as a result of
+            this offer (including `game_id` itself if it was not kept). Their
+            full logs and states can be discarded.
+        """
+        self.games_seen += 1
+        candidates = {game_id}
+
+        if error is not None and self.keep_errors:
+            self._errors.add(game_id)
+
+        # Reservoir sampling (Algorithm R)
+        if len(self._reservoir) < self.reservoir_size:
+            self._reservoir.append(game_id)
+        elif self.reservoir_size > 0:
+            slot = self.random.randrange(self.games_seen)
+            if slot < self.reservoir_size:
+                candidates.add(self._reservoir[slot])
+                self._reservoir[slot] = game_id
+
+        # Ties keep the earlier game, so the heap key uses the negated id
+        evicted = self._push_top_k(self._longest, self.keep_longest, (game_length, -game_id))
+        if evicted is not None:
+            candidates.add(evicted)
+        evicted = self._push_top_k(self._largest_margins, self.keep_largest_margins, (margin, -game_id))
+        if evicted is not None:
+            candidates.add(evicted)
+
+        return sorted(gid for gid in candidates if not self.is_retained(gid))
+
+    @staticmethod
+    def _push_top_k(heap: List[Tuple[int, int]], k: int, item: Tuple[int, int]) -> Optional[int]:
+        """Keep the k largest items in a min-heap; return the id that fell out, if any."""
+        if k <= 0:
+            return -item[1]
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+            return None
+        if item > heap[0]:
+            return -heapq.heapreplace(heap, item)[1]
+        return -item[1]
+
+    def is_retained(self, game_id: int) -> bool:
+        """Return True if the game currently keeps its full detail."""
+        return bool(self.retention_reasons(game_id))
+
+    def retention_reasons(self, game_id: int) -> List[str]:
+        """Return why a game is retained (empty if it is not)."""
+        reasons = []
+        if game_id in self._reservoir:
+            reasons.append('sample')
+        if any(-neg_id == game_id for _, neg_id in self._longest):
+            reasons.append('longest')
+        if any(-neg_id == game_id for _, neg_id in self._largest_margins):
+            reasons.append('largest_margin')
+        if game_id in self._errors:
+            reasons.append('error')
+        return reasons
+
+    def retained(self) -> Dict[int, List[str]]:
+        """Return every retained game id with its retention reasons."""
+        game_ids = set(self._reservoir) | self._errors
+        game_ids.update(-neg_id for _, neg_id in self._longest)
+        game_ids.update(-neg_id for _, neg_id in self._largest_margins)
+        return {gid: self.retention_reasons(gid) for gid in sorted(game_ids)}
@@ -1,12 +1,117 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, Response, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
-from game_session import GameSession
+from game_session import GameSession, AI_LATENCY
+from state_delta import StateStream, RESYNC_ACTION
+from state_serializer import dumps_text
+from game_data import serialize_catalog
+from session_registry import SessionRegistry, SessionLimitError
+from agent_profiler import LATENCY_BUCKETS
+from metrics import (
+    METRICS, ENGINE_QUEUED, SERIALIZATION_SECONDS, PAYLOAD_BYTES, WEBSOCKET_SEND_SECONDS, histogram_lines
+)
+from game_logging import configure_logging, get_logger, bind_context, unbind_context
+from spectator import SpectatorHub, spectate_id_for
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional
+import asyncio
+import contextvars
+import functools
 import json
+import os
+import time
+import weakref
 
-app = FastAPI()
+# Log level, format, sampling and rate limits come from LOG_* environment variables
+configure_logging()
+logger = get_logger(__name__)
+
+# How AI turns reach the client: "acknowledge" sends each move and waits for the client to
+# acknowledge it; "batch" plays every AI move up to the human's turn and sends them as one
+# message of animation frames, acknowledged once. Clients can pick a mode with ?pacing=
+PACING_MODES = ("acknowledge", "batch")
+AI_PACING = os.environ.get("AI_PACING", "acknowledge")
+# Suggested pause between animated AI moves in batch mode
+AI_MOVE_DELAY_MS = int(os.environ.get("AI_MOVE_DELAY_MS", 600))
+
+# Games live in the registry, keyed by a token the client sends back when it reconnects
+SESSION_DB = os.environ.get("SESSION_DB", "sessions.db")
+MAX_SESSIONS = int(os.environ.get("MAX_SESSIONS", 200))
+# Stored games nobody has resumed for this long are purged
+SESSION_TTL_SECONDS = float(os.environ.get("SESSION_TTL_SECONDS", 7 * 24 * 3600))
+registry = SessionRegistry(SESSION_DB, max_sessions=MAX_SESSIONS, stored_ttl=SESSION_TTL_SECONDS)
+
+
+async def save_sessions(due_only: bool) -> None:
+    """Write sessions with unsaved changes, each on its runner so it is not changed mid-snapshot."""
+    for token, session in registry.unsaved(due_only):
+        await runner_for(session).run(registry.save, token)
+
+
+async def sweep_sessions():
+    """Periodically write coalesced session saves and evict idle sessions."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(registry.save_interval)
+        try:
+            await save_sessions(due_only=True)
+            await loop.run_in_executor(engine_executor, functools.partial(registry.sweep, save_due=False))
+        except Exception:
+            # Keep sweeping; a task that died here would never save or evict again
+            logger.exception("Session sweep failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = asyncio.create_task(sweep_sessions())
+    yield
+    sweeper.cancel()
+    await save_sessions(due_only=False)
+
+
+app = FastAPI(lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Game-engine work (deepcopies, resolvers, AI decisions) runs on this bounded pool
+# so that one session's thinking never blocks the event loop for everyone else
+ENGINE_WORKERS = int(os.environ.get("ENGINE_WORKERS", min(32, (os.cpu_count() or 1) + 4)))
+engine_executor = ThreadPoolExecutor(max_workers=ENGINE_WORKERS, thread_name_prefix="engine")
+
+
+class SessionRunner:
+    """
+    Runs a session's engine calls on the shared executor, one at a time.
+
+    Calls are awaited from the websocket handler; the lock guarantees that
+    calls for the same session execute in the order they were made and
+    never overlap, while different sessions run in parallel.
+    """
+
+    def __init__(self, session: GameSession, executor: ThreadPoolExecutor = None):
+        self.session = session
+        self.executor = executor or engine_executor
+        self._lock = asyncio.Lock()
+
+    async def run(self, func, *args):
+        """Call func(*args) on the executor and return its result."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            ENGINE_QUEUED.inc()
+            # The worker runs the call in the caller's context, so engine logs carry the session's fields
+            call = functools.partial(_dequeue_and_call, contextvars.copy_context(), func, *args)
+            return await loop.run_in_executor(self.executor, call)
+
+
+def _dequeue_and_call(context, func, *args):
+    # First thing on the worker thread: the call is no longer waiting in the queue
+    ENGINE_QUEUED.dec()
+    return context.run(func, *args)
+
+
+# One runner per session, shared by every connection to it (e.g. a reconnect racing a stale socket)
+session_runners: "weakref.WeakKeyDictionary[GameSession, SessionRunner]" = weakref.WeakKeyDictionary()
+
 @app.get("/")
 async def read_root():
     return FileResponse('static/index.html')
@@ -15,55 +120,248 @@ async def read_root():
 async def read_debug():
     return FileResponse('static/debug.html')
 
+# Static game data, serialized once per process; the ETag changes only with the data
+CATALOG_BODY, CATALOG_VERSION = serialize_catalog()
+CATALOG_HEADERS = {"ETag": f'"{CATALOG_VERSION}"', "Cache-Control": "public, max-age=3600, must-revalidate"}
+
+@app.get("/catalog")
+async def read_catalog(request: Request):
+    """Offices, legislation, cards and favors by ID, for resolving the IDs in per-turn state."""
+    if_none_match = request.headers.get("if-none-match", "")
+    if CATALOG_HEADERS["ETag"] in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=CATALOG_HEADERS)
+    return Response(CATALOG_BODY, media_type="application/json", headers=CATALOG_HEADERS)
+
+@app.get("/stats/ai")
+async def read_ai_stats():
+    """Decision latency, timeouts and call counts of the AI personas across all sessions."""
+    return AI_LATENCY.snapshot()
+
+def _ai_decision_lines():
+    # Decision latency per persona, from the profiler registry every session's AI reports into
+    series = {}
+    for label, stats in AI_LATENCY.snapshot().items():
+        series[(label,)] = (list(stats['buckets'].values()), stats['total_seconds'])
+    return histogram_lines("election_ai_decision_seconds", "Time an AI persona takes to choose an action.",
+                           LATENCY_BUCKETS, ("persona",), series)
+
+METRICS.add_collector(_ai_decision_lines)
+METRICS.gauge("election_connected_sessions", "Game sessions with a live connection.",
+              lambda: registry.connected_sessions())
+METRICS.gauge("election_resident_sessions", "Game sessions held in memory.",
+              lambda: registry.stats()['resident'])
+METRICS.gauge("election_spectators", "Connected spectators across all games.",
+              lambda: spectators.spectators())
+
+def runner_for(session):
+    """The SessionRunner of a session, created on first use."""
+    runner = session_runners.get(session)
+    if runner is None:
+        runner = session_runners[session] = SessionRunner(session)
+    return runner
+
+# Read-only viewers of running games, keyed by spectate ID
+spectators = SpectatorHub()
+
+def capture_frame(broadcast, extra):
+    # Runs on the engine executor: one projection and encoding shared by every spectator
+    started = time.perf_counter()
+    frame = broadcast.capture(extra)
+    if frame is not None:
+        SERIALIZATION_SECONDS.observe(time.perf_counter() - started, "spectator")
+        PAYLOAD_BYTES.observe(len((frame.patch_text or frame.snapshot_text()).encode("utf-8")), "spectator")
+    return frame
+
+async def publish_frame(broadcast, **extra):
+    """Capture the game's current state for its spectators, if it has any."""
+    if broadcast.subscribers:
+        broadcast.deliver(await runner_for(broadcast.session).run(capture_frame, broadcast, extra))
+
+@app.get("/metrics")
+async def read_metrics():
+    """Server metrics in the Prometheus text format."""
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/stats/sessions")
+async def read_session_stats():
+    """Resident, connected and stored game sessions."""
+    return registry.stats()
+
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = None, pacing: Optional[str] = None):
     await websocket.accept()
-    session = GameSession()
-    session.start_game()
+    pacing = pacing if pacing in PACING_MODES else AI_PACING
+    loop = asyncio.get_running_loop()
+    try:
+        token, session = await loop.run_in_executor(engine_executor, registry.open, token)
+    except SessionLimitError as e:
+        await websocket.send_text(json.dumps({"error": str(e)}))
+        await websocket.close(code=1013)
+        return
+    runner = runner_for(session)
+    stream = StateStream()
+    spectate_id = spectate_id_for(token)
+    broadcast = spectators.attach_player(spectate_id, session)
+    log_fields = bind_context(session=token[:8], pacing=pacing)
+    logger.info("Game session connected")
+
+    def act(func, *args):
+        # Runs on the engine executor: apply the change, then let the registry save it
+        result = func(*args)
+        registry.touch(token)
+        return result
+
+    def play_ai_turns():
+        # Runs on the engine executor: every AI move up to the human's turn, as animation frames
+        frames = [(dict(move, delay_ms=AI_MOVE_DELAY_MS), state) for move, state in session.run_ai_turns()]
+        registry.touch(token)
+        if frames:
+            frames[-1][1]['awaiting_acknowledgement'] = True
+        started = time.perf_counter()
+        text = stream.encode_batch_text(frames)
+        SERIALIZATION_SECONDS.observe(time.perf_counter() - started, "batch")
+        return text
+
+    def encode_state(flags):
+        # Runs on the engine executor: build the client state and encode it against the last one sent
+        started = time.perf_counter()
+        state_data = session.get_state_for_client()
+        state_data.update(flags)
+        text = stream.encode_text(state_data)
+        SERIALIZATION_SECONDS.observe(time.perf_counter() - started, "snapshot" if stream.seq == 1 else "patch")
+        return text
+
+    async def send(text, message_type):
+        PAYLOAD_BYTES.observe(len(text.encode("utf-8")), message_type)
+        started = time.perf_counter()
+        await websocket.send_text(text)
+        WEBSOCKET_SEND_SECONDS.observe(time.perf_counter() - started)
+
+    async def send_state(**flags):
+        # The client holds the last state sent and receives only the changes to it
+        text = await runner.run(encode_state, flags)
+        await send(text, "snapshot" if stream.seq == 1 else "patch")
+        # Spectators see every update too, but not the player's acknowledgement prompt
+        await publish_frame(broadcast, **{key: flags[key] for key in ('game_over', 'scores') if key in flags})
+
+    async def receive_message():
+        # Answer resync requests with a full snapshot until a real message arrives
+        while True:
+            message = json.loads(await websocket.receive_text())
+            if message.get('action_type') != RESYNC_ACTION:
+                return message
+            snapshot = stream.resync()
+            if snapshot is not None:
+                await send(dumps_text(snapshot), "snapshot")
     
     try:
+        # The client keeps the token to resume this game if the connection drops; the spectate
+        # ID can be shared to let others watch
+        await websocket.send_text(json.dumps({"type": "session", "token": token, "spectate_id": spectate_id}))
+
         # Send initial state
-        state_data = session.get_state_for_client()
-        await websocket.send_text(json.dumps(state_data))
+        await send_state()
 
         while not session.is_game_over():
-            # Wait for human action
-            action_data = await websocket.receive_text()
-            session.process_human_action(json.loads(action_data))
-            
-            # Send state update after human action
-            current_state = session.get_state_for_client()
-            await websocket.send_text(json.dumps(current_state))
-
-            # Run AI turns until it's the human's turn again
+            # Run AI turns until it's the human's turn (a resumed game may be mid-way through them)
+            ai_moved = False
+            if pacing == "batch" and not session.is_human_turn():
+                await send(await runner.run(play_ai_turns), "batch")
+                await publish_frame(broadcast)
+                await receive_message()
+                ai_moved = True
             while not session.is_human_turn() and not session.is_game_over():
-                session.process_ai_turn()
-                state_data = session.get_state_for_client()
+                await runner.run(act, session.process_ai_turn)
                 
                 # Add flag to signal the client to wait for acknowledgement
-                state_data['awaiting_acknowledgement'] = True
-                await websocket.send_text(json.dumps(state_data))
+                await send_state(awaiting_acknowledgement=True)
                 
                 # Wait for acknowledgement from the client
-                await websocket.receive_text()
+                await receive_message()
+                ai_moved = True
+
+            if session.is_game_over():
+                break
+
+            if ai_moved:
+                # The client's last state still awaits acknowledgement; clear it so the human can act
+                await send_state()
+
+            # Wait for human action
+            action_data = await receive_message()
+            await runner.run(act, session.process_human_action, action_data)
+            
+            # Send state update after human action
+            await send_state()
 
         # Game is over, send final scores and close
-        final_state = session.get_state_for_client()
-        final_state['game_over'] = True
-        final_state['scores'] = session.engine.get_final_scores(session.state)
-        await websocket.send_text(json.dumps(final_state))
+        scores = await runner.run(session.engine.get_final_scores, session.state)
+        await send_state(game_over=True, scores=scores)
 
     except WebSocketDisconnect:
-        print(f"Client {websocket.client} disconnected.")
+        logger.info("Client %s disconnected", websocket.client)
     except Exception as e:
-        print(f"An error occurred: {e}")
+        logger.exception("Error in websocket handler: %s", e)
         # Optionally send an error message to the client
         try:
             await websocket.send_text(json.dumps({"error": str(e)}))
         except RuntimeError:
-            print("Could not send error message, connection already closed.")
+            logger.info("Could not send error message, connection already closed.")
+    finally:
+        # On the runner, so the final save cannot snapshot the game mid-change
+        await runner.run(registry.release, token)
+        spectators.detach_player(spectate_id)
+        logger.debug("WebSocket connection handler finished.")
+        unbind_context(log_fields)
+
+@app.websocket("/ws/spectate/{spectate_id}")
+async def spectate_endpoint(websocket: WebSocket, spectate_id: str):
+    """Watch a running game. Spectators receive snapshots and patches and cannot act."""
+    await websocket.accept()
+    broadcast = spectators.get(spectate_id)
+    if broadcast is None:
+        await websocket.send_text(json.dumps({"error": "There is no game to watch with this ID."}))
+        await websocket.close(code=4404)
+        return
+    subscriber = broadcast.subscribe()
+    log_fields = bind_context(spectate=spectate_id[:8])
+    logger.info("Spectator joined")
+
+    async def forward_frames():
+        # A slow spectator only ever has the latest frame waiting
+        while True:
+            frame = await subscriber.next_frame()
+            started = time.perf_counter()
+            await websocket.send_text(subscriber.next_text(frame))
+            WEBSOCKET_SEND_SECONDS.observe(time.perf_counter() - started)
+            if frame.final:
+                await websocket.close()
+                return
+
+    async def read_requests():
+        # The only message a spectator may send asks for a fresh snapshot
+        while True:
+            message = json.loads(await websocket.receive_text())
+            if message.get('action_type') == RESYNC_ACTION:
+                broadcast.resync(subscriber)
+
+    try:
+        # Bring the broadcast up to date for the newcomer unless the game has ended
+        if broadcast.latest is None or not broadcast.latest.final:
+            await publish_frame(broadcast)
+        tasks = {asyncio.create_task(forward_frames()), asyncio.create_task(read_requests())}
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()
+    except WebSocketDisconnect:
+        logger.info("Spectator %s disconnected", websocket.client)
+    except Exception as e:
+        logger.exception("Error in spectator handler: %s", e)
     finally:
-        print("WebSocket connection handler finished.")
+        spectators.unsubscribe(spectate_id, subscriber)
+        unbind_context(log_fields)
 
 if __name__ == "__main__":
     import uvicorn
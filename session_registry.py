@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Game Session Registry with Persistence
+
+A websocket connection used to own its GameSession, so a dropped
+connection or a server restart lost the game. The registry keeps sessions
+by a random token instead: a client that reconnects with its token resumes
+the same game, from memory if the session is still resident and from the
+SQLite store otherwise.
+
+Sessions are saved after actions with write coalescing: a session is
+written at most once per save interval while it is busy, and any pending
+write is flushed when its connection closes, when it is evicted and on
+shutdown. Sessions nobody is connected to are evicted from memory after an
+idle timeout or when more than max_resident are held; evicted sessions stay
+resumable from the store until they have gone unsaved for stored_ttl
+seconds, when sweep() purges them. Stored games that can no longer be
+loaded are deleted. The number of connected sessions is capped.
+
+Snapshots pickle the live game state, so a session must not change while
+it is saved: touch(), release() and save() are meant to be called wherever
+the caller serializes work on that session (the server runs them on the
+session's SessionRunner). The registry lock only guards its bookkeeping;
+pickling and database writes happen outside it, so one session's save never
+stalls the others.
+"""
+
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from game_logging import get_logger
+from game_session import GameSession
+
+logger = get_logger(__name__)
+
+
+class SessionLimitError(Exception):
+    """Raised when a new connection would exceed the connected-session cap."""
+
+
+@dataclass
+class _Entry:
+    """A resident session and its bookkeeping."""
+    session: GameSession
+    last_used: float
+    connections: int = 0
+    dirty: bool = False
+    last_saved: float = float('-inf')
+    # Bumped by every touch(), so a save only clears changes made before its snapshot
+    version: int = 0
+
+
+class SessionRegistry:
+    """
+    Thread-safe registry of game sessions keyed by token, backed by SQLite.
+    """
+
+    def __init__(self,
+                 db_path: str = "sessions.db",
+                 max_sessions: int = 200,
+                 max_resident: int = 1000,
+                 idle_seconds: float = 1800.0,
+                 save_interval: float = 2.0,
+                 stored_ttl: float = 7 * 24 * 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the registry.
+
+        Args:
+            db_path: SQLite database file (":memory:" keeps nothing across restarts)
+            max_sessions: Maximum number of sessions with a live connection
+            max_resident: Maximum number of sessions held in memory
+            idle_seconds: Unconnected sessions idle this long are evicted from memory
+            save_interval: Minimum seconds between two writes of a busy session
+            stored_ttl: Stored sessions not written for this long are purged
+            clock: Time source (monotonic seconds)
+        """
+        self.max_sessions = max_sessions
+        self.max_resident = max_resident
+        self.idle_seconds = idle_seconds
+        self.save_interval = save_interval
+        self.stored_ttl = stored_ttl
+        self.clock = clock
+        self.writes = 0
+        self._lock = threading.RLock()
+        # The connection is shared by all threads; taken after _lock, never before it
+        self._db_lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "token TEXT PRIMARY KEY, snapshot BLOB NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at)")
+        self._db.commit()
+
+    def open(self, token: Optional[str] = None) -> Tuple[str, GameSession]:
+        """
+        Connect to a session, resuming it if the token is known.
+
+        Args:
+            token: Token from an earlier connection, or None for a new game
+
+        Returns:
+            Tuple[str, GameSession]: The token (new if the old one was unknown)
+                and the session
+
+        Raises:
+            SessionLimitError: If max_sessions sessions are already connected
+        """
+        with self._lock:
+            entry = self._entries.get(token) if token else None
+            if entry is None and token:
+                session = self._load(token)
+                if session is not None:
+                    entry = self._admit(token, session)
+            if entry is None or entry.connections == 0:
+                if self.connected_sessions() >= self.max_sessions:
+                    raise SessionLimitError(f"Server is full ({self.max_sessions} games in progress)")
+            if entry is None:
+                token = secrets.token_urlsafe(16)
+                session = GameSession()
+                session.start_game()
+                entry = self._admit(token, session)
+                entry.dirty = True
+            entry.connections += 1
+            entry.last_used = self.clock()
+            self._entries.move_to_end(token)
+            self._evict_over_cap()
+            return token, entry.session
+
+    def touch(self, token: str) -> None:
+        """
+        Record that a session changed, saving it unless it was saved within
+        the save interval (the pending write is then coalesced into a later one).
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return
+            now = self.clock()
+            entry.last_used = now
+            entry.dirty = True
+            entry.version += 1
+            self._entries.move_to_end(token)
+            due = now - entry.last_saved >= self.save_interval
+        if due:
+            self.save(token)
+
+    def save(self, token: str) -> None:
+        """Write a session's unsaved changes, if it has any."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or not entry.dirty:
+                return
+            version = entry.version
+        snapshot = entry.session.to_snapshot()
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sessions (token, snapshot, updated_at) VALUES (?, ?, ?)",
+                (token, snapshot, time.time())
+            )
+            self._db.commit()
+        with self._lock:
+            entry.last_saved = self.clock()
+            entry.dirty = entry.version != version
+            self.writes += 1
+
+    def unsaved(self, due_only: bool = False) -> List[Tuple[str, GameSession]]:
+        """
+        Sessions with changes not yet written.
+
+        Args:
+            due_only: Only sessions whose coalesced write is due
+
+        Returns:
+            List[Tuple[str, GameSession]]: Token and session of each
+        """
+        with self._lock:
+            now = self.clock()
+            return [
+                (token, entry.session) for token, entry in self._entries.items()
+                if entry.dirty and (not due_only or now - entry.last_saved >= self.save_interval)
+            ]
+
+    def release(self, token: str) -> None:
+        """
+        Disconnect from a session, flushing any pending write. Finished games
+        are forgotten.
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return
+            entry.connections = max(0, entry.connections - 1)
+            entry.last_used = self.clock()
+            finished = entry.session.is_game_over() and entry.connections == 0
+            if finished:
+                del self._entries[token]
+        if finished:
+            with self._db_lock:
+                self._db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+                self._db.commit()
+        else:
+            self.save(token)
+
+    def sweep(self, save_due: bool = True) -> None:
+        """
+        Write sessions whose coalesced writes are due, evict idle sessions and
+        purge stored sessions older than stored_ttl.
+
+        Sessions with unsaved changes are not evicted; they stay resident
+        until a later sweep finds them written.
+
+        Args:
+            save_due: Write due sessions here. Pass False if the caller has
+                already saved them under their own locks (see unsaved())
+        """
+        if save_due:
+            for token, _ in self.unsaved(due_only=True):
+                self.save(token)
+        with self._lock:
+            now = self.clock()
+            for token, entry in list(self._entries.items()):
+                if entry.connections == 0 and not entry.dirty and now - entry.last_used >= self.idle_seconds:
+                    del self._entries[token]
+            self._evict_over_cap()
+            self._purge_expired()
+
+    def flush(self) -> None:
+        """Write every session with unsaved changes."""
+        for token, _ in self.unsaved():
+            self.save(token)
+
+    def close(self) -> None:
+        """Flush and close the store."""
+        self.flush()
+        with self._lock, self._db_lock:
+            self._db.close()
+
+    def connected_sessions(self) -> int:
+        """Number of sessions with at least one live connection."""
+        with self._lock:
+            return sum(1 for entry in self._entries.values() if entry.connections > 0)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of resident, connected and stored sessions, and writes so far."""
+        with self._lock, self._db_lock:
+            stored = self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            return {
+                'resident': len(self._entries),
+                'connected': self.connected_sessions(),
+                'stored': stored,
+                'writes': self.writes
+            }
+
+    def is_resident(self, token: str) -> bool:
+        with self._lock:
+            return token in self._entries
+
+    def _admit(self, token: str, session: GameSession) -> _Entry:
+        entry = _Entry(session=session, last_used=self.clock())
+        self._entries[token] = entry
+        return entry
+
+    def _load(self, token: str) -> Optional[GameSession]:
+        with self._db_lock:
+            row = self._db.execute("SELECT snapshot FROM sessions WHERE token = ?", (token,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return GameSession.from_snapshot(row[0])
+        except Exception as e:
+            # It will never load, so drop it rather than retrying on every reconnect
+            logger.warning("Could not resume session %s, deleting it: %s", token[:8], e)
+            with self._db_lock:
+                self._db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+                self._db.commit()
+            return None
+
+    def _purge_expired(self) -> None:
+        # Under the registry lock so a session cannot be resumed from a row being purged; resident
+        # sessions are kept, a later save rewrites them. updated_at is wall-clock time
+        cutoff = time.time() - self.stored_ttl
+        with self._db_lock:
+            expired = [token for (token,) in self._db.execute(
+                "SELECT token FROM sessions WHERE updated_at < ?", (cutoff,)
+            ) if token not in self._entries]
+            if expired:
+                self._db.executemany("DELETE FROM sessions WHERE token = ?", [(token,) for token in expired])
+                self._db.commit()
+        if expired:
+            logger.info("Purged %d expired sessions", len(expired))
+
+    def _evict_over_cap(self) -> None:
+        # Least recently used first; connected sessions and unsaved changes are never evicted
+        for token, entry in list(self._entries.items()):
+            if len(self._entries) <= self.max_resident:
+                break
+            if entry.connections == 0 and not entry.dirty:
+                del self._entries[token]
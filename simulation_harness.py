@@ -12,8 +12,10 @@ import time
 from typing import List, Dict, Any, Optional, Callable, Sequence
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from collections import Counter
 
 from engine.engine import GameEngine
+from engine import resolvers
 from models.game_state import GameState
 from models.components import Player
 from engine.actions import (
@@ -70,6 +72,7 @@ class VerboseLogger(MetricsLogger):
         self.round_count = 0
         self.term_count = 0
         self.game_log = []
+        self.action_counts: Dict[int, Counter] = {}  # player id -> action type -> count
     
     def log_start(self, state: GameState) -> None:
         player_names = [p.name for p in state.players]
@@ -78,6 +81,7 @@ class VerboseLogger(MetricsLogger):
     def log_action(self, action: Action, new_state: GameState) -> None:
         current_player = new_state.get_current_player()
         print(f"{current_player.name} chose: {action.__class__.__name__}")
+        self.action_counts.setdefault(action.player_id, Counter())[action.__class__.__name__] += 1
     
     def log_round_end(self, state: GameState, round_number: int) -> None:
         self.round_count = round_number
@@ -111,7 +115,8 @@ class VerboseLogger(MetricsLogger):
             final_scores=final_scores,
             game_log=final_state.turn_log,
             simulation_time_seconds=simulation_time,
-            final_state=final_state
+            final_state=final_state,
+            action_counts={player_id: dict(counts) for player_id, counts in self.action_counts.items()}
         )
 
 
@@ -125,12 +130,13 @@ class SilentLogger(MetricsLogger):
         self.round_count = 0
         self.term_count = 0
         self.game_log = []
+        self.action_counts: Dict[int, Counter] = {}  # player id -> action type -> count
     
     def log_start(self, state: GameState) -> None:
         pass
     
     def log_action(self, action: Action, new_state: GameState) -> None:
-        pass
+        self.action_counts.setdefault(action.player_id, Counter())[action.__class__.__name__] += 1
     
     def log_round_end(self, state: GameState, round_number: int) -> None:
         self.round_count = round_number
@@ -153,7 +159,8 @@ class SilentLogger(MetricsLogger):
             final_scores=final_scores,
             game_log=final_state.turn_log,
             simulation_time_seconds=simulation_time,
-            final_state=final_state
+            final_state=final_state,
+            action_counts={player_id: dict(counts) for player_id, counts in self.action_counts.items()}
         )
 
 
@@ -242,6 +249,9 @@ class SimulationResult:
     game_log: List[str]
     simulation_time_seconds: float
     final_state: Optional[GameState] = None  # Add final state for analysis
+    error: Optional[str] = None  # Set when the game loop stopped on an exception
+    agent_stats: Optional[Dict[int, Dict[str, Any]]] = None  # Decision latency per seat, for profiled agents
+    action_counts: Optional[Dict[int, Dict[str, int]]] = None  # player id -> action type -> count
 
 
 class SimulationHarness:
@@ -282,6 +292,48 @@ class SimulationHarness:
         
         return game_state
     
+    def _advance_game_flow(self, state: GameState) -> GameState:
+        """
+        Advance turn, round and term after a player action.
+
+        Mirrors GameSession._advance_game_flow: the turn passes once the current
+        player is out of action points, upkeep runs once everyone is, and after
+        the fourth round the term moves to the legislation and election session.
+        """
+        current_player = state.get_current_player()
+        if state.action_points.get(current_player.id, 0) <= 0:
+            state.current_player_index = (state.current_player_index + 1) % len(state.players)
+
+        if all(state.action_points.get(p.id, 0) <= 0 for p in state.players):
+            state.current_phase = "UPKEEP_PHASE"
+            state = resolvers.resolve_upkeep(state)
+            state.round_marker += 1
+
+            if state.round_marker >= 5:
+                state.round_marker = 4
+                state.current_phase = "LEGISLATION_PHASE"
+                if state.term_legislation:
+                    state.awaiting_legislation_resolution = True
+                else:
+                    state.current_phase = "ELECTION_PHASE"
+                    state.awaiting_election_resolution = True
+            else:
+                state = self.engine.run_event_phase(state)
+
+        return state
+    
+    def _resolve_system_action(self, state: GameState, action: Action, logger: MetricsLogger) -> GameState:
+        """Run a legislation, election or next-term system action."""
+        if isinstance(action, ActionResolveLegislation):
+            state = self.engine.resolve_legislation_session(state)
+        elif isinstance(action, ActionResolveElections):
+            state = self.engine.resolve_elections_session(state, disable_dice_roll=self.disable_dice_roll)
+        elif isinstance(action, ActionAcknowledgeResults):
+            state = self.engine.start_next_term(state)
+            state.current_phase = "ACTION_PHASE"
+            logger.log_term_end(state, state.term_counter)
+        return state
+
     def run_simulation(self, 
                       player_agents: Sequence[Agent],
                       player_names: Optional[List[str]] = None,
@@ -315,7 +367,7 @@ class SimulationHarness:
         logger.log_start(state)
         
         round_count = 0
-        term_count = 0
+        error = None
         
         # Initialize tracing if enabled
         trace_log = []
@@ -344,13 +396,9 @@ class SimulationHarness:
                         trace_log.append(f"System action: {action.__class__.__name__}")
                     
                     try:
-                        # Handle system actions directly
-                        if isinstance(action, ActionResolveLegislation):
-                            state = self.engine.resolve_legislation_session(state)
-                        elif isinstance(action, ActionResolveElections):
-                            state = self.engine.resolve_elections_session(state, disable_dice_roll=self.disable_dice_roll)
-                        elif isinstance(action, ActionAcknowledgeResults):
-                            state = self.engine.start_next_term(state)
+                        state = self._resolve_system_action(state, action, logger)
+                        if isinstance(action, ActionAcknowledgeResults) and enable_tracing:
+                            trace_log.append(f"=== TERM {state.term_counter} END ===")
                         
                         if enable_tracing:
                             trace_log.append(f"System action executed successfully")
@@ -361,6 +409,7 @@ class SimulationHarness:
                             trace_log.append(f"Action: {action.__class__.__name__}")
                             trace_log.append(f"Error: {str(e)}")
                         print(f"Error processing system action {action}: {e}")
+                        error = f"System action {action.__class__.__name__} failed: {e}"
                         break
                     
                     continue
@@ -383,6 +432,7 @@ class SimulationHarness:
                             trace_log.append(f"Player: {state.get_current_player().name}")
                             trace_log.append(f"Error: {str(e)}")
                         print(f"Error getting valid actions for {state.get_current_player().name}: {e}")
+                        error = f"Getting valid actions failed: {e}"
                         break
                     
                     if not valid_actions:
@@ -418,6 +468,7 @@ class SimulationHarness:
                     try:
                         state = self.engine.process_action(state, action)
                         logger.log_action(action, state)
+                        state = self._advance_game_flow(state)
                         
                         if enable_tracing:
                             trace_log.append(f"Action executed successfully")
@@ -428,15 +479,9 @@ class SimulationHarness:
                             trace_log.append(f"Action: {action.__class__.__name__}")
                             trace_log.append(f"Error: {str(e)}")
                         print(f"Error processing action {action}: {e}")
+                        error = f"Action {action.__class__.__name__} failed: {e}"
                         break
-                
-                # Track term transitions
-                if state.round_marker == 1 and round_count > 1:
-                    term_count += 1
-                    logger.log_term_end(state, term_count)
-                    
-                    if enable_tracing:
-                        trace_log.append(f"=== TERM {term_count} END ===")
+
             
             if enable_tracing:
                 trace_log.append(f"=== SIMULATION COMPLETE ===")
@@ -448,6 +493,7 @@ class SimulationHarness:
                 trace_log.append(f"=== CRITICAL ERROR ===")
                 trace_log.append(f"Error: {str(e)}")
             print(f"Critical error during simulation: {e}")
+            error = f"Critical error: {e}"
             # Continue to finalize rather than crashing
         
         # Add trace to final state if tracing was enabled
@@ -456,7 +502,117 @@ class SimulationHarness:
         
         # Calculate final results using the logger
         simulation_time = time.time() - start_time
-        return logger.finalize(state, simulation_time)
+        result = logger.finalize(state, simulation_time)
+        result.error = error
+        result.agent_stats = self._agent_stats(player_agents)
+        return result
+
+    @staticmethod
+    def _agent_stats(player_agents: Sequence[Agent]) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Latency stats of every seat whose agent reports them (see agent_profiler.ProfiledAgent)."""
+        stats = {seat: agent.latency_stats() for seat, agent in enumerate(player_agents)
+                 if hasattr(agent, 'latency_stats')}
+        return stats or None
+
+    def run_lockstep_simulations(self,
+                                 player_agents: Sequence[Agent],
+                                 num_games: int,
+                                 player_names: Optional[List[str]] = None,
+                                 max_rounds: int = 100) -> List[SimulationResult]:
+        """
+        Run several games side by side, batching decisions per agent.
+
+        All games share the same agents (one per seat). At every step each
+        unfinished game advances by one action; the pending player decisions
+        are grouped by seat and each agent receives them in a single
+        choose_actions() call, so vectorized personas can score many states
+        at once. Agents without choose_actions() are called once per game.
+
+        Args:
+            player_agents: List of agent objects, one per seat
+            num_games: Number of games to run
+            player_names: Optional list of player names (defaults to Agent 0, Agent 1, etc.)
+            max_rounds: Maximum number of steps per game, as in run_simulation()
+
+        Returns:
+            List[SimulationResult]: One result per game, in game order
+        """
+        if player_names is None:
+            player_names = [f"Agent {i}" for i in range(len(player_agents))]
+
+        start_time = time.time()
+        games = []
+        for _ in range(num_games):
+            logger = SilentLogger()
+            state = self.create_game(player_names)
+            logger.log_start(state)
+            games.append({'state': state, 'logger': logger, 'rounds': 0, 'error': None, 'done': False})
+
+        while True:
+            pending: Dict[int, List[Dict[str, Any]]] = {}
+            for game in games:
+                if game['done']:
+                    continue
+                state = game['state']
+                if self.engine.is_game_over(state) or game['rounds'] >= max_rounds:
+                    game['done'] = True
+                    continue
+                game['rounds'] += 1
+                game['logger'].log_round_end(state, game['rounds'])
+
+                try:
+                    system_actions = self.engine.get_valid_system_actions(state)
+                    if system_actions:
+                        game['state'] = self._resolve_system_action(state, system_actions[0], game['logger'])
+                        continue
+                    if state.current_phase != "ACTION_PHASE":
+                        continue
+                    player_id = state.get_current_player().id
+                    game['valid_actions'] = self.engine.get_valid_actions(state, player_id)
+                except Exception as e:
+                    print(f"Error advancing lockstep game: {e}")
+                    game['error'] = f"Lockstep step failed: {e}"
+                    game['done'] = True
+                    continue
+                pending.setdefault(player_id, []).append(game)
+
+            if all(game['done'] for game in games):
+                break
+
+            for player_id, batch in pending.items():
+                agent = player_agents[player_id]
+                decisions = [(game['state'], game['valid_actions']) for game in batch if game['valid_actions']]
+                try:
+                    if hasattr(agent, 'choose_actions'):
+                        chosen = iter(agent.choose_actions(decisions))
+                    else:
+                        chosen = iter([agent.choose_action(state, valid) for state, valid in decisions])
+                except Exception as e:
+                    print(f"Error: Agent {player_names[player_id]} failed to choose actions: {e}")
+                    chosen = iter([])
+
+                for game in batch:
+                    valid_actions = game.pop('valid_actions')
+                    action = next(chosen, None) if valid_actions else None
+                    if action is None or action not in valid_actions:
+                        action = ActionPassTurn(player_id=player_id)
+                    try:
+                        state = self.engine.process_action(game['state'], action)
+                        game['logger'].log_action(action, state)
+                        game['state'] = self._advance_game_flow(state)
+                    except Exception as e:
+                        print(f"Error processing action {action}: {e}")
+                        game['error'] = f"Action {action.__class__.__name__} failed: {e}"
+                        game['done'] = True
+
+        simulation_time = (time.time() - start_time) / max(1, num_games)
+        results = []
+        for game in games:
+            result = game['logger'].finalize(game['state'], simulation_time)
+            result.error = game['error']
+            result.agent_stats = self._agent_stats(player_agents)
+            results.append(result)
+        return results
 
 
 def create_random_agent() -> Agent:
@@ -44,11 +44,29 @@ class GameStateEncoder(json.JSONEncoder):
             return value
 
 from simulation_harness import SimulationHarness, SimulationResult, SilentLogger
+from result_sampling import GameLogSampler, score_margin
+from quantile_sketch import SketchSet
+from analysis import persona_label
+from adaptive_allocation import AdaptiveAllocator
 from personas import (
-    RandomPersona, EconomicPersona, LegislativePersona, BalancedPersona, HeuristicPersona
+    RandomPersona, EconomicPersona, LegislativePersona, BalancedPersona, HeuristicPersona, MCTSPersona,
+    WeightedPersona, BeliefPersona
 )
 
 
+# Persona type names accepted in configuration files and tournament pools
+PERSONA_TYPES = {
+    'random': RandomPersona,
+    'economic': EconomicPersona,
+    'legislative': LegislativePersona,
+    'balanced': BalancedPersona,
+    'heuristic': HeuristicPersona,
+    'mcts': MCTSPersona,
+    'weighted': WeightedPersona,
+    'belief': BeliefPersona
+}
+
+
 class SimulationRunner:
     """
     Configuration-driven simulation runner for large-scale game analysis.
@@ -67,6 +85,9 @@ class SimulationRunner:
         self.config_path = config_path
         self.config = self._load_config()
         self.harness = SimulationHarness()
+        # Quantile sketches of final PC, influence, margins and game length,
+        # merged across every experiment of the batch
+        self.sketches = SketchSet()
         
         # Set random seed for reproducible results
         if 'random_seed' in self.config.get('global', {}):
@@ -94,7 +115,14 @@ class SimulationRunner:
                 'log_level': 'silent',
                 'save_game_logs': True,
                 'save_final_states': True,
-                'enable_tracing': False
+                'enable_tracing': False,
+                'log_sampling': {
+                    'enabled': True,
+                    'reservoir_size': 50,
+                    'keep_longest': 5,
+                    'keep_largest_margins': 5,
+                    'keep_errors': True
+                }
             },
             'analysis': {
                 'generate_reports': True,
@@ -128,19 +156,11 @@ class SimulationRunner:
         Returns:
             Persona instance
         """
-        persona_map = {
-            'random': RandomPersona,
-            'economic': EconomicPersona,
-            'legislative': LegislativePersona,
-            'balanced': BalancedPersona,
-            'heuristic': HeuristicPersona
-        }
-        
-        if persona_type not in persona_map:
+        if persona_type not in PERSONA_TYPES:
             print(f"Unknown persona type: {persona_type}. Using RandomPersona.")
             persona_type = 'random'
         
-        return persona_map[persona_type](name=name)
+        return PERSONA_TYPES[persona_type](name=name)
     
     def _create_player_agents(self) -> List[Any]:
         """Create agent instances for all players."""
@@ -159,9 +179,83 @@ class SimulationRunner:
         Path(output_dir).mkdir(exist_ok=True)
         return output_dir
     
-    def _save_simulation_results(self, results: List[SimulationResult], output_dir: str, experiment_name: str = ""):
-        """Save simulation results to files."""
+    def _create_log_sampler(self) -> Optional[GameLogSampler]:
+        """
+        Create the sampler that decides which games keep full logs and states.
+        
+        Returns:
+            GameLogSampler, or None if every game should be kept in full
+        """
+        sampling_config = self.config.get('data_collection', {}).get('log_sampling')
+        if not sampling_config or not sampling_config.get('enabled', True):
+            return None
+        return GameLogSampler.from_config(sampling_config)
+    
+    @staticmethod
+    def _summarize_result(game_id: int, result: SimulationResult) -> Dict[str, Any]:
+        """
+        Build the compact summary recorded for every game.
+        
+        Args:
+            game_id: Index of the game within its experiment
+            result: Result of the game
+            
+        Returns:
+            Dictionary with the outcome, scores and per-player end state and
+            action counts
+        """
+        action_counts = result.action_counts or {}
+        players = []
+        if result.final_state is not None:
+            for player in result.final_state.players:
+                score = result.final_scores.get(player.id, {})
+                players.append({
+                    'id': player.id,
+                    'name': player.name,
+                    'pc': player.pc,
+                    'influence': score.get('total_influence', 0) if isinstance(score, dict) else score,
+                    'actions': dict(action_counts.get(player.id, {}))
+                })
+        
+        return {
+            'game_id': game_id,
+            'winner_id': result.winner_id,
+            'winner_name': result.winner_name,
+            'game_length_rounds': result.game_length_rounds,
+            'game_length_terms': result.game_length_terms,
+            'simulation_time_seconds': result.simulation_time_seconds,
+            'score_margin': score_margin(result.final_scores),
+            'players': players,
+            'error': result.error
+        }
+    
+    def _save_simulation_results(self, results: List[SimulationResult], output_dir: str, experiment_name: str = "",
+                                 summaries: Optional[List[Dict[str, Any]]] = None,
+                                 sampler: Optional[GameLogSampler] = None,
+                                 sketches: Optional[SketchSet] = None):
+        """
+        Save simulation results to files.
+        
+        Every game is written as a compact summary. Full game logs and final
+        states are added only for games the sampler retained (or for every
+        game when no sampler is used), subject to the save_game_logs and
+        save_final_states settings.
+        
+        Args:
+            results: Results of the experiment, in game order
+            output_dir: Directory to write the files to
+            experiment_name: Prefix for the output file names
+            summaries: Precomputed per-game summaries (built from results if omitted)
+            sampler: Sampler that chose which games keep their full detail
+            sketches: Quantile sketches for the experiment, saved alongside the results
+        """
         timestamp = int(time.time())
+        data_config = self.config.get('data_collection', {})
+        save_game_logs = data_config.get('save_game_logs', True)
+        save_final_states = data_config.get('save_final_states', True)
+        
+        if summaries is None:
+            summaries = [self._summarize_result(i, result) for i, result in enumerate(results)]
         
         # Create filename prefix
         prefix = f"{experiment_name}_" if experiment_name else ""
@@ -175,26 +269,185 @@ class SimulationRunner:
                 'game_length_terms', 'simulation_time_seconds'
             ])
             
-            for i, result in enumerate(results):
+            for summary in summaries:
                 writer.writerow([
-                    i, result.winner_id, result.winner_name,
-                    result.game_length_rounds, result.game_length_terms,
-                    result.simulation_time_seconds
+                    summary['game_id'], summary['winner_id'], summary['winner_name'],
+                    summary['game_length_rounds'], summary['game_length_terms'],
+                    summary['simulation_time_seconds']
                 ])
         
         # Save detailed JSON results
+        retained = sampler.retained() if sampler is not None else None
+        detailed = []
+        for summary, result in zip(summaries, results):
+            entry = dict(summary)
+            reasons = retained.get(summary['game_id']) if retained is not None else ['all']
+            if reasons:
+                entry['retained_for'] = reasons
+                entry['final_scores'] = result.final_scores
+                if save_game_logs:
+                    entry['game_log'] = result.game_log
+                if save_final_states:
+                    entry['final_state'] = result.final_state
+            detailed.append(entry)
+        
         json_path = os.path.join(output_dir, f"{prefix}detailed_results_{timestamp}.json")
         with open(json_path, 'w') as f:
-            json.dump(results, f, indent=2, cls=GameStateEncoder)
+            json.dump(detailed, f, indent=2, cls=GameStateEncoder)
+        
+        if sketches is not None:
+            sketch_path = os.path.join(output_dir, f"{prefix}quantile_sketches_{timestamp}.json")
+            with open(sketch_path, 'w') as f:
+                json.dump(sketches.to_dict(), f)
         
         print(f"Results saved to {output_dir}")
         print(f"  Summary: {csv_path}")
         print(f"  Details: {json_path}")
+        if sketches is not None:
+            print(f"  Sketches: {sketch_path}")
+        if retained is not None:
+            print(f"  Full logs kept for {len(retained)}/{len(summaries)} games")
+    
+    def _prepare_experiment(self, experiment: Dict[str, Any], output_base_dir: str) -> Dict[str, Any]:
+        """
+        Create the agents, harness and result buffers for one experiment.
+        
+        Args:
+            experiment: Experiment definition from the configuration
+            output_base_dir: Base directory for experiment outputs
+            
+        Returns:
+            Dictionary holding the experiment's running state
+        """
+        experiment_name = experiment['name']
+        experiment_desc = experiment.get('description', 'No description')
+        players = experiment['players']
+        
+        print(f"\n{'='*60}")
+        print(f"Running Experiment: {experiment_name}")
+        print(f"Description: {experiment_desc}")
+        print(f"Games: {experiment['num_games']}")
+        print(f"{'='*60}")
+        
+        # Create agents for this experiment
+        agents = []
+        player_names = []
+        for player_config in players:
+            persona = self._create_persona(
+                player_config['persona'], 
+                player_config['name']
+            )
+            agents.append(persona)
+            player_names.append(player_config['name'])
+        
+        print(f"Players:")
+        for i, (agent, name) in enumerate(zip(agents, player_names)):
+            print(f"  Player {i}: {name} ({agent.__class__.__name__})")
+        
+        # Create experiment-specific output directory
+        experiment_dir = os.path.join(output_base_dir, experiment_name)
+        Path(experiment_dir).mkdir(exist_ok=True)
+        
+        # Check for disable_dice_roll setting in experiment config
+        disable_dice_roll = experiment.get('disable_dice_roll', False)
+        if disable_dice_roll:
+            print(f"  Dice rolls disabled for this experiment")
+            # Create a new harness with dice rolls disabled
+            experiment_harness = SimulationHarness(disable_dice_roll=True)
+        else:
+            experiment_harness = self.harness
+        
+        return {
+            'name': experiment_name,
+            'dir': experiment_dir,
+            'agents': agents,
+            'player_names': player_names,
+            'harness': experiment_harness,
+            'results': [],
+            'summaries': [],
+            'sampler': self._create_log_sampler(),
+            'sketches': SketchSet(),
+            'games_attempted': 0,
+            'elapsed': 0.0
+        }
+    
+    def _play_games(self, run: Dict[str, Any], num_games: int, max_rounds: int,
+                    allocator: Optional[AdaptiveAllocator] = None) -> None:
+        """
+        Play games for an experiment and fold them into its running state.
+        
+        Args:
+            run: Experiment state from _prepare_experiment
+            num_games: Number of games to play
+            max_rounds: Maximum rounds per game
+            allocator: Adaptive allocator to report outcomes to, if any
+        """
+        results = run['results']
+        summaries = run['summaries']
+        sampler = run['sampler']
+        # Get tracing setting from config
+        enable_tracing = self.config['data_collection'].get('enable_tracing', False)
+        start_time = time.time()
+        
+        for _ in range(num_games):
+            game_id = run['games_attempted']
+            run['games_attempted'] += 1
+            if game_id % 100 == 0 and game_id > 0:
+                elapsed = run['elapsed'] + time.time() - start_time
+                rate = game_id / elapsed
+                print(f"  Completed {game_id} games ({rate:.1f} games/sec)")
+            
+            try:
+                result = run['harness'].run_simulation(
+                    run['agents'], run['player_names'], max_rounds, SilentLogger(), enable_tracing
+                )
+            except Exception as e:
+                print(f"  Error in game {game_id}: {e}")
+                if allocator is not None:
+                    allocator.record(run['name'], None)
+                # Continue with next game
+                continue
+            
+            summary = self._summarize_result(len(results), result)
+            results.append(result)
+            summaries.append(summary)
+            # Keyed like the analysis keys its sketches, so saved sketches merge with its cache
+            run['sketches'].add_game([persona_label(player['name']) for player in summary['players']],
+                                     summary['players'], summary['game_length_rounds'])
+            if allocator is not None:
+                allocator.record(run['name'], result.winner_name)
+            
+            if sampler is not None:
+                # Drop the heavy parts of games that are no longer retained
+                # so memory stays bounded by the sample size
+                for evicted_id in sampler.offer(summary['game_id'], summary['game_length_rounds'],
+                                                summary['score_margin'], result.error):
+                    results[evicted_id].game_log = []
+                    results[evicted_id].final_state = None
+        
+        run['elapsed'] += time.time() - start_time
+    
+    def _finish_experiment(self, run: Dict[str, Any]) -> List[SimulationResult]:
+        """Report timing, save the experiment's files and merge its sketches."""
+        games = max(1, run['games_attempted'])
+        print(f"  Experiment {run['name']} completed in {run['elapsed']:.1f} seconds")
+        print(f"  Average time per game: {run['elapsed']/games:.3f} seconds")
+        
+        # Save results for this experiment
+        self._save_simulation_results(run['results'], run['dir'], run['name'],
+                                      run['summaries'], run['sampler'], run['sketches'])
+        self.sketches.merge(run['sketches'])
+        return run['results']
     
     def run_simulation_batch(self) -> Dict[str, List[SimulationResult]]:
         """
         Run multiple experiments according to configuration.
         
+        With `allocation.mode: adaptive`, games are handed out in batches to
+        the experiments whose leading win rates are least certain, within a
+        global games budget, instead of playing every experiment's
+        `num_games` in full.
+        
         Returns:
             Dictionary mapping experiment names to their results
         """
@@ -217,76 +470,33 @@ class SimulationRunner:
             print("No experiments defined in configuration.")
             return {}
         
-        for experiment in experiments:
-            experiment_name = experiment['name']
-            experiment_desc = experiment.get('description', 'No description')
-            num_games = experiment['num_games']
-            players = experiment['players']
+        allocation_config = self.config.get('allocation', {})
+        if allocation_config.get('mode', 'fixed') == 'adaptive':
+            runs = {experiment['name']: self._prepare_experiment(experiment, output_base_dir)
+                    for experiment in experiments}
+            allocator = AdaptiveAllocator.from_config(allocation_config, experiments)
             
-            print(f"\n{'='*60}")
-            print(f"Running Experiment: {experiment_name}")
-            print(f"Description: {experiment_desc}")
-            print(f"Games: {num_games}")
-            print(f"{'='*60}")
+            print(f"\nAdaptive allocation: budget {allocator.total_games} games, "
+                  f"batches of {allocator.batch_size}")
+            while True:
+                batch = allocator.next_batch()
+                if batch is None:
+                    break
+                experiment_name, num_games = batch
+                self._play_games(runs[experiment_name], num_games, max_rounds, allocator)
             
-            # Create agents for this experiment
-            agents = []
-            player_names = []
-            for player_config in players:
-                persona = self._create_persona(
-                    player_config['persona'], 
-                    player_config['name']
-                )
-                agents.append(persona)
-                player_names.append(player_config['name'])
-            
-            print(f"Players:")
-            for i, (agent, name) in enumerate(zip(agents, player_names)):
-                print(f"  Player {i}: {name} ({agent.__class__.__name__})")
-            
-            # Create experiment-specific output directory
-            experiment_dir = os.path.join(output_base_dir, experiment_name)
-            Path(experiment_dir).mkdir(exist_ok=True)
-            
-            # Run simulations for this experiment
-            results = []
-            start_time = time.time()
-            
-            # Check for disable_dice_roll setting in experiment config
-            disable_dice_roll = experiment.get('disable_dice_roll', False)
-            if disable_dice_roll:
-                print(f"  Dice rolls disabled for this experiment")
-                # Create a new harness with dice rolls disabled
-                experiment_harness = SimulationHarness(disable_dice_roll=True)
-            else:
-                experiment_harness = self.harness
+            print(f"  Used {allocator.games_used}/{allocator.total_games} games")
+            for experiment_name, status in allocator.summary().items():
+                state = "resolved" if status['resolved'] else "uncertain"
+                print(f"  - {experiment_name}: {status['games']} games ({state})")
             
-            for game_id in range(num_games):
-                if game_id % 100 == 0 and game_id > 0:
-                    elapsed = time.time() - start_time
-                    rate = game_id / elapsed
-                    print(f"  Completed {game_id}/{num_games} games ({rate:.1f} games/sec)")
-                
-                try:
-                    # Get tracing setting from config
-                    enable_tracing = self.config['data_collection'].get('enable_tracing', False)
-                    
-                    result = experiment_harness.run_simulation(
-                        agents, player_names, max_rounds, SilentLogger(), enable_tracing
-                    )
-                    results.append(result)
-                except Exception as e:
-                    print(f"  Error in game {game_id}: {e}")
-                    # Continue with next game
-            
-            experiment_time = time.time() - start_time
-            print(f"  Experiment completed in {experiment_time:.1f} seconds")
-            print(f"  Average time per game: {experiment_time/num_games:.3f} seconds")
-            
-            # Save results for this experiment
-            self._save_simulation_results(results, experiment_dir, experiment_name)
-            
-            all_results[experiment_name] = results
+            for experiment_name, run in runs.items():
+                all_results[experiment_name] = self._finish_experiment(run)
+        else:
+            for experiment in experiments:
+                run = self._prepare_experiment(experiment, output_base_dir)
+                self._play_games(run, experiment['num_games'], max_rounds)
+                all_results[experiment['name']] = self._finish_experiment(run)
         
         total_time = time.time() - total_start_time
         print(f"\n{'='*60}")
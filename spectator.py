@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Spectator Broadcast for Running Games
+
+Viewers join a running game through GET /ws/spectate/{spectate_id} as
+read-only subscribers. Encoding state per viewer does not scale, so each
+game has one Broadcast: after every update the state is projected for
+spectators, diffed against the previous frame and encoded once, and the
+same text goes to every subscriber. The matching snapshot is encoded at
+most once per frame, only if some subscriber needs one.
+
+Each subscriber holds at most one undelivered frame. A viewer that cannot
+keep up skips straight to the latest frame instead of queueing, and since
+it then missed a patch it is sent that frame's snapshot.
+
+The spectator projection hides what only a player may see: personal
+mandates, the amounts of secret commitments (legislation support and
+opposition and the log lines that state them) and the human's pending
+prompt.
+"""
+
+import asyncio
+import hashlib
+import re
+from typing import Any, Dict, Optional, Set
+
+from game_data import serialize_catalog
+from game_session import GameSession
+from state_delta import diff
+from state_serializer import dumps_text, to_plain
+
+# Log lines that reveal how much PC a player secretly committed
+SECRET_LOG_LINE = re.compile(r"\bsecretly commit(?:s|ted)? \d+ PC")
+
+
+def spectate_id_for(token: str) -> str:
+    """
+    Public ID under which a session can be watched.
+
+    Derived one way from the session token, so sharing it lets viewers
+    watch the game but not resume or play it.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def spectator_state(session: GameSession, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    The state of a game as spectators may see it.
+
+    Args:
+        session: The game being watched
+        extra: Additional fields, e.g. final scores
+
+    Returns:
+        Dict[str, Any]: Client state without mandates, secret commitments,
+            the pending prompt or valid actions
+    """
+    state = session.state.to_dict(include_static=False)
+    for player in state['players']:
+        player['mandate_id'] = None
+    for legislation in state['term_legislation']:
+        legislation.pop('support_players', None)
+        legislation.pop('oppose_players', None)
+    state.pop('pending_ui_action', None)
+    state.pop('turn_log', None)
+    state['log'] = [line for line in session.state.turn_log if not SECRET_LOG_LINE.search(line)]
+    state['catalog_version'] = serialize_catalog()[1]
+    state['is_game_over'] = session.is_game_over()
+    state['spectating'] = True
+    state.update(extra or {})
+    return state
+
+
+class Frame:
+    """
+    One update of a broadcast, shared by all of its subscribers.
+    """
+
+    __slots__ = ("seq", "state", "patch_text", "final", "_snapshot_text")
+
+    def __init__(self, seq: int, state: Dict[str, Any], patch_text: Optional[str], final: bool = False):
+        self.seq = seq
+        self.state = state
+        self.patch_text = patch_text
+        self.final = final
+        self._snapshot_text: Optional[str] = None
+
+    def snapshot_text(self) -> str:
+        """The full state of this frame as a snapshot message, encoded on first use."""
+        if self._snapshot_text is None:
+            self._snapshot_text = dumps_text({"type": "snapshot", "seq": self.seq, "state": self.state})
+        return self._snapshot_text
+
+    def text_for(self, last_seq: Optional[int]) -> str:
+        """
+        The message for a subscriber whose last frame was last_seq.
+
+        Returns:
+            str: The patch if it follows on from last_seq, otherwise the snapshot
+        """
+        if self.patch_text is not None and last_seq == self.seq - 1:
+            return self.patch_text
+        return self.snapshot_text()
+
+
+class Subscriber:
+    """
+    A viewer's mailbox: the latest undelivered frame, replacing any older one.
+    """
+
+    def __init__(self):
+        self.last_seq: Optional[int] = None
+        self.dropped = 0
+        self._frame: Optional[Frame] = None
+        self._ready = asyncio.Event()
+
+    def offer(self, frame: Frame) -> None:
+        """Make frame the next one to send, dropping an undelivered older frame."""
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+        self._ready.set()
+
+    async def next_frame(self) -> Frame:
+        """Wait for and take the latest frame."""
+        await self._ready.wait()
+        self._ready.clear()
+        frame, self._frame = self._frame, None
+        return frame
+
+    def next_text(self, frame: Frame) -> str:
+        """The message that brings this subscriber to frame, recording that it was sent."""
+        text = frame.text_for(self.last_seq)
+        self.last_seq = frame.seq
+        return text
+
+
+class Broadcast:
+    """
+    The spectator stream of one game.
+
+    capture() runs on the engine executor under the session's lock;
+    everything else runs on the event loop.
+    """
+
+    def __init__(self, session: GameSession):
+        self.session = session
+        self.seq = 0
+        self.latest: Optional[Frame] = None
+        self.subscribers: Set[Subscriber] = set()
+        self.publishers = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    def capture(self, extra: Optional[Dict[str, Any]] = None) -> Optional[Frame]:
+        """
+        Project, diff and encode the current state once for all subscribers.
+
+        Args:
+            extra: Additional fields for the spectator state
+
+        Returns:
+            Optional[Frame]: The new frame, or None if nothing visible changed
+        """
+        state = to_plain(spectator_state(self.session, extra))
+        ops = None
+        if self._last is not None:
+            ops = diff(self._last, state)
+            if not ops:
+                return None
+        self.seq += 1
+        patch_text = None
+        if ops is not None:
+            patch_text = dumps_text({"type": "patch", "seq": self.seq, "base": self.seq - 1, "ops": ops})
+        self._last = state
+        return Frame(self.seq, state, patch_text, final='scores' in state)
+
+    def deliver(self, frame: Optional[Frame]) -> None:
+        """Hand a captured frame to every subscriber (frames older than the latest are ignored)."""
+        if frame is None or (self.latest is not None and frame.seq <= self.latest.seq):
+            return
+        self.latest = frame
+        for subscriber in self.subscribers:
+            subscriber.offer(frame)
+
+    def subscribe(self) -> Subscriber:
+        """Add a viewer; it starts from the latest frame, if there is one."""
+        subscriber = Subscriber()
+        self.subscribers.add(subscriber)
+        if self.latest is not None:
+            subscriber.offer(self.latest)
+        return subscriber
+
+    def resync(self, subscriber: Subscriber) -> None:
+        """Send a subscriber that lost track the latest snapshot."""
+        subscriber.last_seq = None
+        if self.latest is not None:
+            subscriber.offer(self.latest)
+
+
+class SpectatorHub:
+    """
+    Broadcasts by spectate ID. Used from the event loop only.
+    """
+
+    def __init__(self):
+        self._broadcasts: Dict[str, Broadcast] = {}
+
+    def attach_player(self, spectate_id: str, session: GameSession) -> Broadcast:
+        """Register a player connection as the source of a game's broadcast."""
+        broadcast = self._broadcasts.get(spectate_id)
+        if broadcast is None:
+            broadcast = self._broadcasts[spectate_id] = Broadcast(session)
+        # A resumed game may have been reloaded from the store as a new object
+        broadcast.session = session
+        broadcast.publishers += 1
+        return broadcast
+
+    def detach_player(self, spectate_id: str) -> None:
+        """A player connection closed; the broadcast waits for a reconnect while it has viewers."""
+        broadcast = self._broadcasts.get(spectate_id)
+        if broadcast is None:
+            return
+        broadcast.publishers = max(0, broadcast.publishers - 1)
+        self._discard_if_unused(spectate_id)
+
+    def get(self, spectate_id: str) -> Optional[Broadcast]:
+        return self._broadcasts.get(spectate_id)
+
+    def unsubscribe(self, spectate_id: str, subscriber: Subscriber) -> None:
+        broadcast = self._broadcasts.get(spectate_id)
+        if broadcast is None:
+            return
+        broadcast.subscribers.discard(subscriber)
+        self._discard_if_unused(spectate_id)
+
+    def spectators(self) -> int:
+        """Number of connected viewers across all games."""
+        return sum(len(broadcast.subscribers) for broadcast in self._broadcasts.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of broadcasts, viewers and frames dropped for slow viewers."""
+        return {
+            'broadcasts': len(self._broadcasts),
+            'spectators': self.spectators(),
+            'dropped_frames': sum(subscriber.dropped for broadcast in self._broadcasts.values()
+                                  for subscriber in broadcast.subscribers)
+        }
+
+    def _discard_if_unused(self, spectate_id: str) -> None:
+        broadcast = self._broadcasts[spectate_id]
+        if broadcast.publishers == 0 and not broadcast.subscribers:
+            del self._broadcasts[spectate_id]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Delta-Encoded State Updates
+
+The websocket server used to send a full state dump after every human
+action and AI turn, although most messages change a handful of fields and
+append a line or two to the log. StateStream keeps the last state sent on
+a connection and encodes each new state as a list of JSON-patch style
+operations (RFC 6902 "add", "remove" and "replace") against it, tagged
+with a sequence number. The first message is a full snapshot, and so is
+the answer to a client that asks for a resync.
+
+Message formats:
+    {"type": "snapshot", "seq": n, "state": {...}}
+    {"type": "patch", "seq": n, "base": n - 1, "ops": [{"op": ..., "path": ..., "value": ...}]}
+    {"type": "batch", "seq": n, "base": n - 1, "frames": [{"hint": {...}, "ops": [...]}, ...]}
+
+static/app.js applies patches with the same semantics and sends
+{"action_type": "Resync"} when it misses a sequence number or a patch
+does not apply.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from state_serializer import dumps_text, plain_copy, to_plain
+
+
+# Message a client sends to ask for a full snapshot
+RESYNC_ACTION = "Resync"
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Operations that turn old into new.
+
+    Both values must be plain data (see plain_copy). Dicts are compared key
+    by key and lists index by index, with items appended to or removed from
+    the end of a list encoded as "add" and "remove"; anything else that
+    differs is replaced whole.
+
+    Args:
+        old: Previous value
+        new: New value
+        path: JSON pointer of the values within the document
+
+    Returns:
+        List[Dict[str, Any]]: Operations in the order they must be applied
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+            elif old[key] != value:
+                ops.extend(diff(old[key], value, f"{path}/{_escape(key)}"))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        ops = []
+        for i in range(common):
+            if old[i] != new[i]:
+                ops.extend(diff(old[i], new[i], f"{path}/{i}"))
+        # A list that shifted (e.g. a capped log) is cheaper to replace than to patch item by item
+        if len(ops) > max(1, len(new)):
+            return [{"op": "replace", "path": path, "value": new}]
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for value in new[common:]:
+            ops.append({"op": "add", "path": f"{path}/-", "value": value})
+        return ops
+    if old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """
+    Apply operations from diff() to a plain-data document in place.
+
+    Args:
+        document: The document to patch
+        ops: Operations to apply
+
+    Returns:
+        Any: The patched document (a new object if the root was replaced)
+
+    Raises:
+        ValueError: If an operation does not fit the document
+    """
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            if op["op"] != "replace":
+                raise ValueError(f"Cannot {op['op']} the document root")
+            document = op["value"]
+            continue
+        parent = document
+        try:
+            for token in tokens[:-1]:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+            last = tokens[-1]
+            if isinstance(parent, list):
+                if op["op"] == "add":
+                    if last == "-":
+                        parent.append(op["value"])
+                    else:
+                        parent.insert(int(last), op["value"])
+                elif op["op"] == "remove":
+                    del parent[int(last)]
+                else:
+                    parent[int(last)] = op["value"]
+            else:
+                if op["op"] == "remove":
+                    del parent[last]
+                elif op["op"] == "replace" and last not in parent:
+                    raise KeyError(last)
+                else:
+                    parent[last] = op["value"]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Cannot apply {op['op']} at {op['path']}: {e}") from e
+    return document
+
+
+class StateStream:
+    """
+    Encodes successive states for one connection as snapshots and patches.
+    """
+
+    def __init__(self):
+        self.seq = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    def encode(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Message that brings the client from the last state sent to this one.
+
+        Args:
+            state: JSON-serializable state for the client
+
+        Returns:
+            Dict[str, Any]: A snapshot message the first time, a patch
+                message afterwards
+        """
+        current = to_plain(state)
+        self.seq += 1
+        if self._last is None:
+            message = {"type": "snapshot", "seq": self.seq, "state": current}
+        else:
+            message = {"type": "patch", "seq": self.seq, "base": self.seq - 1,
+                       "ops": diff(self._last, current)}
+        self._last = current
+        return message
+
+    def encode_batch(self, frames: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        One message carrying several successive states.
+
+        Each frame is patched against the one before it, so the client can
+        replay them in order (e.g. to animate AI moves) under a single
+        sequence number.
+
+        Args:
+            frames: (hint, state) pairs; the hint is passed through to the client
+
+        Returns:
+            Dict[str, Any]: {"type": "batch", "seq", "base", "frames": [{"hint", "ops"}, ...]}
+        """
+        encoded = []
+        for hint, state in frames:
+            current = to_plain(state)
+            if self._last is None:
+                ops = [{"op": "replace", "path": "", "value": current}]
+            else:
+                ops = diff(self._last, current)
+            encoded.append({"hint": hint, "ops": ops})
+            self._last = current
+        self.seq += 1
+        return {"type": "batch", "seq": self.seq, "base": self.seq - 1, "frames": encoded}
+
+    def encode_batch_text(self, frames: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> str:
+        """encode_batch() serialized as compact JSON text."""
+        return dumps_text(self.encode_batch(frames))
+
+    def encode_text(self, state: Dict[str, Any]) -> str:
+        """encode() serialized as compact JSON text."""
+        return dumps_text(self.encode(state))
+
+    def resync(self) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot of the last state sent, for a client that lost track.
+
+        Returns:
+            Optional[Dict[str, Any]]: A snapshot message with a new sequence
+                number, or None if nothing has been sent yet
+        """
+        if self._last is None:
+            return None
+        self.seq += 1
+        return {"type": "snapshot", "seq": self.seq, "state": plain_copy(self._last)}
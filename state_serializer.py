@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Fast JSON Encoding for Client State
+
+Every websocket message is encoded once per human action and once per AI
+turn, so the encoder is on the server's hot path. This module picks the
+fastest JSON backend that is installed: orjson, then msgspec, then the
+standard library's C encoder in compact mode. All of them produce bytes and
+accept non-string dict keys (player IDs) the way json.dumps does.
+
+The same backend normalizes states for delta encoding: a JSON round trip
+through orjson or msgspec is several times faster than copying the nested
+dicts in Python, which remains the fallback.
+
+See benchmark_serialization.py for measurements against the plain
+to_dict() + json.dumps path on mid-game states.
+"""
+
+import json
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def plain_copy(value: Any) -> Any:
+    """
+    Copy JSON-serializable data into the form a JSON round trip would give.
+
+    Dict keys become strings and tuples become lists, so that a stored
+    snapshot compares equal to what the client holds, and later in-place
+    changes to the game state do not leak into it.
+    """
+    if isinstance(value, dict):
+        return {str(key): plain_copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain_copy(item) for item in value]
+    return value
+
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"), check_circular=False, ensure_ascii=False)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return _json_encoder.encode(obj).encode("utf-8")
+
+
+# Available encoders by name; each turns plain data into UTF-8 JSON bytes
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {"json": _json_dumps}
+# Matching normalizers (see plain_copy)
+NORMALIZERS: Dict[str, Callable[[Any], Any]] = {"json": plain_copy}
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+    ENCODERS["msgspec"] = _msgspec_encoder.encode
+    NORMALIZERS["msgspec"] = lambda value: _msgspec_decoder.decode(_msgspec_encoder.encode(value))
+
+if orjson is not None:
+    ENCODERS["orjson"] = lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    NORMALIZERS["orjson"] = lambda value: orjson.loads(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+
+# The backend in use: the fastest one installed
+BACKEND = next(name for name in ("orjson", "msgspec", "json") if name in ENCODERS)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode plain data as compact UTF-8 JSON with the fastest backend.
+
+    Args:
+        obj: Dicts, lists, strings, numbers, booleans and None
+
+    Returns:
+        bytes: The JSON document
+    """
+    return ENCODERS[BACKEND](obj)
+
+
+def dumps_text(obj: Any) -> str:
+    """dumps() as a string, for websocket text frames."""
+    return ENCODERS[BACKEND](obj).decode("utf-8")
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Normalized deep copy of plain data (see plain_copy), via the fastest backend.
+
+    Args:
+        value: JSON-serializable data
+
+    Returns:
+        Any: Data equal to what a client decodes from dumps(value)
+    """
+    return NORMALIZERS[BACKEND](value)
@@ -1,10 +1,40 @@
 let ws;
+// Last full state received; the server sends only patches against it
+let clientState = null;
+let lastSeq = null;
+let resyncPending = false;
+// Static game data by ID (offices, legislation, cards, favors); per-turn state refers to it
+let catalog = null;
+let catalogVersion = null;
+// Local storage key of the token that identifies this browser's game on the server
+const SESSION_TOKEN_KEY = "electionSessionToken";
+// Promise chain that processes websocket messages one after another
+let messageChain = Promise.resolve();
+// Set when the page was opened with ?spectate=<id> to watch someone else's game
+const spectateId = new URLSearchParams(window.location.search).get("spectate");
+
+async function loadCatalog() {
+    // The browser revalidates with the ETag, so this is a 304 after the first visit
+    const response = await fetch("/catalog", { cache: "no-cache" });
+    catalog = await response.json();
+    catalogVersion = response.headers.get("ETag");
+    console.log("📚 Catalog loaded, version", catalogVersion);
+}
 
 function connect() {
     console.log("🔌 Attempting to connect to WebSocket...");
     // Use secure WebSocket (wss) when page is loaded over HTTPS
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-    ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
+    if (spectateId) {
+        // Spectators receive the same snapshots and patches, read-only
+        ws = new WebSocket(`${protocol}//${window.location.host}/ws/spectate/${encodeURIComponent(spectateId)}`);
+    } else {
+        // Reconnecting with the session token resumes the same game
+        const token = localStorage.getItem(SESSION_TOKEN_KEY);
+        // AI moves arrive as one batch that is animated here and acknowledged once
+        const query = `?pacing=batch${token ? `&token=${encodeURIComponent(token)}` : ""}`;
+        ws = new WebSocket(`${protocol}//${window.location.host}/ws${query}`);
+    }
 
     ws.onopen = () => {
         console.log("✅ WebSocket connection established");
@@ -12,12 +42,16 @@ function connect() {
 
     ws.onmessage = (event) => {
         console.log("📨 Received WebSocket message:", event.data.length, "bytes");
-        const state = JSON.parse(event.data);
-        console.log("📊 Parsed state:", state);
-        renderState(state);
+        // Messages are handled strictly in order, even while a batch is still animating
+        messageChain = messageChain.then(() => handleMessage(JSON.parse(event.data)));
     };
 
-    ws.onclose = () => {
+    ws.onclose = (event) => {
+        if (spectateId && (event.code === 1000 || event.code === 4404)) {
+            // The game being watched has ended or does not exist
+            console.log("👀 Spectator stream closed");
+            return;
+        }
         console.log("❌ WebSocket connection closed. Attempting to reconnect...");
         setTimeout(connect, 3000);
     };
@@ -27,6 +61,126 @@ function connect() {
     };
 }
 
+async function handleMessage(message) {
+    if (message.type === "batch") {
+        await playBatch(message);
+        return;
+    }
+    const state = applyStateMessage(message);
+    console.log("📊 Parsed state:", state);
+    if (state && state.catalog_version && catalogVersion !== `"${state.catalog_version}"`) {
+        // The server was redeployed with different game data
+        await loadCatalog();
+    }
+    if (state) {
+        renderState(state);
+    }
+}
+
+async function playBatch(message) {
+    // Replay each AI move of the batch, pausing between moves so players can follow them
+    if (clientState === null || message.base !== lastSeq) {
+        console.warn("⚠️ Missed a state update, requesting a resync");
+        requestResync();
+        return;
+    }
+    for (let i = 0; i < message.frames.length; i++) {
+        const frame = message.frames[i];
+        try {
+            clientState = applyPatch(structuredClone(clientState), frame.ops);
+        } catch (error) {
+            console.error("❌ Could not apply AI move, requesting a resync:", error);
+            requestResync();
+            return;
+        }
+        console.log("🤖 AI move:", frame.hint);
+        renderState(clientState);
+        if (i < message.frames.length - 1 && frame.hint && frame.hint.delay_ms) {
+            await new Promise(resolve => setTimeout(resolve, frame.hint.delay_ms));
+        }
+    }
+    lastSeq = message.seq;
+}
+
+function applyStateMessage(message) {
+    // Snapshots replace the state, patches update it; anything else (e.g. errors) is shown as is
+    if (message.type === "session") {
+        localStorage.setItem(SESSION_TOKEN_KEY, message.token);
+        console.log("👀 Others can watch this game at", `${window.location.origin}/?spectate=${message.spectate_id}`);
+        return null;
+    }
+    if (message.type === "snapshot") {
+        clientState = message.state;
+        lastSeq = message.seq;
+        resyncPending = false;
+        return clientState;
+    }
+    if (message.type !== "patch") {
+        return message;
+    }
+    if (clientState === null || message.base !== lastSeq) {
+        console.warn("⚠️ Missed a state update, requesting a resync");
+        requestResync();
+        return null;
+    }
+    try {
+        const patched = applyPatch(structuredClone(clientState), message.ops);
+        clientState = patched;
+        lastSeq = message.seq;
+        return clientState;
+    } catch (error) {
+        console.error("❌ Could not apply state patch, requesting a resync:", error);
+        requestResync();
+        return null;
+    }
+}
+
+function applyPatch(doc, ops) {
+    // Same semantics as state_delta.apply_patch on the server
+    for (const op of ops) {
+        const tokens = op.path.split("/").slice(1).map(t => t.replace(/~1/g, "/").replace(/~0/g, "~"));
+        if (tokens.length === 0) {
+            doc = op.value;
+            continue;
+        }
+        let parent = doc;
+        for (const token of tokens.slice(0, -1)) {
+            parent = Array.isArray(parent) ? parent[Number(token)] : parent[token];
+            if (parent === undefined || parent === null) {
+                throw new Error(`Missing parent for ${op.path}`);
+            }
+        }
+        const last = tokens[tokens.length - 1];
+        if (Array.isArray(parent)) {
+            if (op.op === "add") {
+                if (last === "-") {
+                    parent.push(op.value);
+                } else {
+                    parent.splice(Number(last), 0, op.value);
+                }
+            } else if (op.op === "remove") {
+                parent.splice(Number(last), 1);
+            } else {
+                parent[Number(last)] = op.value;
+            }
+        } else if (op.op === "remove") {
+            delete parent[last];
+        } else {
+            parent[last] = op.value;
+        }
+    }
+    return doc;
+}
+
+function requestResync() {
+    clientState = null;
+    lastSeq = null;
+    if (!resyncPending) {
+        resyncPending = true;
+        sendAction({ action_type: "Resync" });
+    }
+}
+
 function getActionDescription(action) {
     console.log("🔍 Getting action description for:", action);
     const type = action.action_type;
@@ -83,8 +237,10 @@ function renderState(state) {
         const playerDiv = document.createElement('div');
         playerDiv.className = `player-info ${player.id === state.current_player_index ? 'current-player' : ''}`;
         
-        let officeText = player.current_office ? player.current_office.title : "No Office";
-        let archetypeText = player.archetype ? player.archetype.title : 'No Archetype';
+        const office = catalog.offices[player.current_office_id];
+        const archetype = catalog.archetypes[player.archetype_id];
+        let officeText = office ? office.title : "No Office";
+        let archetypeText = archetype ? archetype.title : 'No Archetype';
         if (state.compromised_players && state.compromised_players.includes(player.id)) {
             archetypeText = `🎭 ${archetypeText} (Revealed)`;
         }
@@ -94,7 +250,7 @@ function renderState(state) {
             <div class="player-details">
                 <span>Political Capital: ${player.pc}</span> | 
                 <span>Action Points: ${state.action_points[player.id]}</span> | 
-                <span>Favors: ${player.favors.length}</span> |
+                <span>Favors: ${player.favor_ids.length}</span> |
                 <span>Office: ${officeText}</span> |
                 <span>Archetype: ${archetypeText}</span>
             </div>
@@ -108,12 +264,13 @@ function renderState(state) {
     if (mandateContainer) {
         // Find the human player's mandate
         const humanPlayer = state.players.find(p => p.name === "Human");
-        if (humanPlayer && humanPlayer.mandate) {
-            console.log("📋 Human player mandate found:", humanPlayer.mandate);
+        const mandate = humanPlayer ? catalog.mandates[humanPlayer.mandate_id] : null;
+        if (mandate) {
+            console.log("📋 Human player mandate found:", mandate);
             mandateContainer.innerHTML = `
                 <div class="mandate-card">
-                    <div class="mandate-title">${humanPlayer.mandate.title}</div>
-                    <div class="mandate-description">${humanPlayer.mandate.description}</div>
+                    <div class="mandate-title">${mandate.title}</div>
+                    <div class="mandate-description">${mandate.description}</div>
                 </div>
             `;
         } else {
@@ -138,7 +295,7 @@ function renderState(state) {
     legislationContainer.innerHTML = '<h3>Active Legislation</h3>';
     if (state.term_legislation && state.term_legislation.length > 0) {
         state.term_legislation.forEach(leg => {
-            const legDetails = state.legislation_options[leg.legislation_id];
+            const legDetails = catalog.legislation[leg.legislation_id];
             const sponsor = state.players.find(p => p.id === leg.sponsor_id);
             const legDiv = document.createElement('div');
             legDiv.className = 'legislation-item';
@@ -322,5 +479,5 @@ function setupMandateToggle() {
     }
 }
 
-connect();
+loadCatalog().then(connect);
 setupMandateToggle(); 
\ No newline at end of file
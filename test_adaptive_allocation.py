@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for adaptive game allocation across experiments.
+"""
+
+import os
+import random
+import tempfile
+
+import yaml
+
+from adaptive_allocation import AdaptiveAllocator, wilson_interval
+from simulation_runner import SimulationRunner
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert 0.40 < low < 0.41 and 0.59 < high < 0.60
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = wilson_interval(0, 20)
+    assert low == 0.0 and high < 0.2
+
+
+def _simulate(allocator, true_rates, rng):
+    while True:
+        batch = allocator.next_batch()
+        if batch is None:
+            return
+        name, games = batch
+        for _ in range(games):
+            winner = 'A' if rng.random() < true_rates[name] else 'B'
+            allocator.record(name, winner)
+
+
+def test_budget_goes_to_close_matchups():
+    rng = random.Random(11)
+    experiments = {'lopsided': ['A', 'B'], 'close': ['A', 'B']}
+    allocator = AdaptiveAllocator(experiments, total_games=1000, batch_size=20, min_games=40)
+    _simulate(allocator, {'lopsided': 0.95, 'close': 0.55}, rng)
+
+    assert allocator.games_used <= 1000
+    assert allocator.is_resolved('lopsided')
+    assert allocator.games['lopsided'] < 100
+    assert allocator.games['close'] > 5 * allocator.games['lopsided']
+
+
+def test_allocation_stops_when_everything_is_resolved():
+    rng = random.Random(2)
+    experiments = {'x': ['A', 'B'], 'y': ['A', 'B']}
+    allocator = AdaptiveAllocator(experiments, total_games=5000, min_games=40,
+                                  max_games={'x': 300, 'y': 300})
+    _simulate(allocator, {'x': 0.9, 'y': 0.52}, rng)
+
+    assert allocator.games['y'] == 300
+    assert allocator.games_used < 5000
+    assert all(status['resolved'] for status in allocator.summary().values())
+
+
+def test_runner_adaptive_mode_respects_budget():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = {
+            'global': {'random_seed': 42, 'max_rounds_per_game': 150, 'output_directory': temp_dir},
+            'data_collection': {'save_game_logs': False, 'save_final_states': False},
+            'allocation': {'mode': 'adaptive', 'total_games': 12, 'batch_size': 2, 'min_games': 4},
+            'experiments': [
+                {'name': 'first', 'num_games': 50, 'players': [
+                    {'name': 'Random Bot', 'persona': 'random'},
+                    {'name': 'Economic Bot', 'persona': 'economic'}]},
+                {'name': 'second', 'num_games': 50, 'players': [
+                    {'name': 'Balanced Bot', 'persona': 'balanced'},
+                    {'name': 'Legislative Bot', 'persona': 'legislative'}]}
+            ]
+        }
+        config_path = os.path.join(temp_dir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.dump(config, f)
+
+        all_results = SimulationRunner(config_path).run_simulation_batch()
+        assert sum(len(results) for results in all_results.values()) == 12
+        assert all(len(results) >= 4 for results in all_results.values())
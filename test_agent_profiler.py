@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for decision latency profiling and budget enforcement.
+"""
+
+import random
+import time
+
+from simulation_harness import SimulationHarness
+from agent_profiler import ProfiledAgent, LatencyRegistry, LatencyHistogram, cheap_default_action
+from game_session import GameSession, AI_LATENCY
+from engine.actions import ActionFundraise, ActionNetwork, ActionPassTurn
+from personas import RandomPersona
+
+
+class SlowPersona(RandomPersona):
+    """Random persona that thinks for a fixed time before every decision."""
+
+    def __init__(self, name, delay, random_seed=None):
+        super().__init__(name, random_seed)
+        self.delay = delay
+
+    def choose_action(self, game_state, valid_actions):
+        time.sleep(self.delay)
+        return ActionNetwork(player_id=game_state.get_current_player().id)
+
+
+def _decision_point():
+    harness = SimulationHarness()
+    random.seed(0)
+    state = harness.engine.run_event_phase(harness.engine.start_new_game(['A', 'B']))
+    return state, harness.engine.get_valid_actions(state, state.get_current_player().id)
+
+
+def test_histogram_buckets_and_summary():
+    histogram = LatencyHistogram(buckets=(0.01, 0.1))
+    for seconds in (0.005, 0.05, 0.05, 3.0):
+        histogram.observe(seconds)
+    histogram.observe(0.2, timed_out=True)
+    stats = histogram.to_dict()
+    assert stats['buckets'] == {'0.01': 1, '0.1': 2, '+Inf': 2}
+    assert stats['calls'] == 5 and stats['timeouts'] == 1
+    assert stats['max_seconds'] == 3.0
+    assert stats['p50_seconds'] == 0.05
+
+
+def test_measures_without_changing_decisions():
+    state, valid = _decision_point()
+    registry = LatencyRegistry()
+    profiled = ProfiledAgent(RandomPersona("R", random_seed=4), registry=registry)
+    plain = RandomPersona("R", random_seed=4)
+    for _ in range(5):
+        assert profiled.choose_action(state, valid) == plain.choose_action(state, valid)
+    assert profiled.name == "R"
+    assert profiled.latency_stats()['calls'] == 5
+    assert registry.snapshot()['RandomPersona']['calls'] == 5
+
+
+def test_budget_falls_back_to_cheap_action():
+    state, valid = _decision_point()
+    profiled = ProfiledAgent(SlowPersona("S", delay=0.3), budget_seconds=0.05)
+    started = time.perf_counter()
+    action = profiled.choose_action(state, valid)
+    assert time.perf_counter() - started < 0.2
+    assert action == cheap_default_action(valid)
+    assert isinstance(action, (ActionFundraise, ActionPassTurn))
+
+    # While the late call is still running, decisions do not queue behind it
+    assert profiled.choose_action(state, valid) == cheap_default_action(valid)
+    time.sleep(0.35)
+    profiled.agent.delay = 0.0
+    assert isinstance(profiled.choose_action(state, valid), ActionNetwork)
+    stats = profiled.latency_stats()
+    assert stats['timeouts'] == 2 and stats['calls'] == 3
+
+
+class SlowThirdPersona(SlowPersona):
+    """Thinks for its delay on the third decision only."""
+
+    def __init__(self, name, delay):
+        super().__init__(name, delay)
+        self.calls = 0
+
+    def choose_action(self, game_state, valid_actions):
+        self.calls += 1
+        if self.calls == 3:
+            time.sleep(self.delay)
+        return ActionNetwork(player_id=game_state.get_current_player().id)
+
+
+def test_batch_budget_applies_per_decision():
+    state, valid = _decision_point()
+    profiled = ProfiledAgent(SlowThirdPersona("S", delay=0.3), budget_seconds=0.05)
+    started = time.perf_counter()
+    actions = profiled.choose_actions([(state, valid)] * 3)
+    assert time.perf_counter() - started < 0.25
+    assert isinstance(actions[0], ActionNetwork) and isinstance(actions[1], ActionNetwork)
+    assert actions[2] == cheap_default_action(valid)
+    stats = profiled.latency_stats()
+    assert stats['calls'] == 3 and stats['timeouts'] == 1
+    assert stats['max_seconds'] >= 0.05
+
+
+def test_budgeted_agents_share_one_bounded_pool():
+    from concurrent.futures import ThreadPoolExecutor
+
+    state, valid = _decision_point()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        busy = ProfiledAgent(SlowPersona("Busy", delay=0.2), budget_seconds=0.02, executor=pool)
+        waiting = ProfiledAgent(SlowPersona("Waiting", delay=0.0), budget_seconds=0.02, executor=pool)
+        assert busy.choose_action(state, valid) == cheap_default_action(valid)
+        # The only worker is still busy, so this call times out in the queue and is cancelled
+        assert waiting.choose_action(state, valid) == cheap_default_action(valid)
+        assert waiting._late_call is None and busy._late_call is not None
+    assert ProfiledAgent(RandomPersona("R"), budget_seconds=1.0).executor is \
+        ProfiledAgent(RandomPersona("R"), budget_seconds=1.0).executor
+
+
+def test_stats_surface_in_simulation_results():
+    harness = SimulationHarness()
+    random.seed(1)
+    agents = [ProfiledAgent(RandomPersona("A", random_seed=1)), RandomPersona("B", random_seed=2)]
+    result = harness.run_simulation(agents, ["A", "B"])
+    assert set(result.agent_stats) == {0}
+    assert result.agent_stats[0]['calls'] > 0
+    assert result.agent_stats[0]['label'] == 'RandomPersona'
+
+    lockstep = harness.run_lockstep_simulations(agents, num_games=2)
+    assert all(r.agent_stats[0]['calls'] > result.agent_stats[0]['calls'] for r in lockstep)
+    assert harness.run_simulation([RandomPersona("A"), RandomPersona("B")]).agent_stats is None
+
+
+def test_game_sessions_report_into_server_stats():
+    random.seed(2)
+    session = GameSession()
+    session.start_game()
+    assert all(isinstance(ai, ProfiledAgent) for ai in session.ai_opponents)
+    before = AI_LATENCY.snapshot().get('HeuristicPersona', {}).get('calls', 0)
+    session.state = session.engine.process_action(session.state, ActionPassTurn(player_id=0))
+    session.state = session._advance_game_flow(session.state)
+    session.process_ai_turn()
+    assert AI_LATENCY.snapshot()['HeuristicPersona']['calls'] == before + 1
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental analysis cache in the analysis module.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from analysis import SimulationAnalyzer, ANALYZER_VERSION
+
+
+def _make_result(winner, rounds, pcs):
+    return {
+        "winner_name": winner,
+        "game_length_rounds": rounds,
+        "game_length_terms": 3,
+        "game_log": [f"{winner} chose: ActionFundraise"],
+        "final_state": {
+            "players": [{"name": name, "pc": pc, "influence": pc // 10} for name, pc in pcs.items()]
+        }
+    }
+
+
+SAMPLE_RESULTS = [
+    _make_result("Economic Bot", 40, {"Economic Bot": 30, "Random Bot": 12}),
+    _make_result("Random Bot", 44, {"Economic Bot": 8, "Random Bot": 25}),
+    _make_result("Economic Bot", 38, {"Economic Bot": 51, "Random Bot": 3}),
+]
+
+
+def _write_results(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def test_cache_hit_matches_fresh_analysis():
+    """A second load of an unchanged file uses the cache and gives identical metrics."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results_path = Path(temp_dir) / "detailed_results_1000.json"
+        _write_results(results_path, SAMPLE_RESULTS)
+
+        first = SimulationAnalyzer(temp_dir)
+        first.load_results()
+        assert first.cache_status == "miss"
+        expected = first.calculate_metrics()
+        assert SimulationAnalyzer.cache_path_for(results_path).exists()
+
+        second = SimulationAnalyzer(temp_dir)
+        second.load_results()
+        assert second.cache_status == "hit"
+        assert second.calculate_metrics() == expected
+        assert second.generate_report() == first.generate_report()
+
+        # The raw rows are still available on demand
+        assert len(second.results) == len(SAMPLE_RESULTS)
+
+
+def test_appended_games_are_folded_incrementally():
+    """Games appended to a results file are folded into the cached aggregates."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results_path = Path(temp_dir) / "detailed_results_1000.json"
+        _write_results(results_path, SAMPLE_RESULTS[:2])
+
+        SimulationAnalyzer(temp_dir).load_results()
+
+        _write_results(results_path, SAMPLE_RESULTS)
+        analyzer = SimulationAnalyzer(temp_dir)
+        analyzer.load_results()
+        assert analyzer.cache_status == "incremental"
+        incremental = analyzer.calculate_metrics()
+
+        fresh = SimulationAnalyzer(temp_dir, use_cache=False)
+        fresh.load_results()
+        assert incremental == fresh.calculate_metrics()
+        assert incremental.total_games == 3
+        assert incremental.economic_analysis["Economic"]["max_final_pc"] == 51
+
+
+def test_rewritten_or_outdated_cache_is_ignored():
+    """Edited rows or a different analyzer version force a full recomputation."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results_path = Path(temp_dir) / "detailed_results_1000.json"
+        _write_results(results_path, SAMPLE_RESULTS)
+        SimulationAnalyzer(temp_dir).load_results()
+
+        edited = [dict(SAMPLE_RESULTS[0], winner_name="Random Bot")] + SAMPLE_RESULTS[1:]
+        _write_results(results_path, edited)
+        analyzer = SimulationAnalyzer(temp_dir)
+        analyzer.load_results()
+        assert analyzer.cache_status == "miss"
+        assert analyzer.calculate_metrics().win_rates["Random Bot"] == 2 / 3
+
+        cache_path = SimulationAnalyzer.cache_path_for(results_path)
+        cache = json.loads(cache_path.read_text())
+        cache['analyzer_version'] = ANALYZER_VERSION + 1
+        cache_path.write_text(json.dumps(cache))
+        analyzer = SimulationAnalyzer(temp_dir)
+        analyzer.load_results()
+        assert analyzer.cache_status == "miss"
+
+
+if __name__ == "__main__":
+    test_cache_hit_matches_fresh_analysis()
+    test_appended_games_are_folded_incrementally()
+    test_rewritten_or_outdated_cache_is_ignored()
+    print("✅ All analysis cache tests passed!")
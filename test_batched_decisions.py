@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for batched persona decisions and the lockstep simulation runner.
+"""
+
+import random
+
+from simulation_harness import SimulationHarness
+from game_session import GameSession
+from personas import RandomPersona, HeuristicPersona
+
+
+class CountingPersona(RandomPersona):
+    """Random persona that records the size of every batch it is asked to decide."""
+
+    def __init__(self, name, random_seed=None):
+        super().__init__(name, random_seed)
+        self.batch_sizes = []
+
+    def choose_actions(self, batch):
+        self.batch_sizes.append(len(batch))
+        return super().choose_actions(batch)
+
+
+def test_default_choose_actions_matches_single_calls():
+    harness = SimulationHarness()
+    random.seed(1)
+    state = harness.engine.run_event_phase(harness.engine.start_new_game(['A', 'B']))
+    valid = harness.engine.get_valid_actions(state, 0)
+
+    batched = RandomPersona("R", random_seed=5).choose_actions([(state, valid)] * 4)
+    single = RandomPersona("R", random_seed=5)
+    assert batched == [single.choose_action(state, valid) for _ in range(4)]
+
+
+def test_lockstep_runs_every_game_with_batched_calls():
+    harness = SimulationHarness()
+    random.seed(2)
+    agents = [CountingPersona("C0", 1), CountingPersona("C1", 2), HeuristicPersona("H", 3)]
+    results = harness.run_lockstep_simulations(agents, num_games=6, max_rounds=300)
+
+    assert len(results) == 6
+    assert all(result.error is None for result in results)
+    assert all(result.final_state.term_counter >= 3 for result in results)
+    assert max(agents[0].batch_sizes) > 1
+    assert sum(agents[0].batch_sizes) > 6
+
+
+
+def test_sessions_do_not_share_personas():
+    sessions = [GameSession(), GameSession()]
+    for session in sessions:
+        session.start_game()
+    first, second = (session.ai_opponents for session in sessions)
+    assert all(mine.agent is not theirs.agent for mine, theirs in zip(first, second))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental mandate beliefs and the belief-tracking persona.
+"""
+
+import random
+
+from simulation_harness import SimulationHarness, SilentLogger
+from models.game_state import PendingLegislation
+from models.components import Candidacy
+from personas import BeliefPersona, HeuristicPersona
+from personas.opponent_model import MandateBeliefs, ALL_MANDATE_IDS
+
+
+def _new_state(seed=0):
+    harness = SimulationHarness()
+    random.seed(seed)
+    return harness.engine.start_new_game(['A', 'B', 'C'])
+
+
+def test_prior_excludes_own_mandate_and_updates_normalize():
+    state = _new_state()
+    model = MandateBeliefs(0)
+    model.sync(state)
+    own = state.players[0].mandate.id
+    for pid in (1, 2):
+        assert model.probability(pid, own) == 0.0
+        assert abs(sum(model.distribution(pid).values()) - 1.0) < 1e-12
+    assert 0 not in model.beliefs
+
+    before = model.probability(1, "WAR_HAWK")
+    state.term_legislation.append(PendingLegislation("MILITARY", 1))
+    assert model.sync(state) == 1
+    if own != "WAR_HAWK":
+        assert model.probability(1, "WAR_HAWK") > before
+    assert abs(sum(model.distribution(1).values()) - 1.0) < 1e-12
+
+
+def test_each_action_is_observed_once():
+    state = _new_state(1)
+    model = MandateBeliefs(0)
+    model.sync(state)
+    bill = PendingLegislation("HEALTHCARE", 1, support_players={2: 5})
+    state.term_legislation.append(bill)
+    state.secret_candidacies.append(Candidacy(2, "GOVERNOR", 0))
+    assert model.sync(state) == 3
+    assert model.sync(state) == 0
+
+    # Resolution reveals an opposition that was never seen live; the rest was already counted
+    bill.oppose_players[1] = 1
+    bill.resolved = True
+    state.legislation_history.append({'sponsor_id': 1, 'leg_id': "HEALTHCARE", 'outcome': "Failure",
+                                      'support_players': {2: 5}, 'oppose_players': {1: 1}})
+    assert model.sync(state) == 1
+    assert model.observations == 4
+
+    # A new game with the same players starts from the prior again
+    state.term_counter = 3
+    model.sync(state)
+    fresh = _new_state(1)
+    model.sync(fresh)
+    assert model.observations == 0
+
+
+def test_persona_plays_full_games():
+    harness = SimulationHarness()
+    persona = BeliefPersona("Belief", random_seed=3)
+    for seed in range(3):
+        random.seed(seed)
+        agents = [persona, HeuristicPersona("Heuristic", random_seed=seed)]
+        result = harness.run_simulation(agents, ["Belief", "Heuristic"], 100, SilentLogger())
+        assert result.error is None
+        assert result.final_state.term_counter >= 3
+    model = persona.models[0]
+    assert set(model.mandate_ids) == set(ALL_MANDATE_IDS)
+    assert model.observations > 0
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the exact election win probability calculator.
+"""
+
+import copy
+import itertools
+import random
+from collections import Counter
+
+from simulation_harness import SimulationHarness
+from engine.election_odds import election_odds, win_probabilities, NPC_CHALLENGER
+from engine.actions import ActionDeclareCandidacy
+from engine.resolvers import resolve_elections
+from models.components import Candidacy
+from personas import HeuristicPersona
+
+
+def _enumerate_max(scores, dice=True):
+    """Win frequencies of every entry under the resolver's max() rule, by brute force."""
+    faces = range(1, 7) if dice else (0,)
+    wins = Counter()
+    total = 0
+    for rolls in itertools.product(faces, repeat=len(scores)):
+        final = {i: base + roll for i, (base, roll) in enumerate(zip(scores, rolls))}
+        wins[max(final, key=lambda k: final[k])] += 1
+        total += 1
+    return tuple(wins[i] / total for i in range(len(scores)))
+
+
+def test_matches_brute_force_including_ties():
+    for scores in [(0, 0), (3, 3, 1), (10, 0, 5, 4), (0, 2, 2, 2), (1, 1, 1, 1, 1)]:
+        exact = win_probabilities(scores)
+        brute = _enumerate_max(scores)
+        assert all(abs(a - b) < 1e-12 for a, b in zip(exact, brute)), scores
+        assert abs(sum(exact) - 1.0) < 1e-12
+    assert win_probabilities((2, 2, 1), dice=False) == _enumerate_max((2, 2, 1), dice=False) == (1.0, 0.0, 0.0)
+
+
+def test_election_odds_reads_declared_candidacies():
+    harness = SimulationHarness()
+    random.seed(0)
+    state = harness.engine.start_new_game(['A', 'B', 'C'])
+    state.secret_candidacies = [Candidacy(player_id=2, office_id="GOVERNOR", committed_pc=5),
+                                Candidacy(player_id=0, office_id="GOVERNOR", committed_pc=5),
+                                Candidacy(player_id=1, office_id="PRESIDENT", committed_pc=0)]
+
+    odds = election_odds(state, "GOVERNOR")
+    assert list(odds) == [2, 0, NPC_CHALLENGER]
+    # The earlier declaration wins ties
+    assert odds[2] > odds[0]
+    assert odds == election_odds(state, state.offices["GOVERNOR"], [(2, 5), (0, 5)])
+    assert election_odds(state, "US_SENATOR") == {}
+    assert election_odds(state, "PRESIDENT", disable_dice_roll=True) == {1: 0.0, NPC_CHALLENGER: 1.0}
+
+
+def test_matches_resolver_frequencies():
+    harness = SimulationHarness()
+    random.seed(1)
+    state = harness.engine.start_new_game(['A', 'B'])
+    odds = election_odds(state, "CONGRESS_SEAT", {0: 2, 1: 1})
+
+    for player in state.players:
+        player.current_office = None
+    state.secret_candidacies = [Candidacy(0, "CONGRESS_SEAT", 2), Candidacy(1, "CONGRESS_SEAT", 1)]
+    wins = Counter()
+    trials = 3000
+    for _ in range(trials):
+        trial = resolve_elections(copy.deepcopy(state))
+        holder = next((p.id for p in trial.players if p.current_office), NPC_CHALLENGER)
+        wins[holder] += 1
+    for key, p in odds.items():
+        assert abs(wins[key] / trials - p) < 0.04, key
+
+
+def test_heuristic_persona_prefers_the_committed_candidacy():
+    harness = SimulationHarness()
+    random.seed(2)
+    state = harness.engine.start_new_game(['A', 'B'])
+    state.round_marker = 4
+    player = state.get_current_player()
+    player.pc = 20
+    actions = [ActionDeclareCandidacy(player_id=player.id, office_id="CONGRESS_SEAT", committed_pc=0),
+               ActionDeclareCandidacy(player_id=player.id, office_id="CONGRESS_SEAT", committed_pc=5)]
+    chosen = HeuristicPersona("H", random_seed=0).choose_action(state, actions)
+    assert chosen.committed_pc == 5
@@ -0,0 +1,82 @@
+import asyncio
+import io
+import json
+import logging
+
+import pytest
+
+from game_logging import (
+    RateLimitFilter, SamplingFilter, configure_logging, get_logger, log_context
+)
+from server import SessionRunner
+
+
+@pytest.fixture
+def log_stream():
+    stream = io.StringIO()
+    configure_logging(level="DEBUG", fmt="json", rate_limit=0, stream=stream)
+    yield stream
+    configure_logging()
+
+
+def _records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def _record(message, level=logging.DEBUG):
+    return logging.LogRecord("election.test", level, __file__, 1, message, (), None)
+
+
+def test_records_carry_session_context_into_engine_threads(log_stream):
+    """
+    Fields bound for a connection reach records logged by engine calls on the worker pool.
+    """
+    logger = get_logger("test")
+
+    async def scenario():
+        with log_context(session="abc123", pacing="batch"):
+            await SessionRunner(object()).run(logger.info, "Engine step %s", 7)
+        logger.info("Outside")
+
+    asyncio.run(scenario())
+    inside, outside = _records(log_stream)
+    assert inside["message"] == "Engine step 7"
+    assert inside["logger"] == "election.test" and inside["level"] == "INFO"
+    assert inside["session"] == "abc123" and inside["pacing"] == "batch"
+    assert "session" not in outside
+
+
+def test_disabled_debug_does_not_format_arguments(log_stream):
+    class Expensive:
+        formatted = 0
+
+        def __str__(self):
+            Expensive.formatted += 1
+            return "expensive"
+
+    configure_logging(level="INFO", stream=log_stream)
+    get_logger("test").debug("State: %s", Expensive())
+    assert Expensive.formatted == 0
+    assert log_stream.getvalue() == ""
+
+
+def test_rate_limit_reports_suppressed_records():
+    now = [0.0]
+    limiter = RateLimitFilter(rate=1.0, burst=2, clock=lambda: now[0])
+    assert [limiter.filter(_record("Deck reshuffled")) for _ in range(4)] == [True, True, False, False]
+    # Another call site has its own budget
+    assert limiter.filter(_record("Other message"))
+
+    now[0] = 1.0
+    record = _record("Deck reshuffled")
+    assert limiter.filter(record)
+    assert record.suppressed == 2
+    assert not limiter.filter(_record("Deck reshuffled"))
+
+
+def test_sampling_keeps_one_in_n_debug_records_only():
+    sampler = SamplingFilter(rate=0.25)
+    kept = [sampler.filter(_record("Pending UI action")) for _ in range(8)]
+    assert kept == [True, False, False, False, True, False, False, False]
+    assert all(sampler.filter(_record("Engine error", logging.WARNING)) for _ in range(4))
+    assert not SamplingFilter(rate=0).filter(_record("Pending UI action"))
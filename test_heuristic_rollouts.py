@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the anytime rollout mode of HeuristicPersona.
+"""
+
+import random
+import time
+
+from simulation_harness import SimulationHarness
+from personas import HeuristicPersona, RandomPersona
+
+
+def _decision_point(seed):
+    harness = SimulationHarness()
+    random.seed(seed)
+    state = harness.engine.run_event_phase(harness.engine.start_new_game(['A', 'B', 'C']))
+    return state, harness.engine.get_valid_actions(state, state.get_current_player().id)
+
+
+def test_fixed_seed_gives_the_same_decisions():
+    for seed in range(3):
+        state, valid = _decision_point(seed)
+        chosen = []
+        for _ in range(2):
+            persona = HeuristicPersona("H", random_seed=7, rollout_time_limit=10.0, max_rollouts=60)
+            heuristic = persona.heuristic_action(state, list(valid))
+            action, stats = persona.improve_by_rollouts(state, list(valid), heuristic)
+            assert stats['rollouts'] == 60
+            chosen.append(action)
+        assert chosen[0] == chosen[1]
+        assert chosen[0] in valid
+
+
+def test_decisions_do_not_depend_on_earlier_decisions():
+    persona = HeuristicPersona("H", random_seed=7, rollout_time_limit=10.0, max_rollouts=30)
+    state, valid = _decision_point(0)
+    other_state, other_valid = _decision_point(1)
+    first = persona.rollout_rng_for(state).random()
+    persona.choose_action(other_state, list(other_valid))
+    assert persona.rollout_rng_for(state).random() == first
+    assert persona.rollout_rng_for(other_state).random() != first
+
+
+def test_time_limit_is_respected():
+    state, valid = _decision_point(4)
+    persona = HeuristicPersona("H", random_seed=1, rollout_time_limit=0.05, rollout_top_k=5)
+    start = time.perf_counter()
+    action, stats = persona.improve_by_rollouts(state, valid, persona.heuristic_action(state, valid))
+    assert time.perf_counter() - start < 0.25
+    assert action in valid
+    assert stats['rollouts'] > 0
+
+
+def test_rollout_mode_plays_full_games():
+    harness = SimulationHarness()
+    random.seed(5)
+    agents = [HeuristicPersona("Rollout", random_seed=2, rollout_time_limit=0.01),
+              RandomPersona("Random", random_seed=3)]
+    result = harness.run_simulation(agents, player_names=["Rollout", "Random"])
+    assert result.error is None
+    assert result.final_state.term_counter >= 3
+
+
+def test_server_games_seat_the_rollout_heuristic():
+    from game_session import GameSession
+    from engine.actions import ActionPassTurn
+
+    random.seed(3)
+    session = GameSession()
+    session.start_game()
+    session.state = session.engine.process_action(session.state, ActionPassTurn(player_id=0))
+    session.state = session._advance_game_flow(session.state)
+
+    persona, _ = session.pending_ai_decision()
+    assert isinstance(persona.agent, HeuristicPersona)
+    assert persona.rollout_time_limit == GameSession.AI_ROLLOUT_TIME_LIMIT
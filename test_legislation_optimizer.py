@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the exact expected-value legislation commitment optimizer.
+"""
+
+import copy
+import itertools
+import random
+import time
+
+from simulation_harness import SimulationHarness
+from engine.resolvers import _resolve_single_legislation
+from engine.actions import ActionSupportLegislation, ActionOpposeLegislation
+from models.game_state import PendingLegislation
+from personas import LegislativePersona
+from personas.legislation_optimizer import (
+    BillTerms, SUPPORT, OPPOSE, commitment_belief, combine_beliefs, point_belief,
+    expected_returns, bill_situation, rank_commitments
+)
+
+ME = 1
+
+
+def _new_state(seed=0):
+    harness = SimulationHarness()
+    random.seed(seed)
+    return harness.engine.start_new_game(['A', 'B', 'C', 'D'])
+
+
+def _resolved_pc(state, legislation_id, sponsor_id, support, oppose):
+    state = copy.deepcopy(state)
+    bill = PendingLegislation(legislation_id, sponsor_id, dict(support), dict(oppose))
+    _resolve_single_legislation(state, bill)
+    return state.get_player_by_id(ME).pc
+
+
+def _engine_gain(state, legislation_id, sponsor_id, support, oppose, side, amount):
+    """PC gained by committing `amount` more, measured on the real resolver."""
+    base = _resolved_pc(state, legislation_id, sponsor_id, support, oppose)
+    support, oppose = dict(support), dict(oppose)
+    committed = support if side == SUPPORT else oppose
+    committed[ME] = committed.get(ME, 0) + amount
+    return _resolved_pc(state, legislation_id, sponsor_id, support, oppose) - amount - base
+
+
+def test_point_beliefs_match_the_resolver():
+    state = _new_state()
+    scenarios = [
+        # (sponsor, others' support, others' oppose, my support, my oppose, war, incumbent)
+        (0, {0: 5}, {}, 0, 0, False, False),
+        (0, {0: 10, 2: 1}, {3: 5}, 0, 0, False, True),
+        (ME, {2: 5}, {3: 1}, 0, 0, False, False),
+        (ME, {}, {2: 10}, 5, 0, True, True),
+        (2, {2: 1, 3: 10}, {}, 0, 1, True, False),
+    ]
+    for legislation_id, legislation in state.legislation_options.items():
+        for sponsor, support, oppose, my_support, my_oppose, war, incumbent in scenarios:
+            scenario = copy.deepcopy(state)
+            if war:
+                scenario.active_effects.add("WAR_BREAKS_OUT")
+            scenario.get_player_by_id(ME).current_office = (
+                scenario.offices["STATE_SENATOR"] if incumbent else None)
+            support, oppose = dict(support), dict(oppose)
+            if my_support:
+                support[ME] = my_support
+            if my_oppose:
+                oppose[ME] = my_oppose
+            others_net = (sum(v for k, v in support.items() if k != ME)
+                          - sum(v for k, v in oppose.items() if k != ME))
+
+            returns = expected_returns(BillTerms.from_legislation(legislation), point_belief(others_net),
+                                       my_support, my_oppose, sponsor == ME, war, incumbent)
+            for (side, amount), gain in returns.items():
+                expected = _engine_gain(scenario, legislation_id, sponsor, support, oppose, side, amount)
+                assert gain == expected, (legislation_id, sponsor, side, amount)
+
+
+def test_commitment_belief_averages_every_secret_amount():
+    belief = commitment_belief(supporters=2, opposers=1)
+    assert abs(sum(p for _, p in belief) - 1.0) < 1e-12
+
+    terms = BillTerms(success_target=8, crit_target=15, success_reward=10, crit_reward=20,
+                      failure_penalty=5, mood_change=1)
+    returns = expected_returns(terms, belief)
+    for key, gain in returns.items():
+        outcomes = [expected_returns(terms, point_belief(a + b - c))[key]
+                    for a, b, c in itertools.product((1, 5, 10), repeat=3)]
+        assert abs(gain - sum(outcomes) / len(outcomes)) < 1e-9
+
+    assert combine_beliefs(commitment_belief(1, 0), commitment_belief(1, 1)) == \
+        tuple((net, p) for net, p in commitment_belief(2, 1))
+
+
+def test_results_are_memoized_and_fast():
+    terms = BillTerms(8, 15, 10, 20, 5, 1)
+    belief = commitment_belief(3, 2)
+    first = expected_returns(terms, belief, 0, 0, False, False, True)
+    assert expected_returns(terms, belief, 0, 0, False, False, True) is first
+
+    calls = 20000
+    start = time.perf_counter()
+    for _ in range(calls):
+        expected_returns(terms, belief, 0, 0, False, False, True)
+    per_call = (time.perf_counter() - start) / calls
+    assert per_call < 20e-6
+
+
+def test_rank_commitments_orders_valid_actions():
+    state = _new_state(3)
+    legislation_id = next(iter(state.legislation_options))
+    state.term_legislation.append(PendingLegislation(legislation_id, 0, {0: 5}))
+    actions = [cls(player_id=ME, legislation_id=legislation_id, **{field: amount})
+               for cls, field in ((ActionSupportLegislation, 'support_amount'),
+                                  (ActionOpposeLegislation, 'oppose_amount'))
+               for amount in (1, 5, 10)]
+
+    ranked = rank_commitments(state, ME, actions)
+    assert [action for _, action in ranked] and len(ranked) == 6
+    gains = [gain for gain, _ in ranked]
+    assert gains == sorted(gains, reverse=True)
+    situation = bill_situation(state, ME, legislation_id)
+    assert situation['belief'] == commitment_belief(1, 0)
+    assert bill_situation(state, ME, "NO_SUCH_BILL") is None
+
+
+def test_legislative_persona_commits_the_best_expected_amount():
+    state = _new_state(5)
+    legislation_id = next(iter(state.legislation_options))
+    state.term_legislation.append(PendingLegislation(legislation_id, 0, {0: 5}))
+    state.current_player_index = ME
+    actions = [ActionSupportLegislation(player_id=ME, legislation_id=legislation_id, support_amount=a)
+               for a in (1, 5, 10)]
+    actions += [ActionOpposeLegislation(player_id=ME, legislation_id=legislation_id, oppose_amount=a)
+                for a in (1, 5, 10)]
+
+    best_gain, best = rank_commitments(state, ME, actions)[0]
+    chosen = LegislativePersona("L", random_seed=0).choose_action(state, actions)
+    assert rank_commitments(state, ME, [chosen])[0][0] == best_gain
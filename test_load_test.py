@@ -0,0 +1,49 @@
+import asyncio
+import random
+
+from load_test import choose_reply, local_server, parse_metrics, run_load_test
+
+
+def _state(**fields):
+    state = {"players": [{"id": 0, "name": "Human", "pc": 5}, {"id": 1, "name": "AI 1", "pc": 5}],
+             "current_player_index": 0, "valid_actions": [{"action_type": "ActionFundraise", "player_id": 0}]}
+    state.update(fields)
+    return state
+
+
+def test_choose_reply_answers_like_a_player():
+    rng = random.Random(0)
+    assert choose_reply(_state(awaiting_acknowledgement=True), rng) == {"action_type": "AcknowledgeAITurn"}
+    assert choose_reply(_state(current_player_index=1), rng) is None
+    assert choose_reply(_state(), rng) == {"action_type": "ActionFundraise", "player_id": 0}
+
+    # Amounts stay inside the range the prompt states
+    prompt = _state(prompt="Invalid amount. How much PC? (0-0)", expects_input="amount")
+    assert {choose_reply(prompt, rng)["choice"] for _ in range(20)} == {0}
+    prompt = _state(prompt="How much PC will you commit? (1-3)", expects_input="amount")
+    assert {choose_reply(prompt, rng)["choice"] for _ in range(50)} == {1, 2, 3}
+
+    options = _state(prompt="Which office?", options=[{"id": "MAYOR"}, {"id": "GOVERNOR"}])
+    assert choose_reply(options, rng)["choice"] in ("MAYOR", "GOVERNOR")
+
+
+def test_parse_metrics_reads_unlabelled_samples():
+    text = "# TYPE a gauge\na 1.5\nb_count{kind=\"x\"} 3\nc 2\n"
+    assert parse_metrics(text) == {"a": 1.5, "c": 2.0}
+
+
+def test_load_test_plays_full_games_against_a_local_server():
+    """
+    Simulated clients play complete games over /ws and the report covers throughput, latency and memory.
+    """
+    with local_server() as base_url:
+        report = asyncio.run(run_load_test(base_url, clients=2, games=1, pacing="batch", sample_interval=0.5))
+
+    assert report["games_completed"] == 2, report["failures"]
+    assert report["game_error_rate"] == 0.0
+    assert report["server_error_messages"] == 0
+    assert report["actions_sent"] > 0 and report["messages_per_second"] > 0
+    assert {"session", "snapshot", "patch", "batch"} <= set(report["latency"])
+    for stats in report["latency"].values():
+        assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    assert report["memory_samples"] and report["peak_resident_bytes"] > 0
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the search state model and the MCTS persona.
+"""
+
+import random
+import time
+
+from simulation_harness import SimulationHarness
+from engine.search_state import SearchState, action_key, NETWORK, FAVOR, DECLARE, SPONSOR
+from engine.scoring import calculate_final_scores
+from models.cards import Deck
+from personas import MCTSPersona, RandomPersona
+
+# Events whose resolvers use no randomness, so engine and model can be compared step by step
+DETERMINISTIC_EVENTS = {
+    "ECONOMIC_BOOM", "RECESSION_HITS", "SCANDAL", "UNEXPECTED_SURPLUS", "LAST_BILL_DUD",
+    "LAST_BILL_HIT", "TECH_LEAP", "ENDORSEMENT", "GRASSROOTS", "MIDTERM_FURY", "STOCK_CRASH",
+    "CELEB_POLITICIAN", "SUPREME_COURT_VACANCY", "WAR_BREAKS_OUT"
+}
+
+
+def _new_game(harness, seed):
+    random.seed(seed)
+    state = harness.engine.start_new_game(['A', 'B', 'C', 'D'])
+    cards = [card for card in harness.game_data['events'] if card.effect_id in DETERMINISTIC_EVENTS]
+    state.event_deck = Deck(cards)
+    return harness.engine.run_event_phase(state)
+
+
+def _finish_term(harness, state):
+    engine = harness.engine
+    if state.awaiting_legislation_resolution:
+        state = engine.resolve_legislation_session(state)
+    if state.awaiting_election_resolution:
+        state = engine.resolve_elections_session(state, disable_dice_roll=True)
+    if state.awaiting_results_acknowledgement:
+        state = engine.start_next_term(state)
+    return state
+
+
+def _snapshot_engine(state):
+    return ([p.pc for p in state.players],
+            [p.current_office.id if p.current_office else None for p in state.players],
+            [state.action_points[p.id] for p in state.players],
+            state.current_player_index, state.round_marker, state.term_counter, state.public_mood)
+
+
+def _snapshot_model(model):
+    return (model.pc, model.office, model.ap, model.current, model.round, model.term, model.mood)
+
+
+def test_search_state_matches_engine_over_whole_games():
+    harness = SimulationHarness(disable_dice_roll=True)
+    for seed in range(3):
+        state = _new_game(harness, seed)
+        model = SearchState.from_game_state(state, random.Random(seed), disable_dice_roll=True)
+        policy = random.Random(100 + seed)
+        steps = 0
+        while not harness.engine.is_game_over(state):
+            player = state.get_current_player()
+            valid = harness.engine.get_valid_actions(state, player.id)
+            keys = [action_key(a) for a in valid]
+            assert sorted(keys) == sorted(model.legal_actions())
+
+            # Networking draws favors at random, and the legislation session always rolls
+            # election dice, so keep to actions that make the engine deterministic
+            excluded = {NETWORK, FAVOR}
+            if state.term_legislation:
+                excluded.add(DECLARE)
+            elif state.secret_candidacies:
+                excluded.add(SPONSOR)
+            choices = [a for a, key in zip(valid, keys) if key[0] not in excluded]
+            action = policy.choice(choices)
+            state = harness._advance_game_flow(harness.engine.process_action(state, action))
+            state = _finish_term(harness, state)
+            model.apply(action_key(action))
+            assert _snapshot_model(model) == _snapshot_engine(state)
+            steps += 1
+
+        assert model.is_terminal()
+        engine_scores = calculate_final_scores(state)
+        assert model.scores() == [engine_scores[p.id]['total_influence'] for p in state.players]
+        assert steps > 50
+
+
+def test_search_state_matches_engine_for_gaffed_player():
+    # A public gaffe adds 1 AP to Sponsor/Declare, which the engine then never considers affordable
+    harness = SimulationHarness(disable_dice_roll=True)
+    state = _new_game(harness, 0)
+    player = state.get_current_player()
+    player.pc = 50
+    state.public_gaffe_players.add(player.id)
+    model = SearchState.from_game_state(state, random.Random(0), disable_dice_roll=True)
+    keys = [action_key(a) for a in harness.engine.get_valid_actions(state, player.id)]
+    assert sorted(keys) == sorted(model.legal_actions())
+    assert not any(key[0] in (SPONSOR, DECLARE) for key in keys)
+
+    state.public_gaffe_players.discard(player.id)
+    model = SearchState.from_game_state(state, random.Random(0), disable_dice_roll=True)
+    keys = [action_key(a) for a in harness.engine.get_valid_actions(state, player.id)]
+    assert sorted(keys) == sorted(model.legal_actions())
+    assert any(key[0] == SPONSOR for key in keys)
+
+
+def test_clone_is_independent():
+    harness = SimulationHarness()
+    model = SearchState.from_game_state(_new_game(harness, 7), random.Random(1))
+    copy = model.clone()
+    copy.apply(('SPONSOR', 'INFRASTRUCTURE'))
+    copy.apply(('SUPPORT', 'INFRASTRUCTURE', 5))
+    copy.determinize(0)
+    assert model.bills == [] and copy.bills
+    assert model.pc != copy.pc
+    assert model.deck != copy.deck or len(model.deck) < 2
+
+
+def test_mcts_returns_a_valid_action():
+    harness = SimulationHarness()
+    state = _new_game(harness, 3)
+    persona = MCTSPersona("MCTS", random_seed=1, iterations=60)
+    valid = harness.engine.get_valid_actions(state, state.get_current_player().id)
+    assert persona.choose_action(state, valid) in valid
+    assert persona.last_search_stats['iterations'] == 60
+
+
+def test_mcts_plays_a_full_simulation():
+    harness = SimulationHarness()
+    random.seed(11)
+    agents = [MCTSPersona("MCTS", random_seed=2, iterations=20),
+              RandomPersona("R1", random_seed=3), RandomPersona("R2", random_seed=4)]
+    result = harness.run_simulation(agents, max_rounds=200)
+    assert result.error is None
+    assert result.final_state.term_counter >= 3
+
+
+def test_rollouts_are_fast():
+    """The model should sustain well over a thousand term-long rollouts per second."""
+    harness = SimulationHarness()
+    root = SearchState.from_game_state(_new_game(harness, 5), random.Random(0))
+    rng = random.Random(1)
+    rollouts = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < 1.0:
+        state = root.clone()
+        state.determinize(0, rng)
+        while state.term == root.term:
+            state.apply(state.random_action(rng))
+        rollouts += 1
+    # Loose bound so the test is stable on slow CI machines
+    assert rollouts > 300
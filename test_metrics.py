@@ -0,0 +1,69 @@
+import re
+
+from fastapi.testclient import TestClient
+
+from metrics import Histogram, MetricsRegistry
+from server import app
+
+
+def test_histogram_exposition_is_cumulative():
+    """
+    Buckets count every observation at or below their bound, with +Inf, _sum and _count per label set.
+    """
+    histogram = Histogram("demo_seconds", "Demo latency.", buckets=(0.1, 1.0), label_names=("kind",))
+    histogram.observe(0.05, "fast")
+    histogram.observe(0.1, "fast")
+    histogram.observe(0.5, "fast")
+    histogram.observe(5.0, "fast")
+    histogram.observe(0.2, "slow")
+
+    lines = histogram.collect()
+    assert lines[:2] == ["# HELP demo_seconds Demo latency.", "# TYPE demo_seconds histogram"]
+    assert 'demo_seconds_bucket{kind="fast",le="0.1"} 2' in lines
+    assert 'demo_seconds_bucket{kind="fast",le="1.0"} 3' in lines
+    assert 'demo_seconds_bucket{kind="fast",le="+Inf"} 4' in lines
+    assert 'demo_seconds_sum{kind="fast"} 5.65' in lines
+    assert 'demo_seconds_count{kind="fast"} 4' in lines
+    assert 'demo_seconds_bucket{kind="slow",le="0.1"} 0' in lines
+    assert 'demo_seconds_count{kind="slow"} 1' in lines
+
+
+def test_registry_renders_gauges_and_collectors():
+    registry = MetricsRegistry()
+    queued = registry.gauge("demo_queued", "Queued work.")
+    queued.inc()
+    queued.inc()
+    queued.dec()
+    registry.gauge("demo_sampled", "Sampled value.", lambda: 7)
+    registry.add_collector(lambda: ["# TYPE demo_extra counter", "demo_extra 3"])
+
+    text = registry.render()
+    assert "demo_queued 1.0\n" in text
+    assert "demo_sampled 7\n" in text
+    assert text.endswith("demo_extra 3\n")
+    assert registry.gauge("demo_queued", "Queued work.") is queued
+
+
+def test_metrics_endpoint_reports_hot_paths_after_a_game_step():
+    """
+    After a websocket game step, /metrics exposes engine, serialization, payload and send histograms.
+    """
+    client = TestClient(app)
+    with client.websocket_connect("/ws") as websocket:
+        assert websocket.receive_json()["type"] == "session"
+        assert websocket.receive_json()["type"] == "snapshot"
+        websocket.send_json({"action_type": "ActionPassTurn", "player_id": 0})
+        websocket.receive_json()
+
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert re.search(r'election_action_processing_seconds_count\{action_type="ActionPassTurn"\} [1-9]', text)
+    assert re.search(r'election_state_serialization_seconds_count\{message_type="snapshot"\} [1-9]', text)
+    assert re.search(r'election_message_payload_bytes_count\{message_type="snapshot"\} [1-9]', text)
+    assert re.search(r'election_websocket_send_seconds_count [1-9]', text)
+    assert "# TYPE election_engine_queued_tasks gauge" in text
+    assert re.search(r'^election_connected_sessions [1-9]', text, re.M)
+    assert "# TYPE election_ai_decision_seconds histogram" in text
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the class-level action priority tables of personas.
+"""
+
+from dataclasses import dataclass
+
+from engine.actions import (
+    Action, ActionFundraise, ActionNetwork, ActionPassTurn, ActionSupportLegislation,
+    ActionOpposeLegislation, ActionAcceptTrade, ACTION_TYPES
+)
+from personas import BasePersona, EconomicPersona, LegislativePersona, HeuristicPersona, RandomPersona
+
+
+@dataclass
+class ActionLobby(ActionNetwork):
+    """An unregistered subclass of a listed action."""
+    pass
+
+
+class FixedPersona(BasePersona):
+    ACTION_PRIORITIES = {ActionNetwork: 5, ActionPassTurn: 1}
+    DEFAULT_ACTION_PRIORITY = 3
+
+    def choose_action(self, game_state, valid_actions):
+        return self.choose_highest_priority_action(valid_actions)
+
+
+class DynamicPersona(FixedPersona):
+    def get_action_priority(self, action):
+        return 10 if isinstance(action, ActionPassTurn) else 0
+
+
+def test_tables_are_compiled_by_type_id():
+    assert [cls.type_id for cls in ACTION_TYPES] == list(range(len(ACTION_TYPES)))
+    table = FixedPersona._priority_table
+    assert len(table) == len(ACTION_TYPES)
+    assert table[ActionNetwork.type_id] == 5
+    assert table[ActionFundraise.type_id] == 3
+
+    persona = FixedPersona("F")
+    assert persona.get_action_priority(ActionLobby(player_id=0)) == 5
+    assert RandomPersona("R").get_action_priority(ActionFundraise(player_id=0)) == 0
+
+
+def test_persona_priorities_match_their_declared_order():
+    economic = EconomicPersona("E")
+    assert economic.get_action_priority(ActionFundraise(0)) == 100
+    assert economic.get_action_priority(ActionAcceptTrade(0, 1)) == 30
+    legislative = LegislativePersona("L")
+    support = ActionSupportLegislation(0, "X", 5)
+    oppose = ActionOpposeLegislation(0, "X", 5)
+    assert legislative.get_action_priority(support) == legislative.get_action_priority(oppose) == 90
+    assert HeuristicPersona("H").get_action_priority(ActionPassTurn(0)) == 2
+
+
+def test_single_pass_selection_keeps_ties_and_overrides():
+    actions = [ActionFundraise(0), ActionNetwork(0), ActionPassTurn(0), ActionLobby(0)]
+    persona = FixedPersona("F", random_seed=3)
+    chosen = {type(persona.choose_highest_priority_action(actions)) for _ in range(30)}
+    assert chosen == {ActionNetwork, ActionLobby}
+    assert persona.choose_highest_priority_action([]) is None
+
+    assert isinstance(DynamicPersona("D").choose_highest_priority_action(actions), ActionPassTurn)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming quantile sketches.
+"""
+
+import bisect
+import json
+import random
+
+from quantile_sketch import KLLSketch, SketchSet
+
+
+def _rank(sorted_values, value):
+    return bisect.bisect_left(sorted_values, value) / len(sorted_values)
+
+
+def test_quantiles_are_accurate_in_bounded_memory():
+    rng = random.Random(3)
+    values = [rng.gauss(50, 15) for _ in range(50000)]
+    sketch = KLLSketch(k=200)
+    for value in values:
+        sketch.update(value)
+
+    ordered = sorted(values)
+    for q in (0.01, 0.1, 0.5, 0.9, 0.99):
+        assert abs(_rank(ordered, sketch.quantile(q)) - q) < 0.02
+    assert sketch.quantile(0) == ordered[0]
+    assert sketch.quantile(1) == ordered[-1]
+    assert sum(len(c) for c in sketch.to_dict()['compactors']) < 1000
+
+
+def test_merge_and_serialization():
+    """Merged worker sketches answer like one sketch; JSON round-trips are exact."""
+    rng = random.Random(5)
+    values = [rng.randint(0, 200) for _ in range(20000)]
+    workers = [KLLSketch(), KLLSketch(), KLLSketch()]
+    for i, value in enumerate(values):
+        workers[i % 3].update(value)
+
+    merged = KLLSketch()
+    for worker in workers:
+        merged.merge(worker)
+    assert merged.count == len(values)
+
+    ordered = sorted(values)
+    assert abs(_rank(ordered, merged.quantile(0.5)) - 0.5) < 0.03
+
+    restored = KLLSketch.from_dict(json.loads(json.dumps(merged.to_dict())))
+    assert restored.quantiles([0.1, 0.5, 0.9]) == merged.quantiles([0.1, 0.5, 0.9])
+    restored.update(1000)
+    assert restored.max_value == 1000 and merged.max_value != 1000
+
+
+def test_sketch_set_tracks_persona_seat_and_metric():
+    sketches = SketchSet()
+    sketches.add_game(['economic', 'random'],
+                      [{'id': 0, 'pc': 30, 'influence': 12}, {'id': 1, 'pc': 10, 'influence': 20}], 40)
+    sketches.add_game(['random', 'economic'],
+                      [{'id': 0, 'pc': 5, 'influence': 9}, {'id': 1, 'pc': 50, 'influence': 25}], 44)
+
+    assert sketches.select('economic', seat=0, metric='final_pc').quantile(0.5) == 30
+    assert sketches.select('economic', metric='final_pc').count == 2
+    assert sketches.select('economic', metric='score_margin').max_value == 16
+    assert sketches.select('random', metric='score_margin').min_value == -16
+    assert sketches.select(metric='game_length').count == 4
+
+    other = SketchSet.from_dict(sketches.to_dict())
+    other.merge(sketches)
+    assert other.select('random', metric='total_influence').count == 4
+    assert sketches.select('random', metric='total_influence').count == 2
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for reservoir-sampled game logs in the simulation runner.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from result_sampling import GameLogSampler, score_margin
+from analysis import SimulationAnalyzer
+from simulation_runner import SimulationRunner
+from quantile_sketch import SketchSet
+
+
+def test_sampler_keeps_reservoir_and_outliers():
+    """The sampler keeps a bounded sample plus the longest, widest-margin and failed games."""
+    sampler = GameLogSampler(reservoir_size=3, keep_longest=1, keep_largest_margins=1, seed=7)
+    dropped = []
+    for game_id in range(200):
+        length = 90 if game_id == 120 else 40
+        margin = 30 if game_id == 55 else 5
+        error = "boom" if game_id == 10 else None
+        dropped.extend(sampler.offer(game_id, length, margin, error))
+
+    retained = sampler.retained()
+    assert 'longest' in retained[120]
+    assert 'largest_margin' in retained[55]
+    assert 'error' in retained[10]
+    assert sum('sample' in reasons for reasons in retained.values()) == 3
+    assert len(retained) <= 6
+
+    # Every game is either retained or was reported as dropped exactly once
+    assert sorted(dropped + list(retained)) == list(range(200))
+
+
+def test_score_margin():
+    assert score_margin({0: {'total_influence': 12}, 1: {'total_influence': 20}}) == 8
+    assert score_margin({0: 5}) == 0
+
+
+def test_runner_writes_summaries_for_unsampled_games():
+    """Only sampled games keep full detail; every game keeps a compact summary."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = {
+            'global': {
+                'random_seed': 42,
+                'max_rounds_per_game': 150,
+                'output_directory': temp_dir
+            },
+            'data_collection': {
+                'save_game_logs': True,
+                'save_final_states': True,
+                'log_sampling': {
+                    'reservoir_size': 2,
+                    'keep_longest': 1,
+                    'keep_largest_margins': 1,
+                    'seed': 1
+                }
+            },
+            'experiments': [{
+                'name': 'sampling',
+                'num_games': 8,
+                'players': [
+                    {'name': 'Random Bot', 'persona': 'random'},
+                    {'name': 'Economic Bot', 'persona': 'economic'}
+                ]
+            }]
+        }
+        config_path = os.path.join(temp_dir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.dump(config, f)
+
+        all_results = SimulationRunner(config_path).run_simulation_batch()
+        assert len(all_results['sampling']) == 8
+
+        results_file = next(Path(temp_dir, 'sampling').glob('*detailed_results_*.json'))
+        rows = json.loads(results_file.read_text())
+        assert len(rows) == 8
+
+        full = [row for row in rows if 'retained_for' in row]
+        assert 1 <= len(full) <= 4
+        for row in full:
+            assert row['game_log'] and row['final_state']
+        for row in rows:
+            assert row['winner_name'] is not None
+            assert len(row['players']) == 2
+            if 'retained_for' not in row:
+                assert 'game_log' not in row and 'final_state' not in row
+
+        # Action counts come from every game's summary, not only the sampled logs
+        assert all(player['actions'] for row in rows for player in row['players'])
+        analyzer = SimulationAnalyzer(str(Path(temp_dir, 'sampling')))
+        analyzer.load_results()
+        frequency = analyzer.calculate_metrics().action_frequency
+        assert set(frequency) == {'Random', 'Economic'}
+        assert sum(sum(actions.values()) for actions in frequency.values()) == \
+            sum(sum(player['actions'].values()) for row in rows for player in row['players'])
+
+        # The runner's saved sketches use the analysis's persona keys, so the two merge
+        sketch_file = next(Path(temp_dir, 'sampling').glob('*quantile_sketches_*.json'))
+        saved = SketchSet.from_dict(json.loads(sketch_file.read_text()))
+        assert saved.personas() == analyzer._accumulator.sketches.personas()
+        assert saved.select('Economic', metric='final_pc').count == 8
@@ -10,8 +10,11 @@ def test_websocket_connection_and_initial_state():
     Tests that a client can connect to the WebSocket and receives a valid initial game state.
     """
     with client.websocket_connect("/ws") as websocket:
-        # Receive the first message, which should be the initial state
-        data = websocket.receive_json()
+        # The first message carries the session token, the second a snapshot of the initial state
+        assert websocket.receive_json()["type"] == "session"
+        message = websocket.receive_json()
+        assert message["type"] == "snapshot"
+        data = message["state"]
 
         # Verify the structure of the initial state
         assert "round_marker" in data
@@ -31,4 +34,139 @@ def test_websocket_connection_and_initial_state():
         # Note: This part of the test will need to be expanded once the to_dict methods
         # in the models are fully implemented.
         # For now, we are just checking the player names.
-        assert data["players"][0]['name'] == "Human" 
\ No newline at end of file
+        assert data["players"][0]['name'] == "Human" 
+
+def test_session_runner_keeps_event_loop_responsive():
+    """
+    Engine work runs off the event loop, in order within a session and in parallel across sessions.
+    """
+    import asyncio
+    import threading
+    from server import SessionRunner
+
+    order = []
+    # a1 and b1 only get past the barrier if they run at the same time
+    both_running = threading.Barrier(2, timeout=5)
+    working = threading.Event()
+    loop_ran = threading.Event()
+    saw_loop = {}
+
+    def step(label):
+        if label.endswith("1"):
+            both_running.wait()
+        if label == "a1":
+            # Blocks this worker until the event loop has run while it waits
+            working.set()
+            saw_loop[label] = loop_ran.wait(5)
+        order.append(label)
+        return label
+
+    async def scenario():
+        first, second = SessionRunner(object()), SessionRunner(object())
+
+        async def watch():
+            while not working.is_set():
+                await asyncio.sleep(0.001)
+            loop_ran.set()
+
+        watcher = asyncio.create_task(watch())
+        results = await asyncio.gather(first.run(step, "a1"), second.run(step, "b1"),
+                                       first.run(step, "a2"), second.run(step, "b2"))
+        await watcher
+        return results
+
+    results = asyncio.run(scenario())
+    assert results == ["a1", "b1", "a2", "b2"]
+    assert order.index("a1") < order.index("a2") and order.index("b1") < order.index("b2")
+    assert saw_loop == {"a1": True}
+
+
+def test_catalog_is_cacheable_and_resolves_state_ids():
+    """
+    The static catalog is served with an ETag, and per-turn state only references its entries.
+    """
+    response = client.get("/catalog")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+    catalog = response.json()
+    assert catalog["offices"]["PRESIDENT"]["title"] == "President"
+    assert client.get("/catalog", headers={"If-None-Match": etag}).status_code == 304
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.receive_json()
+        state = websocket.receive_json()["state"]
+    assert etag == f'"{state["catalog_version"]}"'
+    assert "legislation_options" not in state and "offices" not in state
+    for player in state["players"]:
+        assert "mandate" not in player and "archetype" not in player
+        assert player["mandate_id"] in catalog["mandates"]
+        assert player["archetype_id"] in catalog["archetypes"]
+        assert all(favor_id in catalog["favors"] for favor_id in player["favor_ids"])
+        assert player["current_office_id"] is None or player["current_office_id"] in catalog["offices"]
+
+
+def test_batched_ai_pacing_needs_one_acknowledgement():
+    """
+    In batch pacing all AI moves up to the human's turn arrive as one message.
+    """
+    from state_delta import apply_patch
+
+    with client.websocket_connect("/ws?pacing=batch") as websocket:
+        websocket.receive_json()
+        state = websocket.receive_json()["state"]
+        human_id = state["current_player_index"]
+        websocket.send_json({"action_type": "ActionPassTurn"})
+        state = apply_patch(state, websocket.receive_json()["ops"])
+
+        batch = websocket.receive_json()
+        assert batch["type"] == "batch" and len(batch["frames"]) >= 2
+        for frame in batch["frames"]:
+            assert frame["hint"]["player_id"] != human_id and frame["hint"]["delay_ms"] >= 0
+            state = apply_patch(state, frame["ops"])
+        assert state["awaiting_acknowledgement"] is True
+
+        websocket.send_json({"action_type": "AcknowledgeAITurn"})
+        update = websocket.receive_json()
+        assert update["type"] == "patch"
+        state = apply_patch(state, update["ops"])
+        assert "awaiting_acknowledgement" not in state
+        assert state["current_player_index"] == human_id
+        assert state["valid_actions"]
+
+
+
+def test_session_sweeper_survives_a_failed_sweep(monkeypatch):
+    """
+    An exception in one sweep is logged and the next sweep still runs.
+    """
+    import asyncio
+    import server
+
+    class FailingOnceRegistry:
+        save_interval = 0.01
+
+        def __init__(self):
+            self.sweeps = 0
+
+        def unsaved(self, due_only=False):
+            return []
+
+        def sweep(self, save_due=True):
+            self.sweeps += 1
+            if self.sweeps == 1:
+                raise RuntimeError("disk full")
+
+    fake = FailingOnceRegistry()
+    monkeypatch.setattr(server, "registry", fake)
+
+    async def scenario():
+        sweeper = asyncio.create_task(server.sweep_sessions())
+        for _ in range(500):
+            if fake.sweeps >= 2:
+                break
+            await asyncio.sleep(0.01)
+        sweeper.cancel()
+
+    asyncio.run(scenario())
+    assert fake.sweeps >= 2
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent game session registry and reconnect-resume.
+"""
+
+import random
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from session_registry import SessionRegistry, SessionLimitError
+from spectator import spectate_id_for
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _play(session, steps):
+    for _ in range(steps):
+        if session.is_game_over():
+            return
+        if session.is_human_turn():
+            session.process_human_action({"action_type": "ActionFundraise"})
+        else:
+            session.process_ai_turn()
+
+
+def test_sessions_survive_a_restart(tmp_path):
+    random.seed(0)
+    db = str(tmp_path / "sessions.db")
+    first = SessionRegistry(db)
+    token, session = first.open()
+    _play(session, 6)
+    first.touch(token)
+    first.release(token)
+    expected = session.get_state_for_client()
+    first.close()
+
+    second = SessionRegistry(db)
+    resumed_token, resumed = second.open(token)
+    assert resumed_token == token and resumed is not session
+    assert resumed.get_state_for_client() == expected
+    _play(resumed, 3)
+
+    # Unknown tokens start a new game
+    other_token, _ = second.open("no-such-token")
+    assert other_token != "no-such-token"
+
+
+def test_writes_are_coalesced(tmp_path):
+    clock = FakeClock()
+    registry = SessionRegistry(str(tmp_path / "s.db"), save_interval=2.0, clock=clock)
+    token, session = registry.open()
+    for _ in range(5):
+        _play(session, 1)
+        registry.touch(token)
+        clock.now += 0.1
+    assert registry.writes == 1
+    registry.sweep()
+    assert registry.writes == 1
+    clock.now += 2.0
+    registry.sweep()
+    assert registry.writes == 2
+    registry.sweep()
+    assert registry.writes == 2
+
+    # A disconnect flushes a pending write right away
+    registry.touch(token)
+    registry.release(token)
+    assert registry.writes == 3
+
+
+def test_caps_and_eviction(tmp_path):
+    clock = FakeClock()
+    registry = SessionRegistry(str(tmp_path / "s.db"), max_sessions=2, max_resident=2,
+                               idle_seconds=60, clock=clock)
+    a, session_a = registry.open()
+    b, _ = registry.open()
+    with pytest.raises(SessionLimitError):
+        registry.open()
+    # Another connection to an already connected game is not a new session
+    assert registry.open(a)[1] is session_a
+    registry.release(a)
+    registry.release(a)
+
+    c, _ = registry.open()
+    assert not registry.is_resident(a)
+    assert registry.stats() == {'resident': 2, 'connected': 2, 'stored': 1, 'writes': 1}
+
+    registry.release(b)
+    registry.release(c)
+    clock.now += 61
+    registry.sweep()
+    assert registry.stats()['resident'] == 0
+    assert registry.stats()['stored'] == 3
+    assert registry.open(a)[0] == a
+
+
+def test_sweep_purges_expired_and_unloadable_sessions(tmp_path):
+    registry = SessionRegistry(str(tmp_path / "s.db"), stored_ttl=3600)
+    kept, _ = registry.open()
+    registry.release(kept)
+    registry._db.executemany(
+        "INSERT INTO sessions (token, snapshot, updated_at) VALUES (?, ?, ?)",
+        [("expired", b"old", 0.0), ("corrupt", b"not a snapshot", time.time())]
+    )
+    registry._db.commit()
+
+    # A resident session whose row is old is still resumable
+    registry._db.execute("UPDATE sessions SET updated_at = 0 WHERE token = ?", (kept,))
+    registry.sweep()
+    assert registry.stats()['stored'] == 2
+
+    assert registry.open("corrupt")[0] != "corrupt"
+    stored = {token for (token,) in registry._db.execute("SELECT token FROM sessions")}
+    assert stored == {kept}
+
+
+def test_changes_made_during_a_save_stay_unsaved(tmp_path):
+    clock = FakeClock()
+    registry = SessionRegistry(str(tmp_path / "s.db"), save_interval=2.0, clock=clock)
+    token, session = registry.open()
+    registry.save(token)
+    snapshot = session.to_snapshot
+
+    def snapshot_then_change():
+        session.to_snapshot = snapshot
+        data = snapshot()
+        # Another change lands after the snapshot was taken
+        registry.touch(token)
+        return data
+
+    registry.touch(token)
+    session.to_snapshot = snapshot_then_change
+    registry.save(token)
+    assert registry.writes == 2
+    assert registry.unsaved() == [(token, session)]
+    assert registry.unsaved(due_only=True) == []
+
+
+def test_sweep_keeps_unsaved_sessions_resident(tmp_path):
+    clock = FakeClock()
+    registry = SessionRegistry(str(tmp_path / "s.db"), idle_seconds=60, clock=clock)
+    token, _ = registry.open()
+    registry.release(token)
+    registry._entries[token].dirty = True
+    clock.now += 61
+    registry.sweep(save_due=False)
+    assert registry.is_resident(token)
+    registry.sweep()
+    assert not registry.is_resident(token) and registry.unsaved() == []
+
+
+def test_websocket_reconnect_resumes_the_game(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "registry", SessionRegistry(str(tmp_path / "ws.db")))
+    client = TestClient(server.app)
+    with client.websocket_connect("/ws") as websocket:
+        token = websocket.receive_json()["token"]
+        websocket.receive_json()
+        websocket.send_json({"action_type": "ActionFundraise"})
+        assert websocket.receive_json()["type"] == "patch"
+    assert server.registry.stats()['stored'] == 1
+
+    session = server.registry.open(token)[1]
+    expected_log = list(session.state.turn_log)
+    server.registry.release(token)
+    with client.websocket_connect(f"/ws?token={token}") as websocket:
+        # Resuming keeps the token, and with it the spectate ID viewers were given
+        assert websocket.receive_json() == {"type": "session", "token": token, "spectate_id": spectate_id_for(token)}
+        snapshot = websocket.receive_json()
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["state"]["log"][:len(expected_log)] == expected_log
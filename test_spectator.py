@@ -0,0 +1,116 @@
+import asyncio
+
+from game_session import GameSession
+from models.game_state import PendingLegislation
+from spectator import Broadcast, spectate_id_for, spectator_state
+from state_delta import apply_patch
+
+
+def _session():
+    session = GameSession()
+    session.start_game()
+    return session
+
+
+def test_spectator_state_hides_private_information():
+    session = _session()
+    session.state.term_legislation.append(PendingLegislation(
+        legislation_id="INFRASTRUCTURE", sponsor_id=1, support_players={0: 3}, oppose_players={2: 2}))
+    session.state.pending_ui_action = {"prompt": "How much PC? (1-5)", "expects_input": "amount"}
+    session.state.turn_log.extend([
+        "You secretly commit 3 PC to support the Infrastructure Bill.",
+        "AI 2 secretly committed 2 PC to oppose the Infrastructure Bill",
+        "AI 1 pays 5 PC to run for Mayor and secretly commits additional funds.",
+    ])
+
+    state = spectator_state(session)
+
+    assert state["spectating"] is True
+    assert all(player["mandate_id"] is None for player in state["players"])
+    assert state["term_legislation"] == [{"legislation_id": "INFRASTRUCTURE", "sponsor_id": 1, "resolved": False}]
+    assert "pending_ui_action" not in state and "valid_actions" not in state and "prompt" not in state
+    assert not any("secretly commit 3 PC" in line or "committed 2 PC" in line for line in state["log"])
+    assert "AI 1 pays 5 PC to run for Mayor and secretly commits additional funds." in state["log"]
+    # The game itself is untouched
+    assert session.state.players[0].mandate is not None
+    assert session.state.term_legislation[0].support_players == {0: 3}
+
+
+def test_broadcast_shares_encoded_frames_and_drops_to_latest_for_slow_viewers():
+    async def scenario():
+        session = _session()
+        broadcast = Broadcast(session)
+        fast, slow = broadcast.subscribe(), broadcast.subscribe()
+
+        broadcast.deliver(broadcast.capture())
+        first = await fast.next_frame()
+        assert (await slow.next_frame()) is first
+        assert fast.next_text(first) is slow.next_text(first) is first.snapshot_text()
+        assert broadcast.capture() is None  # nothing changed
+
+        for round_marker in (2, 3):
+            session.state.round_marker = round_marker
+            broadcast.deliver(broadcast.capture())
+            frame = await fast.next_frame()
+            assert fast.next_text(frame) == frame.patch_text
+
+        # The slow viewer skipped a patch: it gets only the latest frame, as a snapshot
+        assert slow.dropped == 1
+        latest = await slow.next_frame()
+        assert latest is broadcast.latest and latest.seq == 3
+        assert slow.next_text(latest) == latest.snapshot_text()
+
+        # Stale frames are ignored and late joiners start from the latest frame
+        broadcast.deliver(first)
+        assert broadcast.latest is latest
+        late = broadcast.subscribe()
+        assert (await late.next_frame()) is latest
+
+    asyncio.run(scenario())
+
+
+def test_spectator_websocket_follows_a_running_game():
+    """
+    A viewer joins a running game by spectate ID and follows it with snapshots and patches.
+
+    Runs against a real server: the test client gives every websocket its own event
+    loop, while player and spectator connections share one in production.
+    """
+    import json
+
+    import httpx
+    import websockets
+
+    from load_test import local_server
+
+    async def scenario(base_url):
+        ws_url = base_url.replace("http", "ws", 1)
+        async with websockets.connect(ws_url + "/ws/spectate/unknown") as viewer:
+            assert "error" in json.loads(await viewer.recv())
+
+        async with websockets.connect(ws_url + "/ws") as player:
+            session_message = json.loads(await player.recv())
+            assert session_message["spectate_id"] == spectate_id_for(session_message["token"])
+            await player.recv()
+
+            async with websockets.connect(f"{ws_url}/ws/spectate/{session_message['spectate_id']}") as viewer:
+                snapshot = json.loads(await viewer.recv())
+                assert snapshot["type"] == "snapshot"
+                state = snapshot["state"]
+                assert state["spectating"] is True
+                assert all(player_state["mandate_id"] is None for player_state in state["players"])
+
+                await player.send(json.dumps({"action_type": "ActionPassTurn"}))
+                await player.recv()
+                update = json.loads(await asyncio.wait_for(viewer.recv(), 10))
+                assert update["type"] == "patch" and update["base"] == snapshot["seq"]
+                state = apply_patch(state, update["ops"])
+                assert "valid_actions" not in state and "awaiting_acknowledgement" not in state
+
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            metrics = (await client.get("/metrics")).text
+        assert "# TYPE election_spectators gauge" in metrics
+        assert 'election_state_serialization_seconds_count{message_type="spectator"}' in metrics
+
+    with local_server() as base_url:
+        asyncio.run(asyncio.wait_for(scenario(base_url), 60))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for delta-encoded websocket state updates.
+"""
+
+import copy
+import json
+import random
+
+from fastapi.testclient import TestClient
+
+from game_session import GameSession
+from server import app
+from state_delta import StateStream, apply_patch, diff, plain_copy
+
+
+def test_diff_round_trips_nested_changes():
+    old = {"a": 1, "gone": True, "log": ["x", "y"], "players": [{"pc": 5, "favors": []}], "m": {"k/1": 1}}
+    new = {"a": 2, "log": ["x", "y", "z", "w"], "players": [{"pc": 7, "favors": ["f"]}],
+           "m": {"k/1": 2}, "new": {"n": None}}
+    ops = diff(old, new)
+    assert apply_patch(copy.deepcopy(old), ops) == new
+    assert {"op": "add", "path": "/log/-", "value": "z"} in ops
+    assert {"op": "replace", "path": "/m/k~11", "value": 2} in ops
+
+    assert apply_patch(copy.deepcopy(new), diff(new, old)) == old
+    assert diff(old, copy.deepcopy(old)) == []
+    assert apply_patch([1, 2], diff([1, 2], {"x": 1})) == {"x": 1}
+
+
+def test_stream_tracks_a_real_game_and_shrinks_messages():
+    random.seed(5)
+    session = GameSession()
+    session.start_game()
+    stream = StateStream()
+    client = None
+    full_bytes = patch_bytes = 0
+    for turn in range(20):
+        state = session.get_state_for_client()
+        message = json.loads(stream.encode_text(state))
+        assert message["seq"] == turn + 1
+        if message["type"] == "snapshot":
+            client = message["state"]
+        else:
+            assert message["base"] == turn
+            client = apply_patch(client, message["ops"])
+            full_bytes += len(json.dumps(state))
+            patch_bytes += len(json.dumps(message))
+        assert client == plain_copy(state)
+        if session.is_human_turn():
+            session.process_human_action({"action_type": "ActionPassTurn"})
+        else:
+            session.process_ai_turn()
+    # New log lines are most of what remains; everything else is a handful of small ops
+    assert patch_bytes * 2 < full_bytes
+
+    resync = stream.resync()
+    assert resync["type"] == "snapshot" and resync["seq"] == 21
+    assert resync["state"] == client
+
+
+def test_websocket_sends_patches_and_answers_resync():
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        assert websocket.receive_json()["type"] == "session"
+        first = websocket.receive_json()
+        assert first["type"] == "snapshot" and first["seq"] == 1
+        client = first["state"]
+
+        websocket.send_json({"action_type": "ActionPassTurn"})
+        update = websocket.receive_json()
+        assert update["type"] == "patch" and update["base"] == 1
+        client = apply_patch(client, update["ops"])
+        assert client["current_player_index"] != 0 or client["round_marker"] > 1
+
+        websocket.send_json({"action_type": "Resync"})
+        # AI turns may already be waiting; the resync snapshot follows them
+        message = websocket.receive_json()
+        while message["type"] == "patch":
+            client = apply_patch(client, message["ops"])
+            message = websocket.receive_json()
+        assert message["type"] == "snapshot"
+        assert message["state"] == client
+
+
+def test_batch_frames_replay_every_ai_move():
+    random.seed(6)
+    session = GameSession()
+    session.start_game()
+    stream = StateStream()
+    client = stream.encode(session.get_state_for_client())["state"]
+    session.process_human_action({"action_type": "ActionPassTurn"})
+    client = apply_patch(client, stream.encode(session.get_state_for_client())["ops"])
+
+    moves = session.run_ai_turns()
+    assert moves and session.is_human_turn()
+    assert all(move["player_id"] != session.human_player_id and move["action"]["action_type"]
+               for move, _ in moves)
+    message = json.loads(stream.encode_batch_text(moves))
+    assert message["type"] == "batch" and message["base"] == 2 and message["seq"] == 3
+    for frame, (move, state) in zip(message["frames"], moves):
+        assert frame["hint"] == move
+        client = apply_patch(client, frame["ops"])
+        assert client == plain_copy(state)
+
+    assert json.loads(StateStream().encode_batch_text(moves[:1]))["frames"][0]["ops"][0]["path"] == ""
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the fast client state serialization path.
+"""
+
+import json
+import random
+from dataclasses import asdict
+
+import state_serializer
+from benchmark_serialization import legacy_message, run_benchmark, sample_mid_game_states
+from engine.actions import ActionProposeTrade, ActionUseFavor
+from game_session import GameSession
+from state_serializer import ENCODERS, NORMALIZERS, plain_copy
+
+
+def _mid_game_session():
+    random.seed(4)
+    session = GameSession()
+    session.start_game()
+    for _ in range(12):
+        if session.is_human_turn():
+            session.process_human_action({"action_type": "ActionFundraise"})
+        else:
+            session.process_ai_turn()
+    return session
+
+
+def test_action_to_dict_matches_asdict():
+    session = _mid_game_session()
+    actions = session.engine.get_valid_actions(session.state, session.state.current_player_index)
+    actions += [ActionProposeTrade(player_id=1, target_player_id=2, legislation_id="TAX_CODE",
+                                   offered_favor_ids=["MEDIA_SPIN"]),
+                ActionUseFavor(player_id=0, favor_id="MEDIA_SPIN")]
+    for action in actions:
+        data = action.to_dict()
+        assert data == dict(asdict(action), action_type=action.__class__.__name__)
+    trade = actions[-2].to_dict()
+    trade['offered_favor_ids'].append("PEEK_EVENT")
+    assert actions[-2].offered_favor_ids == ["MEDIA_SPIN"]
+
+
+def test_every_backend_encodes_and_normalizes_alike():
+    session = _mid_game_session()
+    state = session.get_state_for_client()
+    state['action_points'] = dict(session.state.action_points)
+    expected = json.loads(json.dumps(state))
+    assert plain_copy(state) == expected
+    for name, encode in ENCODERS.items():
+        assert json.loads(encode(state)) == expected, name
+        assert NORMALIZERS[name](state) == expected, name
+    assert state_serializer.BACKEND in ENCODERS
+
+
+def test_benchmark_runs_on_sampled_states():
+    states = sample_mid_game_states(games=1, seed=2, every=10)
+    assert states and all(state.current_phase == "ACTION_PHASE" for state in states)
+    results = run_benchmark(states[:3], repeat=2)
+    assert set(results) == {'legacy'} | {f'{kind}/{name}' for kind in ('snapshot', 'delta') for name in ENCODERS}
+    for name in ENCODERS:
+        assert results[f'snapshot/{name}']['bytes'] < results['legacy']['bytes']
+
+    session = GameSession()
+    session.state = states[0]
+    assert len(json.loads(legacy_message(session))['legislation_options']) == 5
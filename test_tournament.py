@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the round-robin persona tournament.
+"""
+
+import json
+import os
+import tempfile
+
+from tournament import (
+    EloRatings, Tournament, add_range, generate_matchups, matchup_key, missing_ranges, plan_chunks, play_chunk
+)
+
+
+def test_matchups_cover_every_seat_rotation():
+    pool = ['random', 'economic', 'legislative', 'balanced', 'heuristic']
+    matchups = generate_matchups(pool)
+    # C(5,2)*2 + C(5,3)*3 + C(5,4)*4
+    assert len(matchups) == 70
+    assert len(set(matchups)) == 70
+    assert ('economic', 'random') in generate_matchups(['random', 'economic'])
+    assert ('random', 'economic') in generate_matchups(['random', 'economic'])
+
+
+def test_chunks_are_balanced_and_complete():
+    remaining = {('a', 'b'): [(0, 40)], ('a', 'b', 'c', 'd'): [(5, 15)]}
+    chunks = plan_chunks(remaining, workers=2)
+    played = {}
+    for matchup, first, count in chunks:
+        played.setdefault(matchup, []).extend(range(first, first + count))
+    assert sorted(played[('a', 'b')]) == list(range(0, 40))
+    assert sorted(played[('a', 'b', 'c', 'd')]) == list(range(5, 20))
+
+    costs = [len(matchup) * count for matchup, _, count in chunks]
+    assert costs == sorted(costs, reverse=True)
+    assert max(costs) <= 2 * min(costs) + 4
+
+
+def test_elo_is_zero_sum_and_rewards_winner():
+    ratings = EloRatings()
+    ratings.record_game(('a', 'b', 'c'), [10, 4, 4])
+    assert ratings.rating('a') > 1500 > ratings.rating('b')
+    assert ratings.rating('b') == ratings.rating('c')
+    assert abs(sum(ratings.ratings.values()) - 4500) < 1e-9
+
+
+def test_chunks_are_reproducible():
+    assert play_chunk(('random', 'economic'), 0, 2, seed=7) == play_chunk(('random', 'economic'), 0, 2, seed=7)
+
+
+def test_checkpoint_lets_new_personas_join():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        checkpoint = os.path.join(temp_dir, 'ratings.json')
+
+        first = Tournament(['random', 'economic'], games_per_matchup=1, checkpoint_path=checkpoint)
+        first.run()
+        saved = json.load(open(checkpoint))
+        assert saved['completed'] == {'random,economic': [[0, 1]], 'economic,random': [[0, 1]]}
+
+        second = Tournament(['random', 'economic', 'balanced'], games_per_matchup=1, checkpoint_path=checkpoint)
+        remaining = second.remaining_games()
+        assert all('balanced' in matchup for matchup in remaining)
+        assert len(remaining) == 7
+
+        standings = second.run()
+        assert {entry['persona'] for entry in standings} == {'random', 'economic', 'balanced'}
+        assert Tournament(['random'], checkpoint_path=checkpoint).games_completed() == 9
+
+
+def test_completed_ranges_merge_and_leave_gaps():
+    ranges = add_range([], 10, 20)
+    assert missing_ranges(ranges, 30) == [(0, 10), (20, 10)]
+    ranges = add_range(ranges, 0, 10)
+    assert ranges == [[0, 20]]
+    assert missing_ranges(ranges, 20) == []
+
+
+def test_resume_after_out_of_order_chunk_plays_only_the_gap():
+    """
+    A later chunk recorded before an earlier one must not shift the games left to play.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        checkpoint = os.path.join(temp_dir, 'ratings.json')
+        first = Tournament(['random', 'economic'], games_per_matchup=4, checkpoint_path=checkpoint)
+        matchup = first.matchups[0]
+        first._record_chunk(matchup, 2, [[5, 3], [4, 6]])
+
+        resumed = Tournament(['random', 'economic'], games_per_matchup=4, checkpoint_path=checkpoint)
+        assert resumed.remaining_games()[matchup] == [(0, 2)]
+        assert resumed.completed[matchup_key(matchup)] == [[2, 4]]
+        planned = [index for chunk_matchup, first, count in plan_chunks(resumed.remaining_games(), 2)
+                   if chunk_matchup == matchup for index in range(first, first + count)]
+        assert sorted(planned) == [0, 1]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the transposition table used by search personas.
+"""
+
+import random
+import threading
+
+from simulation_harness import SimulationHarness
+from engine.search_state import SearchState
+from personas import MCTSPersona
+from personas.transposition_table import TranspositionTable
+
+
+def test_lru_evicts_least_recently_used():
+    table = TranspositionTable(capacity=2, policy='lru')
+    first = table.store('a', 2, 0)
+    table.store('b', 2, 1)
+    assert table.lookup('a') is first
+    table.store('c', 2, 1)
+    assert table.lookup('b') is None
+    assert table.lookup('a') is first
+    assert len(table) == 2
+    stats = table.stats()
+    assert stats['evictions'] == 1
+    assert stats['hits'] == 2 and stats['lookups'] == 3
+
+
+def test_depth_preferred_keeps_shallow_entries_within_a_search():
+    table = TranspositionTable(capacity=1, policy='depth')
+    shallow = table.store('a', 2, 1)
+    deep = table.store('b', 2, 5)
+    assert table.lookup('a') is shallow
+    assert table.lookup('b') is None
+    assert table.stats()['rejections'] == 1
+
+    # Entries from an earlier search may be replaced by anything
+    table.new_search()
+    table.store('b', 2, 5)
+    assert table.lookup('a') is None
+    assert deep.visits == 0
+
+
+def test_entry_value_and_best_action():
+    table = TranspositionTable()
+    entry = table.get_or_store('x', 2, 0)
+    assert entry.value() == [] and entry.best_action() is None
+    entry.visits = 4
+    entry.reward_sums = [2.0, 1.0]
+    entry.edges = {('PASS',): [1, 3, [0.5, 0.5], None], ('FUNDRAISE',): [3, 3, [1.5, 0.5], None]}
+    assert entry.value() == [0.5, 0.25]
+    assert entry.best_action() == ('FUNDRAISE',)
+
+
+def test_commuting_actions_reach_the_same_key():
+    harness = SimulationHarness()
+    random.seed(4)
+    state = harness.engine.run_event_phase(harness.engine.start_new_game(['A', 'B', 'C']))
+    root = SearchState.from_game_state(state, random.Random(0))
+
+    first = root.clone()
+    first.rng = random.Random(5)
+    first.apply(('FUNDRAISE',))
+    first.apply(('NETWORK',))
+    second = root.clone()
+    second.rng = random.Random(5)
+    second.apply(('NETWORK',))
+    second.apply(('FUNDRAISE',))
+    assert first.key(0) == second.key(0)
+
+    third = root.clone()
+    third.apply(('FUNDRAISE',))
+    third.apply(('PASS',))
+    assert first.key(0) != third.key(0)
+
+    # Hidden information does not change the key
+    second.determinize(0)
+    assert first.key(0) == second.key(0)
+
+
+def test_shared_table_is_reused_across_decisions_and_threads():
+    harness = SimulationHarness()
+    random.seed(9)
+    state = harness.engine.run_event_phase(harness.engine.start_new_game(['A', 'B', 'C', 'D']))
+    valid = harness.engine.get_valid_actions(state, state.get_current_player().id)
+    table = TranspositionTable(capacity=5000, thread_safe=True)
+
+    personas = [MCTSPersona(f"MCTS {i}", random_seed=i, iterations=80, transposition_table=table)
+                for i in range(3)]
+    chosen = []
+    threads = [threading.Thread(target=lambda p=p: chosen.append(p.choose_action(state, valid)))
+               for p in personas]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(chosen) == 3 and all(action in valid for action in chosen)
+    assert 0 < len(table) <= 5000
+    root = table.lookup(SearchState.from_game_state(state).key(0))
+    assert root is not None and root.visits == 240
+    assert table.hit_rate > 0.5
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the weighted persona and the cross-entropy weight tuner.
+"""
+
+import os
+import random
+import tempfile
+
+import yaml
+
+from simulation_harness import SimulationHarness
+from engine.actions import ActionFundraise, ActionNetwork, ActionPassTurn, ActionSupportLegislation
+from personas import WeightedPersona
+from personas.weighted_persona import DEFAULT_WEIGHTS
+from weight_tuner import CrossEntropyTuner, PARAMETER_SPACE, evaluate_weights, game_seeds, save_results
+
+
+def _decision_point(seed=0):
+    harness = SimulationHarness()
+    random.seed(seed)
+    state = harness.engine.run_event_phase(harness.engine.start_new_game(['A', 'B']))
+    return state, harness.engine.get_valid_actions(state, state.get_current_player().id)
+
+
+def test_reads_the_ai_config_block():
+    persona = WeightedPersona("W")
+    assert set(persona.weights) == set(DEFAULT_WEIGHTS)
+    assert persona.weights['max_pc_commitment_ratio'] == 0.8
+    assert WeightedPersona("W", weights={'network_weight': 3.0}).weights['network_weight'] == 3.0
+
+
+def test_weights_and_limits_shape_the_choice():
+    state, valid = _decision_point()
+    only_network = {name: 0.0 for name in DEFAULT_WEIGHTS if name.endswith('_weight')}
+    only_network['network_weight'] = 1.0
+    persona = WeightedPersona("W", random_seed=1, weights=only_network)
+    assert all(isinstance(persona.choose_action(state, valid), ActionNetwork) for _ in range(10))
+
+    nothing = {name: 0.0 for name in DEFAULT_WEIGHTS if name.endswith('_weight')}
+    assert isinstance(WeightedPersona("W", weights=nothing).choose_action(state, valid), ActionPassTurn)
+
+    player = state.get_current_player()
+    player.pc = 20
+    bets = [ActionSupportLegislation(player_id=player.id, legislation_id="X", support_amount=a) for a in (1, 5, 10)]
+    cautious = WeightedPersona("W", random_seed=2, weights={'max_pc_commitment_ratio': 0.3, 'min_pc_reserve': 0,
+                                                            'aggressive_threshold': 1.0})
+    assert cautious.choose_action(state, bets + [ActionFundraise(player_id=player.id)]) in \
+        [bets[1], ActionFundraise(player_id=player.id)]
+
+
+def test_evaluation_uses_common_random_numbers():
+    seeds = game_seeds(7, 0, 4)
+    assert seeds == game_seeds(7, 0, 4) and seeds != game_seeds(7, 1, 4)
+    first = evaluate_weights(dict(DEFAULT_WEIGHTS), ['random'], seeds)
+    assert first == evaluate_weights(dict(DEFAULT_WEIGHTS), ['random'], seeds)
+    assert 0.0 <= first <= 1.0
+
+
+def test_tuner_runs_and_saves_configs():
+    tuner = CrossEntropyTuner(opponents=['random'], population=4, generations=2,
+                              games_per_candidate=2, validation_games=2, seed=3)
+    results = tuner.run(top=2)
+    assert len(results) == 2 and len(tuner.history) == 2
+    assert results[0]['win_rate'] >= results[1]['win_rate']
+    for name, (low, high) in PARAMETER_SPACE.items():
+        assert low <= results[0]['weights'][name] <= high
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tuned.yaml')
+        save_results(results, path, ['random'])
+        with open(path) as file:
+            saved = yaml.safe_load(file)
+    assert saved['opponents'] == ['random']
+    assert WeightedPersona("W", weights=saved['configs'][0]['ai']).weights == \
+        dict(DEFAULT_WEIGHTS, **results[0]['weights'])
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Round-Robin Tournament Runner for Election Game Personas
+
+Instead of hand-writing every matchup in simulation_config.yaml, a tournament
+takes a pool of persona types and plays every 2-4 player combination in
+every seat rotation. Games are spread over a process pool in chunks of
+similar cost, and Elo-style ratings are updated incrementally as results
+stream back, in the order the chunks were planned so that standings do
+not depend on worker timing. Ratings and the game ranges completed per
+matchup are checkpointed to JSON, so an interrupted run resumes without
+replaying games and a later run with additional personas only plays the
+new matchups.
+"""
+
+import itertools
+import json
+import os
+import random
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from simulation_harness import SimulationHarness
+from simulation_runner import PERSONA_TYPES
+
+
+Matchup = Tuple[str, ...]
+
+DEFAULT_RATING = 1500.0
+CHECKPOINT_VERSION = 2
+
+
+def generate_matchups(pool: Sequence[str], min_players: int = 2, max_players: int = 4) -> List[Matchup]:
+    """
+    Generate every seat-rotated combination of personas from a pool.
+
+    Args:
+        pool: Persona type names (keys of PERSONA_TYPES)
+        min_players: Smallest table size
+        max_players: Largest table size
+
+    Returns:
+        List of matchups; each is a tuple of persona types in seat order
+    """
+    matchups = []
+    for size in range(min_players, min(max_players, len(pool)) + 1):
+        for combination in itertools.combinations(pool, size):
+            for shift in range(size):
+                matchups.append(combination[shift:] + combination[:shift])
+    return matchups
+
+
+def matchup_key(matchup: Matchup) -> str:
+    """Stable string key for a matchup, used in checkpoints."""
+    return ",".join(matchup)
+
+
+def add_range(ranges: List[List[int]], start: int, end: int) -> List[List[int]]:
+    """
+    Add the game indices [start, end) to a list of completed ranges.
+
+    Args:
+        ranges: Sorted, non-overlapping [start, end) ranges
+        start: First game index
+        end: One past the last game index
+
+    Returns:
+        List[List[int]]: The merged ranges, sorted
+    """
+    merged = []
+    for first, last in sorted(ranges + [[start, end]]):
+        if merged and first <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    return merged
+
+
+def missing_ranges(ranges: List[List[int]], total: int) -> List[Tuple[int, int]]:
+    """
+    The gaps in completed ranges, as (start index, number of games).
+
+    Args:
+        ranges: Sorted, non-overlapping completed [start, end) ranges
+        total: Games the matchup should have
+
+    Returns:
+        List[Tuple[int, int]]: Games still to play
+    """
+    gaps = []
+    position = 0
+    for first, last in ranges:
+        if first > position:
+            gaps.append((position, min(first, total) - position))
+        position = max(position, last)
+        if position >= total:
+            break
+    if position < total:
+        gaps.append((position, total - position))
+    return [gap for gap in gaps if gap[1] > 0]
+
+
+def plan_chunks(remaining: Dict[Matchup, List[Tuple[int, int]]], workers: int, chunks_per_worker: int = 4) -> List[Tuple[Matchup, int, int]]:
+    """
+    Split the remaining games into work units of similar cost.
+
+    The cost of a game is estimated as its number of seats. Chunks are
+    returned largest first, so a pool that takes tasks in submission order
+    schedules them longest-processing-time first.
+
+    Args:
+        remaining: Mapping of matchup to the (start index, games) ranges still to play
+        workers: Number of worker processes (0 or 1 for in-process play)
+        chunks_per_worker: Target number of chunks per worker
+
+    Returns:
+        List of (matchup, first game index, number of games) work units
+    """
+    total_cost = sum(len(matchup) * games for matchup, gaps in remaining.items() for _, games in gaps)
+    if total_cost == 0:
+        return []
+    target_cost = max(1, total_cost // (max(1, workers) * chunks_per_worker))
+
+    chunks = []
+    for matchup, gaps in remaining.items():
+        games_per_chunk = max(1, target_cost // len(matchup))
+        for start, games in gaps:
+            for offset in range(0, games, games_per_chunk):
+                chunks.append((matchup, start + offset, min(games_per_chunk, games - offset)))
+
+    chunks.sort(key=lambda chunk: len(chunk[0]) * chunk[2], reverse=True)
+    return chunks
+
+
+def play_chunk(matchup: Matchup, first_game: int, num_games: int,
+               max_rounds: int = 100, seed: int = 42) -> List[List[int]]:
+    """
+    Play a block of games for one matchup.
+
+    This is a module-level function so it can run in a worker process. Each
+    chunk seeds the global random module (used by the engine) from the
+    matchup and game index, so results do not depend on scheduling.
+
+    Args:
+        matchup: Persona types in seat order
+        first_game: Index of the first game within the matchup
+        num_games: Number of games to play
+        max_rounds: Maximum loop iterations per game
+        seed: Base seed of the tournament
+
+    Returns:
+        One list of final influence totals (in seat order) per game
+    """
+    chunk_seed = zlib.crc32(f"{seed}:{matchup_key(matchup)}:{first_game}".encode())
+    random.seed(chunk_seed)
+
+    names = [f"{persona.title()} Bot {seat}" for seat, persona in enumerate(matchup)]
+    agents = [PERSONA_TYPES[persona](name=name, random_seed=chunk_seed + seat)
+              for seat, (persona, name) in enumerate(zip(matchup, names))]
+    harness = SimulationHarness()
+
+    # The chunk's games run side by side, so each seat's persona decides them in batches
+    outcomes = []
+    for result in harness.run_lockstep_simulations(agents, num_games, names, max_rounds):
+        scores = result.final_scores
+        outcomes.append([
+            scores.get(seat, {}).get('total_influence', 0) for seat in range(len(matchup))
+        ])
+    return outcomes
+
+
+class EloRatings:
+    """
+    Multiplayer Elo ratings updated one game at a time.
+
+    A game with n players is scored as every pairwise comparison of final
+    influence (win, tie or loss), with the K-factor split over the n - 1
+    opponents so that table size does not change how fast ratings move.
+    """
+
+    def __init__(self, k_factor: float = 24.0):
+        """
+        Initialize empty ratings.
+
+        Args:
+            k_factor: Maximum rating change per game
+        """
+        self.k_factor = k_factor
+        self.ratings: Dict[str, float] = {}
+        self.games: Dict[str, int] = {}
+        self.wins: Dict[str, int] = {}
+
+    def rating(self, persona: str) -> float:
+        """Current rating of a persona (DEFAULT_RATING if it has not played)."""
+        return self.ratings.get(persona, DEFAULT_RATING)
+
+    def record_game(self, matchup: Matchup, influences: List[int]) -> None:
+        """
+        Update ratings from one finished game.
+
+        Args:
+            matchup: Persona types in seat order
+            influences: Final influence totals in seat order
+        """
+        players = len(matchup)
+        before = [self.rating(persona) for persona in matchup]
+        deltas = [0.0] * players
+        k = self.k_factor / (players - 1)
+
+        for i, j in itertools.combinations(range(players), 2):
+            expected_i = 1.0 / (1.0 + 10 ** ((before[j] - before[i]) / 400.0))
+            if influences[i] > influences[j]:
+                actual_i = 1.0
+            elif influences[i] < influences[j]:
+                actual_i = 0.0
+            else:
+                actual_i = 0.5
+            deltas[i] += k * (actual_i - expected_i)
+            deltas[j] -= k * (actual_i - expected_i)
+
+        # A shared first place counts as a win for every tied player
+        best = max(influences)
+        for seat, persona in enumerate(matchup):
+            self.ratings[persona] = before[seat] + deltas[seat]
+            self.games[persona] = self.games.get(persona, 0) + 1
+            if influences[seat] == best:
+                self.wins[persona] = self.wins.get(persona, 0) + 1
+
+    def standings(self) -> List[Dict[str, Any]]:
+        """Return personas sorted by rating, highest first."""
+        return [
+            {
+                'persona': persona,
+                'rating': self.ratings[persona],
+                'games': self.games.get(persona, 0),
+                'wins': self.wins.get(persona, 0)
+            }
+            for persona in sorted(self.ratings, key=self.ratings.get, reverse=True)
+        ]
+
+
+class Tournament:
+    """
+    Round-robin tournament over a pool of personas with checkpointed ratings.
+    """
+
+    def __init__(self,
+                 pool: Sequence[str],
+                 games_per_matchup: int = 10,
+                 min_players: int = 2,
+                 max_players: int = 4,
+                 workers: int = 0,
+                 max_rounds: int = 100,
+                 seed: int = 42,
+                 k_factor: float = 24.0,
+                 checkpoint_path: Optional[str] = None):
+        """
+        Initialize the tournament.
+
+        Args:
+            pool: Persona types to enter (keys of PERSONA_TYPES)
+            games_per_matchup: Games played for each seat-rotated matchup
+            min_players: Smallest table size
+            max_players: Largest table size
+            workers: Worker processes (0 plays every game in this process)
+            max_rounds: Maximum loop iterations per game
+            seed: Base seed for reproducible games
+            k_factor: Elo K-factor
+            checkpoint_path: JSON file to resume from and save progress to
+        """
+        unknown = [persona for persona in pool if persona not in PERSONA_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown persona types: {unknown}. Available: {sorted(PERSONA_TYPES)}")
+
+        self.pool = list(pool)
+        self.games_per_matchup = games_per_matchup
+        self.matchups = generate_matchups(self.pool, min_players, max_players)
+        self.workers = workers
+        self.max_rounds = max_rounds
+        self.seed = seed
+        self.checkpoint_path = checkpoint_path
+
+        self.ratings = EloRatings(k_factor)
+        self.completed: Dict[str, List[List[int]]] = {}  # matchup key -> completed [start, end) game ranges
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self._load_checkpoint()
+
+    def _load_checkpoint(self) -> None:
+        """Restore ratings and matchup progress from the checkpoint file."""
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not read tournament checkpoint {self.checkpoint_path}: {e}")
+            return
+        if data.get('version') != CHECKPOINT_VERSION:
+            print(f"Ignoring tournament checkpoint with version {data.get('version')}")
+            return
+
+        for entry in data['ratings']:
+            persona = entry['persona']
+            self.ratings.ratings[persona] = entry['rating']
+            self.ratings.games[persona] = entry['games']
+            self.ratings.wins[persona] = entry['wins']
+        self.completed = {key: [list(game_range) for game_range in ranges]
+                          for key, ranges in data['completed'].items()}
+        print(f"Resumed tournament from {self.checkpoint_path} "
+              f"({self.games_completed()} games already played)")
+
+    def save_checkpoint(self) -> None:
+        """Write ratings and matchup progress to the checkpoint file."""
+        if not self.checkpoint_path:
+            return
+        data = {
+            'version': CHECKPOINT_VERSION,
+            'k_factor': self.ratings.k_factor,
+            'ratings': self.ratings.standings(),
+            'completed': self.completed
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def games_completed(self) -> int:
+        """Number of games recorded so far, over all matchups."""
+        return sum(last - first for ranges in self.completed.values() for first, last in ranges)
+
+    def remaining_games(self) -> Dict[Matchup, List[Tuple[int, int]]]:
+        """Return the (start index, games) ranges still to play for every matchup that is not finished."""
+        remaining = {}
+        for matchup in self.matchups:
+            gaps = missing_ranges(self.completed.get(matchup_key(matchup), []), self.games_per_matchup)
+            if gaps:
+                remaining[matchup] = gaps
+        return remaining
+
+    def _record_chunk(self, matchup: Matchup, first_game: int, outcomes: List[List[int]]) -> None:
+        for influences in outcomes:
+            self.ratings.record_game(matchup, influences)
+        key = matchup_key(matchup)
+        self.completed[key] = add_range(self.completed.get(key, []), first_game, first_game + len(outcomes))
+        self.save_checkpoint()
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Play every outstanding game and return the final standings.
+
+        Returns:
+            List of standings entries sorted by rating
+        """
+        chunks = plan_chunks(self.remaining_games(), self.workers)
+        total_games = sum(num_games for _, _, num_games in chunks)
+        print(f"Tournament: {len(self.pool)} personas, {len(self.matchups)} matchups, "
+              f"{total_games} games in {len(chunks)} chunks")
+
+        start_time = time.time()
+        games_done = 0
+        if self.workers <= 1:
+            for matchup, first_game, num_games in chunks:
+                outcomes = play_chunk(matchup, first_game, num_games, self.max_rounds, self.seed)
+                self._record_chunk(matchup, first_game, outcomes)
+                games_done += num_games
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(play_chunk, matchup, first_game, num_games, self.max_rounds, self.seed): index
+                    for index, (matchup, first_game, num_games) in enumerate(chunks)
+                }
+                # Results are held back until every earlier chunk is in, so ratings are
+                # updated in plan order whichever worker finishes first
+                finished: Dict[int, List[List[int]]] = {}
+                next_chunk = 0
+                for future in as_completed(futures):
+                    finished[futures[future]] = future.result()
+                    while next_chunk in finished:
+                        matchup, first_game, _ = chunks[next_chunk]
+                        outcomes = finished.pop(next_chunk)
+                        self._record_chunk(matchup, first_game, outcomes)
+                        games_done += len(outcomes)
+                        next_chunk += 1
+                    elapsed = time.time() - start_time
+                    print(f"  Completed {games_done}/{total_games} games ({games_done / elapsed:.1f} games/sec)")
+
+        return self.ratings.standings()
+
+
+def main():
+    """Main entry point for the tournament runner."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a round-robin persona tournament')
+    parser.add_argument('--pool', nargs='+', default=sorted(PERSONA_TYPES),
+                        help='Persona types to enter')
+    parser.add_argument('--games-per-matchup', type=int, default=10,
+                        help='Games per seat-rotated matchup')
+    parser.add_argument('--min-players', type=int, default=2)
+    parser.add_argument('--max-players', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (0 = run in this process)')
+    parser.add_argument('--max-rounds', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--checkpoint', default='tournament_ratings.json',
+                        help='Ratings checkpoint to resume from and update')
+
+    args = parser.parse_args()
+
+    tournament = Tournament(
+        args.pool, args.games_per_matchup, args.min_players, args.max_players,
+        args.workers, args.max_rounds, args.seed, checkpoint_path=args.checkpoint
+    )
+    standings = tournament.run()
+
+    print("\nStandings")
+    print("-" * 50)
+    for rank, entry in enumerate(standings, 1):
+        win_rate = entry['wins'] / entry['games'] if entry['games'] else 0.0
+        print(f"{rank:2d}. {entry['persona']:<12} {entry['rating']:7.1f}  "
+              f"{entry['games']:5d} games  {win_rate:.1%} wins")
+
+
+if __name__ == "__main__":
+    main()
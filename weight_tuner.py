@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Cross-Entropy Tuning of WeightedPersona Parameters
+
+Searches the parameters of the `ai` block in game_config.yaml for the
+strongest WeightedPersona. Every generation samples a population of weight
+vectors from independent (clipped) Gaussians, plays each against a set of
+opponent personas, and refits the Gaussians to the elite fraction.
+
+All candidates of a generation play the same game seeds (common random
+numbers), so differences in win rate come from the weights rather than the
+deal of the cards. Candidates are evaluated in parallel over a process pool.
+The best configurations are re-played on fresh seeds before they are
+reported, so the reported win rates are not inflated by selection.
+"""
+
+import math
+import os
+import random
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+import yaml
+
+from simulation_harness import SimulationHarness, SilentLogger
+from simulation_runner import PERSONA_TYPES
+from personas.weighted_persona import WeightedPersona, DEFAULT_WEIGHTS
+
+
+# Search range of each tuned parameter
+PARAMETER_SPACE: Dict[str, Tuple[float, float]] = {
+    'fundraise_weight': (0.0, 5.0),
+    'network_weight': (0.0, 5.0),
+    'sponsor_legislation_weight': (0.0, 5.0),
+    'declare_candidacy_weight': (0.0, 5.0),
+    'use_favor_weight': (0.0, 5.0),
+    'support_legislation_weight': (0.0, 5.0),
+    'oppose_legislation_weight': (0.0, 5.0),
+    'conservative_threshold': (0.0, 1.0),
+    'aggressive_threshold': (0.0, 1.0),
+    'min_pc_reserve': (0.0, 20.0),
+    'max_pc_commitment_ratio': (0.05, 1.0),
+}
+
+
+def game_seeds(seed: int, generation: int, num_games: int) -> List[int]:
+    """Seeds shared by every candidate of one generation."""
+    return [zlib.crc32(f"{seed}:{generation}:{game}".encode()) for game in range(num_games)]
+
+
+def evaluate_weights(weights: Dict[str, float], opponents: Sequence[str], seeds: Sequence[int],
+                     max_rounds: int = 100) -> float:
+    """
+    Win rate of a WeightedPersona over a fixed list of games.
+
+    This is a module-level function so it can run in a worker process. Game
+    i is played against opponents[i % len(opponents)] with the weighted
+    persona in seat i // len(opponents) % 2, so each opponent is met from
+    both seats. Each game seeds the engine and both personas from its seed.
+
+    Args:
+        weights: WeightedPersona parameters
+        opponents: Persona types (keys of PERSONA_TYPES) to play against
+        seeds: One seed per game
+        max_rounds: Maximum loop iterations per game
+
+    Returns:
+        Fraction of games the weighted persona won
+    """
+    harness = SimulationHarness()
+    wins = 0
+    for index, game_seed in enumerate(seeds):
+        opponent_type = opponents[index % len(opponents)]
+        seat = index // len(opponents) % 2
+        random.seed(game_seed)
+        tuned = WeightedPersona("Weighted Bot", random_seed=game_seed, weights=weights)
+        opponent = PERSONA_TYPES[opponent_type](name=f"{opponent_type.title()} Bot", random_seed=game_seed + 1)
+        agents = [tuned, opponent] if seat == 0 else [opponent, tuned]
+        result = harness.run_simulation(agents, [agent.name for agent in agents], max_rounds, SilentLogger())
+        if result.winner_id == seat:
+            wins += 1
+    return wins / len(seeds) if seeds else 0.0
+
+
+class CrossEntropyTuner:
+    """
+    Cross-entropy method over the WeightedPersona parameter space.
+    """
+
+    def __init__(self,
+                 opponents: Sequence[str] = ('heuristic', 'random'),
+                 population: int = 24,
+                 elite_fraction: float = 0.25,
+                 generations: int = 10,
+                 games_per_candidate: int = 40,
+                 validation_games: int = 200,
+                 smoothing: float = 0.7,
+                 workers: int = 0,
+                 max_rounds: int = 100,
+                 seed: int = 42):
+        """
+        Initialize the tuner.
+
+        Args:
+            opponents: Persona types to tune against (keys of PERSONA_TYPES)
+            population: Weight vectors sampled per generation
+            elite_fraction: Share of each generation used to refit the distribution
+            generations: Number of generations
+            games_per_candidate: Games played by each candidate per generation
+            validation_games: Fresh games re-played by the final top configurations
+            smoothing: Weight of the new fit when updating means and deviations
+            workers: Worker processes (0 evaluates in this process)
+            max_rounds: Maximum loop iterations per game
+            seed: Base seed for sampling and games
+        """
+        unknown = [persona for persona in opponents if persona not in PERSONA_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown persona types: {unknown}. Available: {sorted(PERSONA_TYPES)}")
+
+        self.opponents = list(opponents)
+        self.population = population
+        self.num_elite = max(1, int(round(population * elite_fraction)))
+        self.generations = generations
+        self.games_per_candidate = games_per_candidate
+        self.validation_games = validation_games
+        self.smoothing = smoothing
+        self.workers = workers
+        self.max_rounds = max_rounds
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Start centred on the configured defaults with a quarter of each range as deviation
+        self.means = {name: float(DEFAULT_WEIGHTS[name]) for name in PARAMETER_SPACE}
+        self.deviations = {name: (high - low) / 4 for name, (low, high) in PARAMETER_SPACE.items()}
+        self.history: List[Dict[str, Any]] = []
+        self.evaluated: List[Tuple[float, Dict[str, float]]] = []
+
+    def sample(self) -> Dict[str, float]:
+        """Draw one weight vector from the current distribution."""
+        weights = {}
+        for name, (low, high) in PARAMETER_SPACE.items():
+            value = self.rng.gauss(self.means[name], self.deviations[name])
+            weights[name] = round(min(high, max(low, value)), 4)
+        return weights
+
+    def _evaluate(self, candidates: List[Dict[str, float]], seeds: List[int], executor) -> List[float]:
+        if executor is None:
+            return [evaluate_weights(weights, self.opponents, seeds, self.max_rounds) for weights in candidates]
+        futures = [executor.submit(evaluate_weights, weights, self.opponents, seeds, self.max_rounds)
+                   for weights in candidates]
+        return [future.result() for future in futures]
+
+    def _refit(self, elite: List[Dict[str, float]]) -> None:
+        alpha = self.smoothing
+        for name, (low, high) in PARAMETER_SPACE.items():
+            values = [weights[name] for weights in elite]
+            mean = sum(values) / len(values)
+            deviation = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+            self.means[name] = alpha * mean + (1 - alpha) * self.means[name]
+            # Keep a little exploration so the distribution does not collapse early
+            floor = (high - low) / 100
+            self.deviations[name] = max(floor, alpha * deviation + (1 - alpha) * self.deviations[name])
+
+    def run(self, top: int = 3) -> List[Dict[str, Any]]:
+        """
+        Run every generation and validate the best configurations.
+
+        Args:
+            top: Number of configurations to validate and return
+
+        Returns:
+            List of {'weights', 'win_rate', 'search_win_rate'} entries, best first
+        """
+        start_time = time.time()
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            for generation in range(self.generations):
+                seeds = game_seeds(self.seed, generation, self.games_per_candidate)
+                candidates = [self.sample() for _ in range(self.population)]
+                if generation == 0:
+                    # The current configuration is always part of the first generation
+                    candidates[0] = {name: float(DEFAULT_WEIGHTS[name]) for name in PARAMETER_SPACE}
+                win_rates = self._evaluate(candidates, seeds, executor)
+
+                ranked = sorted(zip(win_rates, candidates), key=lambda pair: pair[0], reverse=True)
+                self.evaluated.extend(ranked)
+                self._refit([weights for _, weights in ranked[:self.num_elite]])
+                mean_rate = sum(win_rates) / len(win_rates)
+                self.history.append({'generation': generation, 'best_win_rate': ranked[0][0],
+                                     'mean_win_rate': mean_rate})
+                print(f"  Generation {generation + 1}/{self.generations}: best {ranked[0][0]:.1%}, "
+                      f"mean {mean_rate:.1%} ({time.time() - start_time:.0f}s)")
+
+            # Re-play the best candidates, plus the final mean, on seeds no generation used
+            finalists = sorted(self.evaluated, key=lambda pair: pair[0], reverse=True)[:top]
+            finalists.append((None, {name: round(value, 4) for name, value in self.means.items()}))
+            seeds = game_seeds(self.seed, -1, self.validation_games)
+            validated = self._evaluate([weights for _, weights in finalists], seeds, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        results = [{'weights': weights, 'win_rate': win_rate, 'search_win_rate': search_rate}
+                   for (search_rate, weights), win_rate in zip(finalists, validated)]
+        results.sort(key=lambda entry: entry['win_rate'], reverse=True)
+        return results[:top]
+
+
+def save_results(results: List[Dict[str, Any]], path: str, opponents: Sequence[str]) -> None:
+    """
+    Write tuned configurations as YAML `ai` blocks with their win rates.
+
+    Each entry's `ai` mapping can be pasted into game_config.yaml or passed
+    as WeightedPersona(weights=...).
+    """
+    document = {
+        'opponents': list(opponents),
+        'configs': [{'win_rate': round(entry['win_rate'], 4),
+                     'search_win_rate': None if entry['search_win_rate'] is None else round(entry['search_win_rate'], 4),
+                     'ai': entry['weights']} for entry in results]
+    }
+    with open(path, 'w') as file:
+        yaml.safe_dump(document, file, default_flow_style=False, sort_keys=False)
+
+
+def main():
+    """Main entry point for the weight tuner."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Tune WeightedPersona parameters with the cross-entropy method')
+    parser.add_argument('--opponents', nargs='+', default=['heuristic', 'random'],
+                        help='Persona types to tune against')
+    parser.add_argument('--population', type=int, default=24)
+    parser.add_argument('--elite-fraction', type=float, default=0.25)
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--games', type=int, default=40, help='Games per candidate per generation')
+    parser.add_argument('--validation-games', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (0 = run in this process)')
+    parser.add_argument('--max-rounds', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--top', type=int, default=3, help='Configurations to validate and save')
+    parser.add_argument('--output', default='tuned_ai_configs.yaml')
+
+    args = parser.parse_args()
+
+    tuner = CrossEntropyTuner(
+        args.opponents, args.population, args.elite_fraction, args.generations, args.games,
+        args.validation_games, workers=args.workers, max_rounds=args.max_rounds, seed=args.seed
+    )
+    print(f"Tuning against {', '.join(args.opponents)}: {args.generations} generations of "
+          f"{args.population} candidates, {args.games} games each")
+    results = tuner.run(args.top)
+    save_results(results, args.output, args.opponents)
+
+    print("\nTuned configurations")
+    print("-" * 50)
+    for rank, entry in enumerate(results, 1):
+        print(f"{rank}. {entry['win_rate']:.1%} wins on validation games")
+        for name, value in entry['weights'].items():
+            print(f"     {name}: {value}")
+    print(f"\nSaved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()